@@ -9,7 +9,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from app.core.shared_kernel.db.dependencies import get_async_db_session
+from app.api.helpers.user_helper import UserHelper
+from app.api.shared_dependencies import get_current_user_role
+from app.core.shared_kernel.db.dependencies import get_async_db_session, engine, replica_engines
+from app.core.shared_kernel.db.schemas.pool_stats_schema import EnginePoolStatsSchema
+from app.core.user.application.authentication.schemas.user_from_token_schema import UserFromTokenSchema
 
 healthcheck_router = APIRouter(tags=["Healthcheck"])
 
@@ -26,3 +30,19 @@ async def do_healthcheck(session: Annotated[AsyncSession, Depends(get_async_db_s
 
     await session.execute(select())
     return status.HTTP_200_OK
+
+
+@healthcheck_router.get("/healthcheck/db-pool", status_code=status.HTTP_200_OK)
+async def get_db_pool_stats(current_user_role: Annotated[UserFromTokenSchema, Depends(get_current_user_role)]) \
+        -> EnginePoolStatsSchema:
+    """
+    Получает состояние пулов соединений с основной базой данных и репликами:
+    занятость, переполнение и время ожидания соединения.
+    Доступно только администраторам.
+
+    :param current_user_role: Роль текущего пользователя.
+    :return: Состояние пулов соединений.
+    """
+    UserHelper.assert_is_admin(current_user_role)
+    return EnginePoolStatsSchema(primary=engine.pool.get_stats(),
+                                 replicas=[replica_engine.pool.get_stats() for replica_engine in replica_engines])
@@ -0,0 +1,52 @@
+"""
+Класс-помощник для условных HTTP-запросов и кэширования HttpCacheHelper.
+"""
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+
+
+class HttpCacheHelper:
+    """
+    Класс-помощник для условных HTTP-запросов и кэширования.
+    """
+    @staticmethod
+    def is_not_modified(request: Request, etag: str, last_modified: datetime = None) -> bool:
+        """
+        Проверяет, что у клиента актуальная версия ресурса, по заголовкам If-None-Match и If-Modified-Since.
+        If-Modified-Since учитывается только при отсутствии If-None-Match.
+        :param request: Запрос.
+        :param etag: ETag текущей версии ресурса.
+        :param last_modified: Время последнего изменения ресурса.
+        :return: True, если ресурс не изменился и можно ответить 304.
+        """
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            client_etags = {client_etag.strip().removeprefix('W/') for client_etag in if_none_match.split(',')}
+            return '*' in client_etags or etag.removeprefix('W/') in client_etags
+
+        if_modified_since = request.headers.get('if-modified-since')
+        if if_modified_since is None or last_modified is None:
+            return False
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if modified_since.tzinfo is None:
+            return False
+        return last_modified.replace(microsecond=0) <= modified_since
+
+    @staticmethod
+    def get_cache_headers(etag: str, last_modified: datetime = None, max_age: int = 0) -> dict[str, str]:
+        """
+        Получает заголовки для кэширования ресурса клиентом.
+        :param etag: ETag текущей версии ресурса.
+        :param last_modified: Время последнего изменения ресурса.
+        :param max_age: Время в секундах, в течение которого клиент может не перепроверять ресурс.
+        :return: Заголовки ETag, Last-Modified и Cache-Control.
+        """
+        headers = {'ETag': etag, 'Cache-Control': f'public, max-age={max_age}'}
+        if last_modified is not None:
+            headers['Last-Modified'] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+        return headers
@@ -0,0 +1,146 @@
+"""
+Класс-помощник для HTTP-запросов диапазонов байтов RangeHelper.
+"""
+import re
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Awaitable, Callable
+
+from fastapi import Request
+
+from app.api.http_errors import RangeNotSatisfiableError
+from app.core.mem.domain.utils.byte_range import ByteRange
+from app.core.mem.domain.utils.image_stream import ImageStream
+
+RANGE_SPEC_PATTERN = re.compile(r'(\d*)-(\d*)')
+
+
+class RangeHelper:
+    """
+    Класс-помощник для HTTP-запросов диапазонов байтов.
+    """
+    MAX_RANGES = 16
+
+    @staticmethod
+    def parse_range(range_header: str, size: int) -> list[ByteRange] | None:
+        """
+        Разбирает заголовок Range в диапазоны байтов ресурса.
+        Некорректный заголовок или слишком большое число диапазонов игнорируются, и ресурс отдаётся целиком.
+        :param range_header: Значение заголовка Range.
+        :param size: Размер ресурса в байтах.
+        :return: Выполнимые диапазоны в порядке запроса или None, если заголовок нужно проигнорировать.
+        :raise RangeNotSatisfiableError: Ни один из диапазонов не пересекается с ресурсом.
+        """
+        unit, _, range_set = range_header.partition('=')
+        if unit.strip().lower() != 'bytes' or not range_set.strip():
+            return None
+
+        specs = range_set.split(',')
+        if len(specs) > RangeHelper.MAX_RANGES:
+            return None
+
+        byte_ranges = []
+        for spec in specs:
+            match = RANGE_SPEC_PATTERN.fullmatch(spec.strip())
+            if match is None or not any(match.groups()):
+                return None
+            first, last = match.groups()
+            if not first:
+                # Суффиксный диапазон "-n" - последние n байтов
+                suffix_length = int(last)
+                if suffix_length and size:
+                    byte_ranges.append(ByteRange(start=max(size - suffix_length, 0), end=size - 1))
+                continue
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+            if last and int(last) < start:
+                return None
+            if start < size:
+                byte_ranges.append(ByteRange(start=start, end=end))
+
+        if not byte_ranges:
+            raise RangeNotSatisfiableError(size=size, exception_msg=range_header)
+        return byte_ranges
+
+    @staticmethod
+    def is_range_fresh(request: Request, etag: str, last_modified: datetime = None) -> bool:
+        """
+        Проверяет условие If-Range: диапазон отдаётся, только если у клиента та же версия ресурса.
+        ETag сравнивается строго, дата - с точностью до секунды.
+        :param request: Запрос.
+        :param etag: ETag текущей версии ресурса.
+        :param last_modified: Время последнего изменения ресурса.
+        :return: True, если заголовка нет или версия совпадает.
+        """
+        if_range = request.headers.get('if-range')
+        if if_range is None:
+            return True
+
+        if_range = if_range.strip()
+        if if_range.startswith(('"', 'W/')):
+            return not if_range.startswith('W/') and if_range == etag
+
+        if last_modified is None:
+            return False
+        try:
+            range_date = parsedate_to_datetime(if_range)
+        except (TypeError, ValueError):
+            return False
+        return range_date.tzinfo is not None and last_modified.replace(microsecond=0) == range_date
+
+    @staticmethod
+    def get_multipart_length(byte_ranges: list[ByteRange], size: int, media_type: str, boundary: str) -> int:
+        """
+        Вычисляет длину тела ответа multipart/byteranges.
+        :param byte_ranges: Диапазоны байтов.
+        :param size: Размер ресурса в байтах.
+        :param media_type: Тип содержимого ресурса.
+        :param boundary: Разделитель частей.
+        :return: Длина тела в байтах.
+        """
+        length = len(RangeHelper._get_closing_boundary(boundary))
+        for byte_range in byte_ranges:
+            length += len(RangeHelper._get_part_header(byte_range, size, media_type, boundary))
+            length += byte_range.length + len(b'\r\n')
+        return length
+
+    @staticmethod
+    async def iter_multipart(byte_ranges: list[ByteRange],
+                             size: int,
+                             media_type: str,
+                             boundary: str,
+                             open_range: Callable[[ByteRange], Awaitable[ImageStream]]) -> AsyncIterator[bytes]:
+        """
+        Формирует тело ответа multipart/byteranges по частям.
+        Диапазоны открываются по одному, только когда до них доходит очередь.
+        :param byte_ranges: Диапазоны байтов.
+        :param size: Размер ресурса в байтах.
+        :param media_type: Тип содержимого ресурса.
+        :param boundary: Разделитель частей.
+        :param open_range: Функция открытия потока диапазона.
+        :return: Асинхронный итератор частей тела.
+        """
+        for byte_range in byte_ranges:
+            yield RangeHelper._get_part_header(byte_range, size, media_type, boundary)
+            range_stream = await open_range(byte_range)
+            async for chunk in range_stream.chunks:
+                yield chunk
+            yield b'\r\n'
+        yield RangeHelper._get_closing_boundary(boundary)
+
+    @staticmethod
+    def _get_part_header(byte_range: ByteRange, size: int, media_type: str, boundary: str) -> bytes:
+        """
+        Формирует заголовок части multipart/byteranges.
+        """
+        return (f'--{boundary}\r\n'
+                f'Content-Type: {media_type}\r\n'
+                f'Content-Range: bytes {byte_range.start}-{byte_range.end}/{size}\r\n'
+                f'\r\n').encode()
+
+    @staticmethod
+    def _get_closing_boundary(boundary: str) -> bytes:
+        """
+        Формирует завершающий разделитель multipart/byteranges.
+        """
+        return f'--{boundary}--\r\n'.encode()
@@ -0,0 +1,22 @@
+"""
+Класс-помощник для загружаемых файлов UploadHelper.
+"""
+from typing import AsyncIterator
+
+from fastapi import UploadFile
+
+
+class UploadHelper:
+    """
+    Класс-помощник для загружаемых файлов.
+    """
+    @staticmethod
+    async def iter_chunks(upload_file: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Читает загружаемый файл частями, не загружая его целиком в память.
+        :param upload_file: Загружаемый файл.
+        :param chunk_size: Размер части в байтах.
+        :return: Асинхронный итератор частей файла.
+        """
+        while chunk := await upload_file.read(chunk_size):
+            yield chunk
@@ -52,3 +52,12 @@ class AuthenticationUserError(HTTPException):
         super().__init__(status_code=status.HTTP_401_UNAUTHORIZED,
                          detail={"message": f"{msg}: {exception_msg}"})
 
+
+class RangeNotSatisfiableError(HTTPException):
+    """
+    Ошибка, возникающая при запросе диапазона байтов за пределами ресурса.
+    """
+    def __init__(self, size: int, msg='Запрошенный диапазон недоступен.', exception_msg=''):
+        super().__init__(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                         detail={"message": f"{msg}: {exception_msg}"},
+                         headers={'Content-Range': f'bytes */{size}'})
@@ -2,26 +2,38 @@
 API-маршруты для работы с мемами.
 """
 import base64
-from io import BytesIO
+from functools import partial
 from typing import Annotated
-from uuid import UUID
+from urllib.parse import urlsplit
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, UploadFile, Form, File, Request
+from fastapi.responses import StreamingResponse, RedirectResponse, Response
 from starlette import status
 
+from app.api.helpers.http_cache_helper import HttpCacheHelper
+from app.api.helpers.range_helper import RangeHelper
+from app.api.helpers.upload_helper import UploadHelper
 from app.api.helpers.user_helper import UserHelper
 from app.api.http_errors import ResourceNotFoundError, ResourceExistsError, RequestParamValidationError
-from app.api.mem.dependencies import get_mem_service
+from app.api.mem.dependencies import get_mem_service, image_storage_settings, mem_settings, \
+    open_mem_export_service
+from app.api.mem.schemas.image_delivery import ImageDelivery
+from app.api.mem.schemas.mem_lookup_request import MemLookupRequest
 from app.api.mem.schemas.mem_read_response import MemReadResponse
 from app.api.mem.schemas.mem_update_request import MemUpdateRequest
 from app.api.shared_dependencies import get_current_user_role
 from app.core.mem.application.exceptions import MemNotFoundException, MemExistsException
 from app.core.mem.application.schemas.mem_create_schema import MemCreateSchema
+from app.core.mem.application.schemas.mem_page_schema import MemPageSchema
 from app.core.mem.application.schemas.mem_read_schema import MemReadSchema
 from app.core.mem.application.schemas.mem_update_schema import MemUpdateSchema
 from app.core.mem.application.services.mem_service import MemService
 from app.core.mem.domain.exceptions.base_mem_exceptions import MemValidationException
+from app.core.mem.domain.exceptions.image_exceptions import ImageNotFoundException
+from app.core.mem.domain.utils.byte_range import ByteRange
+from app.core.mem.domain.utils.image_upload_stream import ImageUploadStream, ImageUploadBatch
+from app.core.mem.domain.utils.image_variant import ImageVariant
 from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
 from app.core.user.application.authentication.schemas.user_from_token_schema import UserFromTokenSchema
 
@@ -31,19 +43,81 @@ mem_router = APIRouter(prefix='/memes', tags=['Mem'])
 @mem_router.get(
     "",
     status_code=status.HTTP_200_OK,
-    response_model=list[MemReadSchema]
+    response_model=MemPageSchema
 )
 async def get_all_memes(mem_service: Annotated[MemService, Depends(get_mem_service)],
-                        mem_filter_params: MemFilterParams = Depends()) -> list[MemReadSchema]:
+                        mem_filter_params: MemFilterParams = Depends()) -> MemPageSchema:
     """
-    Маршрут для получения всех мемов.
+    Маршрут для получения всех мемов постранично.
+    Для последовательного просмотра следует передавать курсор `after` из предыдущей страницы:
+    такая выборка не замедляется с ростом номера страницы.
+    С параметром `q` выполняется полнотекстовый поиск по тексту мемов, найденные мемы упорядочены по релевантности.
 
     :param mem_filter_params: Параметры фильтрации мемов.
     :param mem_service: Сервис для работы с мемами.
-    :return: Список мемов.
+    :return: Страница мемов с курсором следующей страницы.
     """
-    memes = await mem_service.get_all_memes(mem_filter_params=mem_filter_params)
-    return memes
+    try:
+        memes_page = await mem_service.get_memes_page(mem_filter_params=mem_filter_params)
+    except MemValidationException as exc:
+        raise RequestParamValidationError(exception_msg=str(exc)) from exc
+    return memes_page
+
+
+@mem_router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse
+)
+async def export_memes(
+        current_user_role: Annotated[UserFromTokenSchema, Depends(get_current_user_role)]
+) -> StreamingResponse:
+    """
+    Маршрут для выгрузки всех мемов в формате NDJSON: по одному мему в JSON на строку.
+    Мемы читаются из базы данных серверным курсором и отправляются по частям,
+    поэтому потребление памяти не зависит от количества мемов.
+
+    :param current_user_role: Роль текущего пользователя.
+    :return: Поток строк с мемами.
+    """
+    UserHelper.assert_is_admin(current_user_role)
+
+    async def ndjson_chunks():
+        async with open_mem_export_service() as mem_service:
+            lines = []
+            async for mem in mem_service.export_memes(batch_size=mem_settings.export_batch_size):
+                lines.append(mem.model_dump_json())
+                if len(lines) >= mem_settings.export_batch_size:
+                    yield '\n'.join(lines) + '\n'
+                    lines.clear()
+            if lines:
+                yield '\n'.join(lines) + '\n'
+
+    return StreamingResponse(content=ndjson_chunks(), media_type="application/x-ndjson")
+
+
+@mem_router.post(
+    "/lookup",
+    status_code=status.HTTP_200_OK,
+    response_model=list[MemReadSchema]
+)
+async def lookup_memes(lookup_request: MemLookupRequest,
+                       mem_service: Annotated[MemService, Depends(get_mem_service)]) -> list[MemReadSchema]:
+    """
+    Маршрут для получения мемов по списку идентификаторов за один запрос к базе данных.
+    Мемы возвращаются в порядке запрошенных идентификаторов без повторов, не найденные мемы пропускаются.
+    Картинки в ответ не включаются, их следует получать по адресу `/memes/{id}/image`.
+
+    :param lookup_request: Идентификаторы мемов.
+    :param mem_service: Сервис для работы с мемами.
+    :return: Найденные мемы.
+    """
+    if len(lookup_request.ids) > mem_settings.lookup_max_size:
+        raise RequestParamValidationError(
+            exception_msg=f'Слишком много идентификаторов. '
+                          f'Поддерживается до {mem_settings.lookup_max_size} мемов за запрос.'
+        )
+    return await mem_service.get_memes_by_ids(lookup_request.ids)
 
 
 @mem_router.get(
@@ -52,26 +126,46 @@ async def get_all_memes(mem_service: Annotated[MemService, Depends(get_mem_servi
     response_model=MemReadResponse
 )
 async def get_mem_by_id(id: UUID,
-                        mem_service: Annotated[MemService, Depends(get_mem_service)]) -> MemReadResponse:
+                        request: Request,
+                        response: Response,
+                        mem_service: Annotated[MemService, Depends(get_mem_service)],
+                        image_delivery: ImageDelivery = ImageDelivery.BYTES) -> MemReadResponse | Response:
     """
     Маршрут для получения мема по его идентификатору.
+    Ответ с картинкой в теле можно перепроверять по ETag: если мем не изменился,
+    возвращается 304 без обращения к хранилищу картинок. Ответ со ссылкой не кэшируется,
+    так как ссылка ограничена по времени.
 
     :param id: Уникальный идентификатор мема.
+    :param request: Запрос.
+    :param response: Ответ.
     :param mem_service: Сервис для работы с мемами.
+    :param image_delivery: Способ передачи картинки: в теле ответа или временной ссылкой на хранилище.
     :return: Мем.
     """
+    image_bytes = None
+    image_url = None
     try:
         mem = await mem_service.get_mem_by_id(id)
-        if mem.image_path:
+        if image_delivery == ImageDelivery.BYTES:
+            cache_headers = HttpCacheHelper.get_cache_headers(etag=f'"{mem.uuid}-{mem.version}"',
+                                                              last_modified=mem.updated_at,
+                                                              max_age=mem_settings.http_cache_max_age)
+            if HttpCacheHelper.is_not_modified(request, etag=cache_headers['ETag'], last_modified=mem.updated_at):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+            response.headers.update(cache_headers)
+
+        if mem.image_path and image_delivery == ImageDelivery.URL:
+            image_url = await mem_service.get_mem_image_url(mem.image_path)
+        elif mem.image_path:
             with await mem_service.get_mem_image(mem.image_path) as image_stream:
                 image_bytes = base64.b64encode(image_stream.getvalue())
-        else:
-            image_bytes = None
     except MemNotFoundException as exc:
         raise ResourceNotFoundError(exception_msg=str(exc)) from exc
 
     response_mem = MemReadResponse(mem=mem,
-                                   image_bytes=image_bytes)
+                                   image_bytes=image_bytes,
+                                   image_url=image_url)
     return response_mem
 
 
@@ -80,12 +174,23 @@ async def get_mem_by_id(id: UUID,
     status_code=status.HTTP_200_OK,
 )
 async def get_mem_image(id: UUID,
-                        mem_service: Annotated[MemService, Depends(get_mem_service)]) -> Response:
+                        request: Request,
+                        mem_service: Annotated[MemService, Depends(get_mem_service)],
+                        size: ImageVariant = None) -> Response:
     """
     Маршрут для получения картинки мема по его идентификатору.
+    В зависимости от настройки `delivery_mode` картинка отдаётся по частям через приложение,
+    перенаправлением на подписанную ссылку хранилища или через X-Accel-Redirect прокси-сервера.
+    Уменьшенный вариант картинки в формате WebP всегда отдаётся через приложение,
+    чтобы отдать оригинал, если вариант ещё не создан.
+    Картинку можно перепроверять по ETag: если мем не изменился, возвращается 304 без обращения к хранилищу.
+    Для оригинала поддерживаются запросы диапазонов байтов (Range и If-Range): из хранилища читаются
+    только запрошенные диапазоны, несколько диапазонов отдаются в теле multipart/byteranges.
 
     :param id: Уникальный идентификатор мема.
+    :param request: Запрос.
     :param mem_service: Сервис для работы с мемами.
+    :param size: Вариант картинки уменьшенного размера, по умолчанию - оригинал.
     :return: Картинка мема.
     """
     try:
@@ -96,8 +201,84 @@ async def get_mem_image(id: UUID,
     if not mem.image_path:
         raise ResourceNotFoundError
 
-    with await mem_service.get_mem_image(mem.image_path) as image_stream:
-        return Response(content=image_stream.getvalue(), media_type="image/png")
+    cache_headers = HttpCacheHelper.get_cache_headers(
+        etag=f'"{mem.uuid}-{mem.version}-{size.value if size else "original"}"',
+        last_modified=mem.updated_at,
+        max_age=mem_settings.http_cache_max_age
+    )
+    if HttpCacheHelper.is_not_modified(request, etag=cache_headers['ETag'], last_modified=mem.updated_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    if image_storage_settings.delivery_mode == 'redirect' and size is None:
+        image_url = await mem_service.get_mem_image_url(mem.image_path)
+        return RedirectResponse(url=image_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+    if image_storage_settings.delivery_mode == 'accel' and size is None:
+        image_url = urlsplit(await mem_service.get_mem_image_url(mem.image_path, internal=True))
+        accel_location = image_storage_settings.accel_redirect_location.rstrip('/')
+        return Response(media_type="image/png",
+                        headers={'X-Accel-Redirect': f'{accel_location}{image_url.path}?{image_url.query}'})
+
+    range_header = request.headers.get('range')
+    if size is None and range_header is not None \
+            and RangeHelper.is_range_fresh(request, etag=cache_headers['ETag'], last_modified=mem.updated_at):
+        try:
+            image_size = await mem_service.get_mem_image_size(mem.image_path)
+        except ImageNotFoundException as exc:
+            raise ResourceNotFoundError(exception_msg=str(exc)) from exc
+        byte_ranges = RangeHelper.parse_range(range_header, size=image_size)
+        if byte_ranges:
+            return await _get_mem_image_ranges(mem.image_path, byte_ranges, image_size, mem_service, cache_headers)
+
+    try:
+        image_stream = await mem_service.stream_mem_image(mem.image_path, variant=size)
+    except ImageNotFoundException as exc:
+        raise ResourceNotFoundError(exception_msg=str(exc)) from exc
+
+    headers = {'Content-Length': str(image_stream.size)} if image_stream.size is not None else {}
+    if size is None:
+        headers['Accept-Ranges'] = 'bytes'
+    # Оригинал, отданный вместо ещё не созданного варианта, не кэшируется, чтобы клиент позже получил вариант
+    if size is None or image_stream.media_type == 'image/webp':
+        headers.update(cache_headers)
+    return StreamingResponse(content=image_stream.chunks, media_type=image_stream.media_type, headers=headers)
+
+
+async def _get_mem_image_ranges(image_path: str,
+                                byte_ranges: list[ByteRange],
+                                image_size: int,
+                                mem_service: MemService,
+                                cache_headers: dict[str, str]) -> StreamingResponse:
+    """
+    Формирует ответ 206 с диапазонами байтов оригинала картинки мема.
+
+    :param image_path: Путь к картинке мема.
+    :param byte_ranges: Выполнимые диапазоны байтов.
+    :param image_size: Размер картинки в байтах.
+    :param mem_service: Сервис для работы с мемами.
+    :param cache_headers: Заголовки для кэширования картинки.
+    :return: Ответ с одним диапазоном или телом multipart/byteranges.
+    """
+    media_type = 'image/png'
+    headers = {'Accept-Ranges': 'bytes', **cache_headers}
+
+    if len(byte_ranges) == 1:
+        byte_range = byte_ranges[0]
+        try:
+            range_stream = await mem_service.stream_mem_image_range(image_path, byte_range=byte_range)
+        except ImageNotFoundException as exc:
+            raise ResourceNotFoundError(exception_msg=str(exc)) from exc
+        headers['Content-Range'] = f'bytes {byte_range.start}-{byte_range.end}/{image_size}'
+        headers['Content-Length'] = str(byte_range.length)
+        return StreamingResponse(content=range_stream.chunks, status_code=status.HTTP_206_PARTIAL_CONTENT,
+                                 media_type=media_type, headers=headers)
+
+    boundary = uuid4().hex
+    headers['Content-Length'] = str(RangeHelper.get_multipart_length(byte_ranges, image_size, media_type, boundary))
+    content = RangeHelper.iter_multipart(byte_ranges, image_size, media_type, boundary,
+                                         open_range=partial(mem_service.stream_mem_image_range, image_path))
+    return StreamingResponse(content=content, status_code=status.HTTP_206_PARTIAL_CONTENT,
+                             media_type=f'multipart/byteranges; boundary={boundary}', headers=headers)
 
 
 @mem_router.post(
@@ -120,15 +301,11 @@ async def add_mem(mem_to_add: Annotated[MemCreateSchema, Depends()],
     """
     UserHelper.assert_is_admin(current_user_role)
 
-    # Проверку на размер файла надо бы иметь на веб-сервере
+    image_stream = None
     if image_file:
-        if image_file.size > 8 * 2**20:
-            raise RequestParamValidationError(
-                exception_msg='Изображение слишком большое. Поддерживаются изображения до 8 Мб.'
-            )
-        image_stream = BytesIO(await image_file.read())
-    else:
-        image_stream = None
+        # Размер проверяется по мере загрузки, а не по заявленному клиентом
+        image_chunks = UploadHelper.iter_chunks(image_file, chunk_size=image_storage_settings.chunk_size)
+        image_stream = ImageUploadStream(chunks=image_chunks, max_size=image_storage_settings.max_upload_size)
 
     try:
         added_mem = await mem_service.add_mem(mem_to_add, image_stream)
@@ -139,6 +316,55 @@ async def add_mem(mem_to_add: Annotated[MemCreateSchema, Depends()],
     return added_mem
 
 
+@mem_router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED,
+    response_model=list[MemReadSchema]
+)
+async def add_memes(texts: Annotated[list[str], Form()],
+                    current_user_role: Annotated[UserFromTokenSchema, Depends(get_current_user_role)],
+                    mem_service: Annotated[MemService, Depends(get_mem_service)],
+                    image_files: Annotated[list[UploadFile], File()] = None) -> list[MemReadSchema]:
+    """
+    Маршрут для пакетного добавления мемов за одну транзакцию.
+    Картинки сопоставляются с текстами по порядку, файл нулевого размера означает мем без картинки.
+
+    :param texts: Тексты мемов.
+    :param current_user_role: Роль текущего пользователя.
+    :param mem_service: Сервис для работы с мемами.
+    :param image_files: Картинки мемов.
+    :return: Добавленные мемы.
+    """
+    UserHelper.assert_is_admin(current_user_role)
+
+    if len(texts) > mem_settings.batch_max_size:
+        raise RequestParamValidationError(
+            exception_msg=f'Слишком много мемов. Поддерживается до {mem_settings.batch_max_size} мемов за запрос.'
+        )
+    if image_files and len(image_files) != len(texts):
+        raise RequestParamValidationError(exception_msg='Количество картинок не совпадает с количеством мемов.')
+
+    # Размер проверяется по мере загрузки, а не по заявленному клиентом, в том числе суммарный для всех картинок
+    upload_batch = ImageUploadBatch(max_size=mem_settings.batch_max_upload_size)
+    image_streams = [
+        ImageUploadStream(chunks=UploadHelper.iter_chunks(image_file, chunk_size=image_storage_settings.chunk_size),
+                          max_size=image_storage_settings.max_upload_size,
+                          batch=upload_batch)
+        if image_file.size else None
+        for image_file in image_files or []
+    ]
+
+    try:
+        memes_to_add = [MemCreateSchema(text=text) for text in texts]
+        added_memes = await mem_service.add_memes(memes_to_add, image_streams or None,
+                                                  max_concurrency=mem_settings.batch_upload_concurrency)
+    except MemValidationException as exc:
+        raise RequestParamValidationError(exception_msg=str(exc)) from exc
+    except MemExistsException as exc:
+        raise ResourceExistsError(exception_msg=str(exc)) from exc
+    return added_memes
+
+
 @mem_router.put(
     "/{id}",
     status_code=status.HTTP_200_OK,
@@ -161,15 +387,11 @@ async def update_mem(id: UUID,
     """
     UserHelper.assert_is_admin(current_user_role)
 
-    # Проверку на размер файла надо бы иметь на веб-сервере
+    image_stream = None
     if image_file:
-        if image_file.size > 8 * 2**20:
-            raise RequestParamValidationError(
-                exception_msg='Изображение слишком большое. Поддерживаются изображения до 8 Мб.'
-            )
-        image_stream = BytesIO(await image_file.read())
-    else:
-        image_stream = None
+        # Размер проверяется по мере загрузки, а не по заявленному клиентом
+        image_chunks = UploadHelper.iter_chunks(image_file, chunk_size=image_storage_settings.chunk_size)
+        image_stream = ImageUploadStream(chunks=image_chunks, max_size=image_storage_settings.max_upload_size)
 
     try:
         mem_to_update_internal = MemUpdateSchema(uuid=id,
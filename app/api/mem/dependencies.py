@@ -2,27 +2,110 @@
 Функции для получения зависимостей мемов.
 Включает в себя создание сервиса мемов.
 """
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from uuid import UUID
 
 from fastapi import Depends
-from mypy_boto3_s3.service_resource import Bucket
+from mypy_boto3_s3 import S3Client
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.mem.application.services.mem_service import MemService
+from app.core.mem.domain.mem_entity import Mem
+from app.core.mem.domain.mem_repository import MemRepository
+from app.core.mem.domain.image_ref_repository import ImageRefRepository
+from app.core.mem.domain.image_repository import ImageRepository
+from app.core.mem.domain.image_variant_generator import ImageVariantGenerator
+from app.core.mem.domain.utils.image_variant import ImageVariant
+from app.core.mem.domain.utils.mem_count import MemCount
+from app.core.mem.infrastructure.images.pillow_variant_generator import PillowImageVariantGenerator
+from app.core.mem.infrastructure.repositories.cached_mem_repository import CachedMemRepository
+from app.core.mem.infrastructure.repositories.disk_cached_image_repository import DiskCachedImageRepository
+from app.core.mem.infrastructure.repositories.image_ref_repository import ImageRefDBRepository
 from app.core.mem.infrastructure.repositories.image_repository import ImageS3Repository
 from app.core.mem.infrastructure.repositories.mem_repository import MemDBRepository
-from app.core.shared_kernel.db.dependencies import get_async_db_session, get_s3_bucket_image
+from app.core.shared_kernel.cache.disk_lru_cache import DiskLRUCache
+from app.core.shared_kernel.cache.lru_ttl_cache import LRUTTLCache
+from app.core.shared_kernel.db.dependencies import get_async_db_session, get_s3_client, \
+    get_image_executor, get_s3_public_client, async_session_maker
+from app.settings import MemSettings, ImageStorageSettings
+
+mem_settings = MemSettings()
+image_storage_settings = ImageStorageSettings()
+
+mem_cache: LRUTTLCache[UUID, Mem] = LRUTTLCache(max_size=mem_settings.cache_max_size,
+                                                ttl=mem_settings.cache_ttl,
+                                                name='mem')
+mem_count_cache: LRUTTLCache[str | None, MemCount] = LRUTTLCache(max_size=mem_settings.cache_max_size,
+                                                                 ttl=mem_settings.count_cache_ttl,
+                                                                 name='mem_count')
+
+image_disk_cache: DiskLRUCache | None = None
+if image_storage_settings.disk_cache_dir:
+    image_disk_cache = DiskLRUCache(directory=image_storage_settings.disk_cache_dir,
+                                    max_bytes=image_storage_settings.disk_cache_max_bytes,
+                                    name='image_disk')
+
+image_variant_executor: Executor | None = None
+image_variant_generator: ImageVariantGenerator | None = None
+if image_storage_settings.variants_enabled:
+    if image_storage_settings.variants_pool == 'process':
+        image_variant_executor = ProcessPoolExecutor(max_workers=image_storage_settings.variants_workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+    else:
+        image_variant_executor = ThreadPoolExecutor(max_workers=image_storage_settings.variants_workers,
+                                                    thread_name_prefix='image_variants')
+    image_variant_generator = PillowImageVariantGenerator(
+        sizes={ImageVariant.THUMB: image_storage_settings.variants_thumb_size,
+               ImageVariant.MEDIUM: image_storage_settings.variants_medium_size},
+        quality=image_storage_settings.variants_quality,
+        executor=image_variant_executor
+    )
 
 
 async def get_mem_service(session: AsyncSession = Depends(get_async_db_session),
-                          bucket: Bucket = Depends(get_s3_bucket_image)) -> MemService:
+                          client: S3Client = Depends(get_s3_client),
+                          executor: Executor = Depends(get_image_executor),
+                          public_client: S3Client | None = Depends(get_s3_public_client)) -> MemService:
     """
     Получает сервис мемов.
 
     :param session: Асинхронная сессия базы данных.
-    :param bucket: Бакет картинок мемов в S3 хранилище.
+    :param client: Клиент S3 хранилища картинок мемов.
+    :param executor: Пул потоков для операций с S3 хранилищем.
+    :param public_client: Клиент S3 для подписи ссылок, выдаваемых клиентам.
     :return: Сервис мемов.
     """
 
-    mem_repository = MemDBRepository(session)
-    image_repository = ImageS3Repository(bucket)
-    return MemService(mem_repository=mem_repository, image_repository=image_repository)
+    mem_repository: MemRepository = MemDBRepository(session,
+                                                     exact_count_threshold=mem_settings.count_exact_threshold)
+    if mem_settings.cache_enabled:
+        mem_repository = CachedMemRepository(mem_repository, mem_cache, count_cache=mem_count_cache)
+    image_repository: ImageRepository = ImageS3Repository(client, executor=executor,
+                                                           public_client=public_client)
+    if image_disk_cache is not None:
+        image_repository = DiskCachedImageRepository(image_repository, image_disk_cache,
+                                                     executor=executor,
+                                                     chunk_size=image_storage_settings.chunk_size)
+    image_ref_repository: ImageRefRepository | None = None
+    if mem_settings.image_dedup_enabled:
+        image_ref_repository = ImageRefDBRepository(session)
+    return MemService(mem_repository=mem_repository, image_repository=image_repository,
+                      image_ref_repository=image_ref_repository,
+                      image_variant_generator=image_variant_generator)
+
+
+@asynccontextmanager
+async def open_mem_export_service() -> AsyncIterator[MemService]:
+    """
+    Открывает сервис мемов для потоковой выгрузки с собственной сессией базы данных.
+    Сессия зависимости `get_async_db_session` закрывается до отправки потокового ответа,
+    поэтому выгрузка открывает сессию сама и закрывает её после отправки последней строки.
+
+    :return: Сервис мемов.
+    """
+    async with async_session_maker() as session:
+        image_repository = ImageS3Repository(get_s3_client(), executor=get_image_executor())
+        yield MemService(mem_repository=MemDBRepository(session), image_repository=image_repository)
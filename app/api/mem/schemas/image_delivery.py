@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class ImageDelivery(str, Enum):
+    """
+    Способ передачи картинки в ответе с мемом.
+
+    :cvar BYTES: Картинка передаётся в теле ответа в base64.
+    :cvar URL: Передаётся временная ссылка на картинку в хранилище.
+    """
+    BYTES = 'bytes'
+    URL = 'url'
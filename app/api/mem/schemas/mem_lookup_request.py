@@ -0,0 +1,7 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class MemLookupRequest(BaseModel):
+    ids: list[UUID]
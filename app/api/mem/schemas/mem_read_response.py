@@ -6,3 +6,4 @@ from app.core.mem.application.schemas.mem_read_schema import MemReadSchema
 class MemReadResponse(BaseModel):
     mem: MemReadSchema
     image_bytes: bytes | None
+    image_url: str | None = None
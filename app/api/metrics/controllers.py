@@ -0,0 +1,30 @@
+"""
+API-маршрут для получения метрик приложения в формате Prometheus.
+"""
+import os
+
+from fastapi import APIRouter, Response
+from prometheus_client import CollectorRegistry, REGISTRY, generate_latest, CONTENT_TYPE_LATEST, multiprocess
+from starlette import status
+
+from app.core.shared_kernel.metrics.metrics import MULTIPROC_DIR_ENV
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get("/metrics", status_code=status.HTTP_200_OK, include_in_schema=False)
+def get_metrics() -> Response:
+    """
+    Получает метрики приложения в текстовом формате Prometheus.
+    При запуске нескольких процессов-обработчиков с переменной окружения `PROMETHEUS_MULTIPROC_DIR`
+    метрики собираются со всех процессов.
+    Маршрут не требует аутентификации и должен быть доступен только изнутри сети:
+    прокси-сервер закрывает его снаружи.
+
+    :return: Метрики приложения.
+    """
+    registry = REGISTRY
+    if MULTIPROC_DIR_ENV in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(content=generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,61 @@
+"""
+ASGI-middleware для сбора метрик HTTP-запросов MetricsMiddleware.
+"""
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.shared_kernel.metrics.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS, \
+    HTTP_RESPONSE_SIZE, HTTP_REQUEST_DB_DURATION, RequestDbTimer, request_db_timer
+
+
+class MetricsMiddleware:
+    """
+    ASGI-middleware для сбора метрик HTTP-запросов: времени обработки, количества обрабатываемых запросов,
+    размера ответа и времени запросов к базе данных.
+    Запросы учитываются по шаблону маршрута, а не по фактическому пути, чтобы число меток не росло
+    с количеством ресурсов. Время потокового ответа учитывается до отправки последней части.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Конструктор MetricsMiddleware.
+
+        :param app: Оборачиваемое ASGI-приложение.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        status_code = 500
+        response_size = 0
+        db_timer = RequestDbTimer()
+        db_timer_token = request_db_timer.set(db_timer)
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status_code, response_size
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            elif message['type'] == 'http.response.body':
+                response_size += len(message.get('body', b''))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            request_db_timer.reset(db_timer_token)
+
+            route = scope.get('route')
+            route_path = getattr(route, 'path', 'unmatched')
+            HTTP_REQUEST_DURATION.labels(method=method, route=route_path, status=str(status_code)).observe(elapsed)
+            HTTP_RESPONSE_SIZE.labels(method=method, route=route_path).observe(response_size)
+            HTTP_REQUEST_DB_DURATION.labels(method=method, route=route_path).observe(db_timer.seconds)
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+
+from app.core.mem.application.schemas.mem_read_schema import MemReadSchema
+
+
+class MemPageSchema(BaseModel):
+    """
+    Страница мемов.
+
+    :cvar items: Мемы страницы.
+    :cvar next_cursor: Курсор для получения следующей страницы.
+    :cvar has_next: Есть ли следующая страница.
+    :cvar total: Общее количество мемов, подходящих под фильтр.
+    :cvar total_is_estimate: Является ли общее количество оценкой, а не точным значением.
+    """
+
+    items: list[MemReadSchema]
+    next_cursor: str | None
+    has_next: bool = False
+    total: int = 0
+    total_is_estimate: bool = False
@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -9,6 +10,8 @@ class MemReadSchema(BaseModel):
     uuid: UUID
     text: str
     image_path: str | None
+    version: int
+    updated_at: datetime
 
     @classmethod
     def from_entity(cls, entity: Mem) -> "MemReadSchema":
@@ -16,5 +19,7 @@ class MemReadSchema(BaseModel):
         return cls(
             uuid=entity.uuid.uuid,
             text=entity.text.text,
-            image_path=image_path
+            image_path=image_path,
+            version=entity.version,
+            updated_at=entity.updated_at
         )
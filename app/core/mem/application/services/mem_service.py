@@ -1,62 +1,361 @@
 """
 Сервис для работы с мемами MemService.
 """
+import asyncio
+import hashlib
+import logging
+from functools import partial
 from io import BytesIO
+from typing import AsyncIterator, Sequence
 from uuid import uuid4, UUID
 
 from app.core.mem.application.exceptions import MemNotFoundException, MemExistsException
 from app.core.mem.application.schemas.mem_create_schema import MemCreateSchema
+from app.core.mem.application.schemas.mem_page_schema import MemPageSchema
 from app.core.mem.application.schemas.mem_read_schema import MemReadSchema
 from app.core.mem.application.schemas.mem_update_schema import MemUpdateSchema
+from app.core.mem.domain.exceptions.image_exceptions import ImageNotFoundException
+from app.core.mem.domain.image_ref_repository import ImageRefRepository
 from app.core.mem.domain.image_repository import ImageRepository
+from app.core.mem.domain.image_variant_generator import ImageVariantGenerator
 from app.core.mem.domain.mem_entity import Mem
 from app.core.mem.domain.mem_repository import MemRepository
+from app.core.mem.domain.utils.byte_range import ByteRange
+from app.core.mem.domain.utils.image_stream import ImageStream
+from app.core.mem.domain.utils.image_upload_stream import ImageUploadStream
+from app.core.mem.domain.utils.image_variant import ImageVariant
+from app.core.mem.domain.utils.mem_cursor import MemCursor
 from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
+from app.core.mem.domain.value_objects.image_hash import ImageHash
 from app.core.mem.domain.value_objects.mem_text import MemText
 from app.core.mem.domain.value_objects.mem_uuid import MemUUID
 from app.core.shared_kernel.db.exceptions import EntityExistsException, EntityNotFoundException
 
+logger = logging.getLogger(__name__)
+
 
 class MemService:
     """
     Сервис для работы с мемами.
 
     :ivar mem_repository: Репозиторий мемов.
+    :ivar image_repository: Репозиторий картинок мемов.
+    :ivar image_ref_repository: Репозиторий счётчиков ссылок на картинки.
+        Если задан, картинки хранятся по хэшу содержимого и одинаковые картинки загружаются один раз.
+    :ivar image_variant_generator: Генератор вариантов картинок уменьшенного размера.
+        Если задан, варианты создаются в фоне после загрузки картинки.
     """
 
-    def __init__(self, mem_repository: MemRepository, image_repository: ImageRepository):
+    _background_tasks: set[asyncio.Task] = set()
+    _variant_tasks: dict[str, set[asyncio.Task]] = {}
+
+    def __init__(self, mem_repository: MemRepository, image_repository: ImageRepository,
+                 image_ref_repository: ImageRefRepository = None,
+                 image_variant_generator: ImageVariantGenerator = None):
         """
         Конструктор MemService.
 
         :param mem_repository: Репозиторий мемов.
         :param image_repository: Репозиторий картинок мемов.
+        :param image_ref_repository: Репозиторий счётчиков ссылок на картинки для хранения картинок по хэшу.
+        :param image_variant_generator: Генератор вариантов картинок уменьшенного размера.
         """
         self.mem_repository = mem_repository
         self.image_repository = image_repository
+        self.image_ref_repository = image_ref_repository
+        self.image_variant_generator = image_variant_generator
 
-    async def add_mem(self, data: MemCreateSchema, image_stream: BytesIO = None) -> MemReadSchema:
+    async def add_mem(self, data: MemCreateSchema,
+                      image_stream: BytesIO | ImageUploadStream = None) -> MemReadSchema:
         """
         Добавляет новый мем.
 
         :param data: Данные для создания мема.
-        :param image_stream: Двоичный поток с данными изображения.
+        :param image_stream: Двоичный поток с данными изображения или поток загружаемого изображения.
         :return: Информация созданного мема.
         :raise MemExistsException: Добавление мема, который уже существует.
+        :raise ImageTooLargeException: Размер загружаемого изображения превышает максимальный.
         """
         mem = Mem(
             uuid=MemUUID(uuid4()),
             text=MemText(data.text)
         )
-        if image_stream:
-            mem.upload_image()
-            self.image_repository.save_image(path=mem.image_path.path, image_stream=image_stream)
+        image_uploaded = bool(image_stream) and await self._save_mem_image(mem, image_stream)
         try:
             await self.mem_repository.add(mem)
         except EntityExistsException as e:
+            if mem.image_path:
+                await self._delete_mem_image(mem)
             raise MemExistsException from e
 
+        if image_uploaded:
+            self._schedule_image_variants(mem, image_stream)
         return MemReadSchema.from_entity(mem)
 
+    async def add_memes(self, data: list[MemCreateSchema],
+                        image_streams: list[BytesIO | ImageUploadStream | None] = None,
+                        max_concurrency: int = None) -> list[MemReadSchema]:
+        """
+        Добавляет несколько мемов за одну транзакцию.
+        Сначала проверяются все мемы, затем картинки загружаются в хранилище параллельно
+        и мемы добавляются одной пакетной вставкой. При ошибке загруженные картинки удаляются.
+
+        :param data: Данные для создания мемов.
+        :param image_streams: Двоичные потоки с данными изображений или потоки загружаемых изображений
+            по порядку мемов, None для мема без картинки.
+        :param max_concurrency: Максимальное количество одновременно загружаемых картинок, None - без ограничения.
+        :return: Информация созданных мемов в порядке их передачи.
+        :raise MemValidationException: Некорректные данные одного из мемов.
+        :raise MemExistsException: Добавление мема, который уже существует.
+        :raise ImageTooLargeException: Размер загружаемого изображения превышает максимальный.
+        """
+        image_streams = image_streams or [None] * len(data)
+        memes = [Mem(uuid=MemUUID(uuid4()), text=MemText(mem_data.text)) for mem_data in data]
+
+        memes_with_images = [(mem, image_stream) for mem, image_stream in zip(memes, image_streams)
+                             if image_stream]
+
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def save_mem_image(mem: Mem, image_stream: BytesIO | ImageUploadStream) -> bool:
+            if semaphore is None:
+                return await self._save_mem_image(mem, image_stream)
+            async with semaphore:
+                return await self._save_mem_image(mem, image_stream)
+
+        results = await asyncio.gather(
+            *(save_mem_image(mem, image_stream) for mem, image_stream in memes_with_images),
+            return_exceptions=True
+        )
+        saved_memes = [mem for (mem, _), result in zip(memes_with_images, results)
+                       if not isinstance(result, BaseException)]
+        uploaded_memes = [(mem, image_stream) for (mem, image_stream), result in zip(memes_with_images, results)
+                          if result is True]
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            await self._delete_mem_images(saved_memes)
+            raise errors[0]
+
+        try:
+            await self.mem_repository.add(memes)
+        except EntityExistsException as e:
+            await self._delete_mem_images(saved_memes)
+            raise MemExistsException from e
+
+        for mem, image_stream in uploaded_memes:
+            self._schedule_image_variants(mem, image_stream)
+        return [MemReadSchema.from_entity(mem) for mem in memes]
+
+    async def _save_mem_image(self, mem: Mem, image_stream: BytesIO | ImageUploadStream) -> bool:
+        """
+        Сохраняет картинку мема в хранилище.
+        При хранении по хэшу картинка не загружается, только если на неё уже есть ссылки
+        и она действительно есть в хранилище: загрузка по первой ссылке может ещё выполняться или завершиться ошибкой.
+
+        :param mem: Мем, для которого сохраняется картинка.
+        :param image_stream: Двоичный поток с данными изображения или поток загружаемого изображения.
+        :return: Была ли картинка загружена, а не найдена в хранилище.
+        """
+        if isinstance(image_stream, ImageUploadStream):
+            return await self._save_mem_image_stream(mem, image_stream)
+
+        if self.image_ref_repository is None:
+            mem.upload_image()
+            await self.image_repository.save_image(path=mem.image_path.path, image_stream=image_stream)
+            return True
+
+        mem.upload_image(image_hash=ImageHash(hashlib.sha256(image_stream.getbuffer()).hexdigest()))
+        if await self._acquire_stored_image(mem):
+            return False
+        try:
+            await self.image_repository.save_image(path=mem.image_path.path, image_stream=image_stream)
+        except BaseException:
+            await self.image_ref_repository.release(mem.image_hash.hash)
+            raise
+        return True
+
+    async def _save_mem_image_stream(self, mem: Mem, image_stream: ImageUploadStream) -> bool:
+        """
+        Сохраняет картинку мема в хранилище по частям по мере загрузки.
+        При хранении по хэшу хэш известен только после загрузки, поэтому картинка сначала загружается
+        по временному пути, а затем копируется внутри хранилища, только если её там ещё нет.
+
+        :param mem: Мем, для которого сохраняется картинка.
+        :param image_stream: Поток загружаемого изображения.
+        :return: Была ли картинка загружена, а не найдена в хранилище.
+        """
+        if self.image_ref_repository is None:
+            mem.upload_image()
+            await self.image_repository.save_image_stream(path=mem.image_path.path, chunks=image_stream)
+            return True
+
+        upload_path = f'upload_{uuid4()}'
+        await self.image_repository.save_image_stream(path=upload_path, chunks=image_stream)
+        try:
+            mem.upload_image(image_hash=ImageHash(image_stream.hash))
+            if await self._acquire_stored_image(mem):
+                return False
+            try:
+                await self.image_repository.copy_image(source_path=upload_path, path=mem.image_path.path)
+            except BaseException:
+                await self.image_ref_repository.release(mem.image_hash.hash)
+                raise
+        finally:
+            await self.image_repository.delete_image(path=upload_path)
+        return True
+
+    async def _acquire_stored_image(self, mem: Mem) -> bool:
+        """
+        Добавляет ссылку на картинку мема, хранящуюся по хэшу, и проверяет, есть ли картинка в хранилище.
+        Картинка загружается под той же ссылкой, поэтому при ошибке загрузки ссылку нужно освободить.
+
+        :param mem: Мем с картинкой по хэшу.
+        :return: True, если на картинку уже были ссылки и она есть в хранилище.
+        """
+        if await self.image_ref_repository.acquire(mem.image_hash.hash) == 1:
+            return False
+        try:
+            await self.image_repository.get_image_size(path=mem.image_path.path)
+        except ImageNotFoundException:
+            return False
+        except BaseException:
+            await self.image_ref_repository.release(mem.image_hash.hash)
+            raise
+        return True
+
+    def _schedule_image_variants(self, mem: Mem, image_stream: BytesIO | ImageUploadStream) -> None:
+        """
+        Запускает создание вариантов картинки мема в фоне, не задерживая ответ на запрос.
+
+        :param mem: Мем с загруженной картинкой.
+        :param image_stream: Двоичный поток с данными изображения или поток загружаемого изображения.
+            Данные потоковой загрузки не хранятся в памяти, поэтому для неё картинка читается из хранилища.
+        """
+        if self.image_variant_generator is None:
+            return
+
+        path = mem.image_path.path
+        image = image_stream.getvalue() if isinstance(image_stream, BytesIO) else None
+        task = asyncio.create_task(self._generate_image_variants(path, image))
+        # Цикл событий хранит только слабые ссылки на задачи
+        MemService._background_tasks.add(task)
+        task.add_done_callback(MemService._background_tasks.discard)
+        MemService._variant_tasks.setdefault(path, set()).add(task)
+        task.add_done_callback(partial(MemService._discard_variant_task, path))
+
+    @classmethod
+    def _discard_variant_task(cls, path: str, task: asyncio.Task) -> None:
+        """
+        Удаляет завершённую задачу создания вариантов картинки из учёта.
+
+        :param path: Путь оригинальной картинки.
+        :param task: Завершённая задача.
+        """
+        tasks = cls._variant_tasks.get(path)
+        if tasks is not None:
+            tasks.discard(task)
+            if not tasks:
+                del cls._variant_tasks[path]
+
+    @classmethod
+    async def _wait_variant_tasks(cls, path: str) -> None:
+        """
+        Дожидается создания вариантов картинки в этом процессе, чтобы они не были записаны после удаления.
+        Задачи не отменяются: запись в хранилище выполняется в пуле потоков и продолжилась бы после отмены.
+
+        :param path: Путь оригинальной картинки.
+        """
+        tasks = cls._variant_tasks.get(path)
+        if tasks:
+            await asyncio.wait(set(tasks))
+
+    @classmethod
+    async def wait_background_tasks(cls, timeout: float = None) -> None:
+        """
+        Дожидается завершения фоновых задач, например при остановке приложения.
+        Незавершённые за отведённое время задачи отменяются.
+
+        :param timeout: Максимальное время ожидания в секундах, None - без ограничения.
+        """
+        if not cls._background_tasks:
+            return
+        _, pending = await asyncio.wait(set(cls._background_tasks), timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+    async def _generate_image_variants(self, path: str, image: bytes = None) -> None:
+        """
+        Создаёт варианты картинки и сохраняет их в хранилище рядом с оригиналом.
+        Если оригинал удалён, пока создавались варианты, например другим процессом, записанные варианты удаляются.
+
+        :param path: Путь оригинальной картинки.
+        :param image: Данные оригинальной картинки. Если не переданы, читаются из хранилища.
+        """
+        try:
+            if image is None:
+                with await self.image_repository.get_image(path=path) as image_stream:
+                    image = image_stream.getvalue()
+            variants = await self.image_variant_generator.generate(image)
+            await asyncio.gather(*(
+                self.image_repository.save_image(path=variant.path(path), image_stream=BytesIO(variant_image))
+                for variant, variant_image in variants.items()
+            ))
+            try:
+                await self.image_repository.get_image_size(path=path)
+            except ImageNotFoundException:
+                await self._delete_image_variants(path)
+        except Exception:
+            logger.exception('Не удалось создать варианты картинки %s', path)
+
+    async def _delete_mem_image(self, mem: Mem) -> None:
+        """
+        Удаляет картинку мема из хранилища.
+        Картинка, хранящаяся по хэшу, удаляется только после удаления последней ссылки на неё.
+
+        :param mem: Мем, картинка которого удаляется.
+        """
+        if mem.image_hash is None:
+            await self._delete_image_with_variants(mem.image_path.path)
+            return
+
+        # Без счётчиков ссылок неизвестно, используют ли картинку другие мемы, поэтому она не удаляется
+        if self.image_ref_repository is None:
+            return
+        # Картинка удаляется, пока счётчик заблокирован, чтобы параллельная загрузка той же картинки
+        # не получила ссылку на удаляемый объект
+        await self.image_ref_repository.release(
+            mem.image_hash.hash, delete_image=lambda: self._delete_image_with_variants(mem.image_path.path)
+        )
+
+    async def _delete_image_with_variants(self, path: str) -> None:
+        """
+        Удаляет картинку и её варианты из хранилища.
+
+        :param path: Путь оригинальной картинки.
+        """
+        await self._wait_variant_tasks(path)
+        await self.image_repository.delete_image(path=path)
+        await self._delete_image_variants(path)
+
+    async def _delete_image_variants(self, path: str) -> None:
+        """
+        Удаляет варианты картинки из хранилища.
+
+        :param path: Путь оригинальной картинки.
+        """
+        if asyncio.current_task() not in MemService._variant_tasks.get(path, ()):
+            await self._wait_variant_tasks(path)
+        await asyncio.gather(*(self.image_repository.delete_image(path=variant.path(path))
+                               for variant in ImageVariant))
+
+    async def _delete_mem_images(self, memes: list[Mem]) -> None:
+        """
+        Удаляет картинки мемов из хранилища параллельно, не прерываясь на ошибках.
+
+        :param memes: Мемы, картинки которых удаляются.
+        """
+        await asyncio.gather(*(self._delete_mem_image(mem) for mem in memes), return_exceptions=True)
+
     async def get_mem_by_id(self, id_: UUID) -> MemReadSchema:
         """
         Получает информацию о меме по его идентификатору.
@@ -71,6 +370,17 @@ class MemService:
 
         return MemReadSchema.from_entity(mem)
 
+    async def get_memes_by_ids(self, ids: Sequence[UUID]) -> list[MemReadSchema]:
+        """
+        Получает информацию о мемах по списку идентификаторов одним обращением к репозиторию.
+
+        :param ids: Уникальные идентификаторы мемов.
+        :return: Информация о найденных мемах в порядке запрошенных идентификаторов без повторов,
+            не найденные мемы пропускаются.
+        """
+        memes = await self.mem_repository.get_by_ids(ids)
+        return [MemReadSchema.from_entity(mem) for mem in memes]
+
     async def get_mem_image(self, path: str) -> BytesIO:
         """
         Получает картинку меме по пути.
@@ -79,7 +389,61 @@ class MemService:
         :return: Бинарный поток с картинкой мема.
         """
 
-        return self.image_repository.get_image(path=path)
+        return await self.image_repository.get_image(path=path)
+
+    async def stream_mem_image(self, path: str, variant: ImageVariant = None) -> ImageStream:
+        """
+        Открывает картинку мема по пути для чтения по частям.
+        Если вариант картинки ещё не создан, открывается оригинал.
+
+        :param path: Путь к картинке мема.
+        :param variant: Вариант картинки уменьшенного размера, None для оригинала.
+        :return: Поток с частями картинки мема.
+        :raise ImageNotFoundException: Картинка не найдена в хранилище.
+        """
+        if variant is not None:
+            try:
+                image_stream = await self.image_repository.stream_image(path=variant.path(path))
+                image_stream.media_type = 'image/webp'
+                return image_stream
+            except ImageNotFoundException:
+                pass
+
+        return await self.image_repository.stream_image(path=path)
+
+    async def get_mem_image_size(self, path: str) -> int:
+        """
+        Получает размер картинки мема без чтения её данных.
+
+        :param path: Путь к картинке мема.
+        :return: Размер картинки в байтах.
+        :raise ImageNotFoundException: Картинка не найдена в хранилище.
+        """
+
+        return await self.image_repository.get_image_size(path=path)
+
+    async def stream_mem_image_range(self, path: str, byte_range: ByteRange) -> ImageStream:
+        """
+        Открывает диапазон байтов картинки мема для чтения по частям.
+
+        :param path: Путь к картинке мема.
+        :param byte_range: Диапазон байтов в пределах картинки.
+        :return: Поток с частями диапазона.
+        :raise ImageNotFoundException: Картинка не найдена в хранилище.
+        """
+
+        return await self.image_repository.stream_image_range(path=path, byte_range=byte_range)
+
+    async def get_mem_image_url(self, path: str, internal: bool = False) -> str:
+        """
+        Получает временную ссылку на картинку мема в хранилище.
+
+        :param path: Путь к картинке мема.
+        :param internal: Ссылка для использования внутри сети приложения, иначе - для клиентов.
+        :return: Ссылка на картинку мема.
+        """
+
+        return await self.image_repository.get_image_url(path=path, internal=internal)
 
     async def get_all_memes(self, mem_filter_params: MemFilterParams) -> list[MemReadSchema]:
         """
@@ -90,36 +454,86 @@ class MemService:
         memes = await self.mem_repository.get_by_filter(mem_filter_params=mem_filter_params)
         return [MemReadSchema.from_entity(mem) for mem in memes]
 
-    async def update_mem(self, data: MemUpdateSchema, image_stream: BytesIO = None) -> MemReadSchema:
+    async def export_memes(self, batch_size: int) -> AsyncIterator[MemReadSchema]:
+        """
+        Последовательно получает информацию о всех мемах для выгрузки, не загружая их целиком в память.
+
+        :param batch_size: Количество мемов, получаемых из репозитория за раз.
+        :return: Асинхронный итератор с информацией о мемах.
+        """
+        async for mem in self.mem_repository.stream_all(batch_size=batch_size):
+            yield MemReadSchema.from_entity(mem)
+
+    async def get_memes_page(self, mem_filter_params: MemFilterParams) -> MemPageSchema:
+        """
+        Получает страницу мемов по фильтру вместе с курсором следующей страницы и общим количеством мемов.
+        Наличие следующей страницы определяется по одному лишнему мему в выборке, без отдельного запроса.
+
+        :param mem_filter_params: Параметры фильтра.
+        :return: Страница мемов.
+        :raise InvalidMemCursorError: Некорректный курсор.
+        """
+        per_page = mem_filter_params.per_page
+        memes = await self.mem_repository.get_by_filter(mem_filter_params=mem_filter_params, limit=per_page + 1)
+        has_next = len(memes) > per_page
+        memes = memes[:per_page]
+
+        next_cursor = None
+        if has_next:
+            next_cursor = MemCursor(uuid=memes[-1].uuid.uuid).encode()
+
+        mem_count = await self.mem_repository.count(q=mem_filter_params.q)
+        return MemPageSchema(items=[MemReadSchema.from_entity(mem) for mem in memes],
+                             next_cursor=next_cursor,
+                             has_next=has_next,
+                             total=mem_count.value,
+                             total_is_estimate=mem_count.is_estimate)
+
+    async def update_mem(self, data: MemUpdateSchema,
+                         image_stream: BytesIO | ImageUploadStream = None) -> MemReadSchema:
         """
         Обновляет мем.
 
         :param data: Данные для обновления мема.
-        :param image_stream: Двоичный поток с данными изображения.
+        :param image_stream: Двоичный поток с данными изображения или поток загружаемого изображения.
         :return: Информация обновленного мема.
         :raise MemNotFoundException: Обновление мема, который не найден.
         :raise MemExistsException: Добавление мема, который уже существует.
+        :raise ImageTooLargeException: Размер загружаемого изображения превышает максимальный.
         """
         new_mem = Mem(
             uuid=MemUUID(data.uuid),
             text=MemText(data.text)
         )
-        try:
-            old_mem = await self.mem_repository.get_by_id(data.uuid)
-            if old_mem.image_path:
-                self.image_repository.delete_image(old_mem.image_path.path)
-
-            if image_stream:
-                new_mem.upload_image()
-                self.image_repository.save_image(path=new_mem.image_path.path, image_stream=image_stream)
+        # Мем читается с основной базы данных без блокировки строки: одновременные обновления не согласуются,
+        # сохраняется последнее
+        old_mem = await self.mem_repository.get_by_id(data.uuid, use_primary=True)
+        if old_mem is None:
+            raise MemNotFoundException
 
-            await self.mem_repository.update(new_mem)
-        except EntityNotFoundException as e:
+        # Старая картинка удаляется только после успешного обновления: загрузка может прерваться,
+        # например из-за превышения размера, и тогда мем должен остаться со старой картинкой
+        image_uploaded = bool(image_stream) and await self._save_mem_image(new_mem, image_stream)
+        try:
+            updated_mem = await self.mem_repository.update(new_mem)
+        except (EntityNotFoundException, EntityExistsException) as e:
+            # Ссылка на картинку по хэшу освобождается всегда, картинка без хэша - если она не перезаписала старую
+            if new_mem.image_path and (new_mem.image_hash is not None or new_mem.image_path != old_mem.image_path):
+                await self._delete_mem_image(new_mem)
+            if isinstance(e, EntityExistsException):
+                raise MemExistsException from e
             raise MemNotFoundException from e
-        except EntityExistsException as e:
-            raise MemExistsException from e
 
-        return MemReadSchema.from_entity(new_mem)
+        if old_mem.image_path:
+            if old_mem.image_hash is None and new_mem.image_path == old_mem.image_path:
+                # Картинка перезаписана по тому же пути, устарели только её варианты
+                await self._delete_image_variants(old_mem.image_path.path)
+            else:
+                await self._delete_mem_image(old_mem)
+
+        if image_uploaded:
+            self._schedule_image_variants(new_mem, image_stream)
+        return MemReadSchema.from_entity(updated_mem)
 
     async def delete_mem_by_id(self, id_: UUID) -> None:
         """
@@ -129,9 +543,9 @@ class MemService:
         """
 
         try:
-            mem = await self.mem_repository.get_by_id(id_)
+            mem = await self.mem_repository.get_by_id(id_, use_primary=True)
             await self.mem_repository.delete_by_id(id_)
             if mem.image_path:
-                self.image_repository.delete_image(mem.image_path.path)
+                await self._delete_mem_image(mem)
         except EntityNotFoundException as e:
             raise MemNotFoundException from e
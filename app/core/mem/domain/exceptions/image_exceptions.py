@@ -0,0 +1,34 @@
+"""
+Исключения для изображений мемов.
+"""
+
+from app.core.mem.domain.exceptions.base_mem_exceptions import MemException, MemValidationException
+
+
+class ImageNotFoundException(MemException):
+    """
+    Исключение, возникающее если изображение не найдено в хранилище.
+    """
+    def __init__(self, msg: str = 'Изображение не найдено'):
+        """
+        Конструктор ImageNotFoundException.
+
+        :param msg: Сообщение исключения.
+        """
+        super().__init__(msg)
+
+
+class ImageTooLargeException(MemValidationException):
+    """
+    Исключение, возникающее при превышении максимального размера загружаемого изображения.
+    """
+    def __init__(self, msg: str = 'Изображение слишком большое', max_size: int = None):
+        """
+        Конструктор ImageTooLargeException.
+
+        :param msg: Сообщение исключения.
+        :param max_size: Максимальный размер изображения в байтах.
+        """
+        if max_size:
+            msg = f'{msg} [{max_size} байт]'
+        super().__init__(msg)
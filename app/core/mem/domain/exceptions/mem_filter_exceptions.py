@@ -0,0 +1,18 @@
+"""
+Исключения для фильтрации мемов в доменном слое.
+"""
+
+from app.core.mem.domain.exceptions.base_mem_exceptions import MemValidationException
+
+
+class InvalidMemCursorError(MemValidationException):
+    """
+    Исключение, возникающее при некорректном курсоре постраничной выборки мемов.
+    """
+    def __init__(self, msg: str = 'Некорректный курсор'):
+        """
+        Конструктор InvalidMemCursorError.
+
+        :param msg: Сообщение исключения.
+        """
+        super().__init__(msg)
@@ -0,0 +1,35 @@
+"""
+Интерфейс репозитория счётчиков ссылок на картинки ImageRefRepository.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
+
+class ImageRefRepository(ABC):
+    """
+    Интерфейс репозитория счётчиков ссылок мемов на картинки, хранящиеся по хэшу содержимого.
+    """
+
+    @abstractmethod
+    async def acquire(self, image_hash: str) -> int:
+        """
+        Добавляет ссылку на картинку.
+
+        :param image_hash: Хэш содержимого картинки.
+        :return: Количество ссылок на картинку после добавления. 1 означает, что картинки ещё нет в хранилище.
+        """
+        ...
+
+    @abstractmethod
+    async def release(self, image_hash: str, delete_image: Callable[[], Awaitable[None]] = None) -> int:
+        """
+        Удаляет ссылку на картинку.
+        Картинка без ссылок удаляется из хранилища функцией `delete_image`, пока счётчик заблокирован:
+        параллельное добавление ссылки на ту же картинку дожидается удаления и загружает картинку заново.
+
+        :param image_hash: Хэш содержимого картинки.
+        :param delete_image: Функция удаления картинки из хранилища, вызываемая после удаления последней ссылки.
+        :return: Количество оставшихся ссылок на картинку.
+        """
+        ...
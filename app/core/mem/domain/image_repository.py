@@ -3,15 +3,19 @@
 """
 from abc import ABC, abstractmethod
 from io import BytesIO
+from typing import AsyncIterator
+
+from app.core.mem.domain.utils.byte_range import ByteRange
+from app.core.mem.domain.utils.image_stream import ImageStream
 
 
 class ImageRepository(ABC):
     """
-    Интерфейс репозитория для изображений мемов.
+    Асинхронный интерфейс репозитория для изображений мемов.
     """
 
     @abstractmethod
-    def save_image(self, path: str, image_stream: BytesIO) -> None:
+    async def save_image(self, path: str, image_stream: BytesIO) -> None:
         """
         Сохраняет изображение в хранилище.
         :param path: Путь для изображения.
@@ -20,7 +24,26 @@ class ImageRepository(ABC):
         ...
 
     @abstractmethod
-    def get_image(self, path: str) -> BytesIO:
+    async def save_image_stream(self, path: str, chunks: AsyncIterator[bytes]) -> int:
+        """
+        Сохраняет изображение в хранилище по частям по мере их получения.
+        :param path: Путь для изображения.
+        :param chunks: Асинхронный итератор частей изображения.
+        :return: Размер сохранённого изображения в байтах.
+        """
+        ...
+
+    @abstractmethod
+    async def copy_image(self, source_path: str, path: str) -> None:
+        """
+        Копирует изображение внутри хранилища.
+        :param source_path: Путь копируемого изображения.
+        :param path: Путь для копии изображения.
+        """
+        ...
+
+    @abstractmethod
+    async def get_image(self, path: str) -> BytesIO:
         """
         Получает изображение из хранилища.
         :param path: Путь изображения.
@@ -29,7 +52,50 @@ class ImageRepository(ABC):
         ...
 
     @abstractmethod
-    def delete_image(self, path: str) -> None:
+    async def stream_image(self, path: str) -> ImageStream:
+        """
+        Открывает изображение в хранилище для чтения по частям.
+        :param path: Путь изображения.
+        :return: Поток с частями изображения.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        ...
+
+    @abstractmethod
+    async def get_image_size(self, path: str) -> int:
+        """
+        Получает размер изображения без чтения его данных.
+        :param path: Путь изображения.
+        :return: Размер изображения в байтах.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        ...
+
+    @abstractmethod
+    async def stream_image_range(self, path: str, byte_range: ByteRange) -> ImageStream:
+        """
+        Открывает диапазон байтов изображения для чтения по частям.
+        Из хранилища читается только запрошенный диапазон.
+        :param path: Путь изображения.
+        :param byte_range: Диапазон байтов в пределах изображения.
+        :return: Поток с частями диапазона.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        ...
+
+    @abstractmethod
+    async def get_image_url(self, path: str, internal: bool = False) -> str:
+        """
+        Получает временную ссылку на изображение для скачивания напрямую из хранилища.
+        :param path: Путь изображения.
+        :param internal: Ссылка для использования внутри сети приложения (например, прокси-сервером),
+            иначе - для клиентов.
+        :return: Ссылка на изображение.
+        """
+        ...
+
+    @abstractmethod
+    async def delete_image(self, path: str) -> None:
         """
         Удаляет изображение из хранилища.
         :param path: Путь изображения.
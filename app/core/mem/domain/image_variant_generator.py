@@ -0,0 +1,22 @@
+"""
+Интерфейс генератора вариантов картинок ImageVariantGenerator.
+"""
+from abc import ABC, abstractmethod
+
+from app.core.mem.domain.utils.image_variant import ImageVariant
+
+
+class ImageVariantGenerator(ABC):
+    """
+    Интерфейс генератора вариантов картинок мемов уменьшенного размера.
+    """
+
+    @abstractmethod
+    async def generate(self, image: bytes) -> dict[ImageVariant, bytes]:
+        """
+        Создаёт варианты картинки.
+
+        :param image: Данные оригинальной картинки.
+        :return: Данные вариантов картинки в формате WebP.
+        """
+        ...
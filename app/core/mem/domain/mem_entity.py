@@ -2,8 +2,10 @@
 Сущность мема.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
+from app.core.mem.domain.value_objects.image_hash import ImageHash
 from app.core.mem.domain.value_objects.image_path import ImagePath
 from app.core.mem.domain.value_objects.mem_text import MemText
 from app.core.mem.domain.value_objects.mem_uuid import MemUUID
@@ -18,13 +20,24 @@ class Mem(BaseEntity):
     :cvar uuid: Уникальный идентификатор мема.
     :cvar text: Текст мема.
     :cvar image_path: Путь к изображению мема в S3 хранилище.
+    :cvar image_hash: Хэш содержимого изображения, если изображение хранится по хэшу и может быть общим
+        для нескольких мемов.
+    :cvar version: Версия мема, увеличивается при каждом обновлении.
+    :cvar updated_at: Время последнего изменения мема.
     """
 
     uuid: MemUUID
     text: MemText
     image_path: ImagePath | None = None
+    image_hash: ImageHash | None = None
+    version: int = 1
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
-    def upload_image(self, image_path: ImagePath = None):
+    def upload_image(self, image_path: ImagePath = None, image_hash: ImageHash = None):
         if not image_path:
-            image_path = ImagePath(path=f'mem_{self.uuid.uuid}')
+            if image_hash:
+                image_path = ImagePath(path=f'image_{image_hash.hash}')
+            else:
+                image_path = ImagePath(path=f'mem_{self.uuid.uuid}')
         self.image_path = image_path
+        self.image_hash = image_hash
@@ -3,9 +3,11 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Sequence, AsyncIterator
+from uuid import UUID
 
 from app.core.mem.domain.mem_entity import Mem
+from app.core.mem.domain.utils.mem_count import MemCount
 from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
 from app.core.shared_kernel.domain.repository import BaseRepository
 
@@ -16,11 +18,47 @@ class MemRepository(BaseRepository[Mem], ABC):
     """
 
     @abstractmethod
-    async def get_by_filter(self, mem_filter_params: MemFilterParams) -> Sequence[Mem]:
+    async def get_by_filter(self, mem_filter_params: MemFilterParams, limit: int = None) -> Sequence[Mem]:
         """
-        Получает сущность мема по фильтру.
+        Получает сущности мемов по фильтру в порядке их идентификаторов.
 
         :param mem_filter_params: Параметры фильтра.
+        :param limit: Максимальное количество мемов, по умолчанию - размер страницы.
+            Смещение страницы всегда вычисляется по размеру страницы.
         :return: Список отфильтрованных мемов.
+        :raise InvalidMemCursorError: Некорректный курсор.
+        """
+        ...
+
+    @abstractmethod
+    async def get_by_ids(self, ids: Sequence[UUID]) -> Sequence[Mem]:
+        """
+        Получает сущности мемов по списку идентификаторов одним запросом.
+
+        :param ids: Уникальные идентификаторы мемов.
+        :return: Найденные мемы в порядке запрошенных идентификаторов без повторов,
+            не найденные мемы пропускаются.
+        """
+        ...
+
+    @abstractmethod
+    async def count(self, q: str | None = None) -> MemCount:
+        """
+        Получает общее количество мемов, при поисковом запросе - количество найденных мемов.
+        Для больших выборок может вернуть оценку вместо точного количества.
+
+        :param q: Поисковый запрос по тексту мемов.
+        :return: Количество мемов.
+        """
+        ...
+
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> AsyncIterator[Mem]:
+        """
+        Последовательно получает все мемы в порядке их идентификаторов,
+        не загружая их целиком в память.
+
+        :param batch_size: Количество мемов, получаемых из хранилища за раз.
+        :return: Асинхронный итератор мемов.
         """
         ...
@@ -0,0 +1,24 @@
+"""
+Диапазон байтов изображения ByteRange.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class ByteRange:
+    """
+    Диапазон байтов изображения.
+
+    :ivar start: Номер первого байта, начиная с 0.
+    :ivar end: Номер последнего байта включительно.
+    """
+
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        """
+        Количество байтов в диапазоне.
+        """
+        return self.end - self.start + 1
@@ -0,0 +1,20 @@
+"""
+Поток с данными изображения, читаемый по частям.
+"""
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+
+@dataclass(slots=True)
+class ImageStream:
+    """
+    Поток с данными изображения, читаемый по частям.
+
+    :ivar chunks: Асинхронный итератор частей изображения.
+    :ivar size: Размер изображения в байтах, если известен.
+    :ivar media_type: MIME-тип изображения.
+    """
+
+    chunks: AsyncIterator[bytes]
+    size: int | None = None
+    media_type: str = 'image/png'
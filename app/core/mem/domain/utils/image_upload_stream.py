@@ -0,0 +1,86 @@
+"""
+Поток загружаемого изображения ImageUploadStream и общий лимит размера пакета загрузок ImageUploadBatch.
+"""
+import hashlib
+from typing import AsyncIterator
+
+from app.core.mem.domain.exceptions.image_exceptions import ImageTooLargeException
+
+
+class ImageUploadBatch:
+    """
+    Общий лимит суммарного размера изображений, загружаемых в одном запросе.
+
+    :ivar max_size: Максимальный суммарный размер изображений в байтах.
+    :ivar size: Суммарный размер прочитанных частей изображений в байтах.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Конструктор ImageUploadBatch.
+
+        :param max_size: Максимальный суммарный размер изображений в байтах.
+        """
+        self.max_size = max_size
+        self.size = 0
+
+    def add(self, size: int) -> None:
+        """
+        Учитывает прочитанную часть изображения.
+
+        :param size: Размер части в байтах.
+        :raise ImageTooLargeException: Суммарный размер изображений превышает максимальный.
+        """
+        self.size += size
+        if self.size > self.max_size:
+            raise ImageTooLargeException(msg='Суммарный размер изображений слишком большой', max_size=self.max_size)
+
+
+class ImageUploadStream:
+    """
+    Поток загружаемого изображения.
+    Пропускает через себя части изображения, считая размер и хэш содержимого,
+    и прерывает загрузку, как только размер превышает максимальный.
+
+    :ivar max_size: Максимальный размер изображения в байтах.
+    :ivar size: Размер прочитанной части изображения в байтах.
+    :ivar batch: Общий лимит размера изображений запроса, в котором учитывается это изображение.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], max_size: int, batch: ImageUploadBatch = None):
+        """
+        Конструктор ImageUploadStream.
+
+        :param chunks: Асинхронный итератор частей изображения.
+        :param max_size: Максимальный размер изображения в байтах.
+        :param batch: Общий лимит размера изображений запроса, None - без общего лимита.
+        """
+        self._chunks = chunks
+        self._hash = hashlib.sha256()
+        self.max_size = max_size
+        self.size = 0
+        self.batch = batch
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """
+        Читает части изображения.
+
+        :return: Асинхронный итератор частей изображения.
+        :raise ImageTooLargeException: Размер изображения или суммарный размер изображений запроса
+            превышает максимальный.
+        """
+        async for chunk in self._chunks:
+            self.size += len(chunk)
+            if self.size > self.max_size:
+                raise ImageTooLargeException(max_size=self.max_size)
+            if self.batch is not None:
+                self.batch.add(len(chunk))
+            self._hash.update(chunk)
+            yield chunk
+
+    @property
+    def hash(self) -> str:
+        """
+        SHA-256 хэш прочитанного содержимого в шестнадцатеричном виде.
+        """
+        return self._hash.hexdigest()
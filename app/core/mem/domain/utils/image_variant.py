@@ -0,0 +1,24 @@
+"""
+Вариант картинки мема уменьшенного размера ImageVariant.
+"""
+from enum import Enum
+
+
+class ImageVariant(str, Enum):
+    """
+    Вариант картинки мема уменьшенного размера в формате WebP.
+
+    :cvar THUMB: Миниатюра для списков мемов.
+    :cvar MEDIUM: Картинка среднего размера.
+    """
+    THUMB = 'thumb'
+    MEDIUM = 'medium'
+
+    def path(self, image_path: str) -> str:
+        """
+        Получает путь варианта картинки рядом с оригиналом.
+
+        :param image_path: Путь оригинальной картинки.
+        :return: Путь варианта картинки.
+        """
+        return f'{image_path}_{self.value}.webp'
@@ -0,0 +1,18 @@
+"""
+Количество мемов MemCount.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class MemCount:
+    """
+    Количество мемов, точное или оценочное.
+
+    :ivar value: Количество мемов.
+    :ivar is_estimate: Является ли количество оценкой: по статистике таблицы или нижней границей,
+        если точный подсчёт слишком дорог.
+    """
+
+    value: int
+    is_estimate: bool = False
@@ -0,0 +1,50 @@
+"""
+Курсор постраничной выборки мемов.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.core.mem.domain.exceptions.mem_filter_exceptions import InvalidMemCursorError
+
+
+@dataclass(slots=True)
+class MemCursor:
+    """
+    Курсор постраничной выборки мемов.
+    Указывает на последний мем страницы, следующая страница начинается после него.
+    Для клиентов курсор непрозрачен и передаётся как строка.
+
+    :ivar uuid: Уникальный идентификатор последнего мема страницы.
+    """
+
+    uuid: UUID
+
+    def encode(self) -> str:
+        """
+        Кодирует курсор в строку.
+
+        :return: Строка курсора.
+        """
+        payload = json.dumps({'id': str(self.uuid)}, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, cursor: str) -> "MemCursor":
+        """
+        Декодирует курсор из строки.
+
+        :param cursor: Строка курсора.
+        :return: Курсор.
+        :raise InvalidMemCursorError: Строка не является курсором.
+        """
+        try:
+            payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            data = json.loads(payload)
+            if not isinstance(data, dict) or not isinstance(data.get('id'), str):
+                raise InvalidMemCursorError
+            return cls(uuid=UUID(data['id']))
+        except (binascii.Error, ValueError, TypeError, KeyError) as e:
+            raise InvalidMemCursorError from e
@@ -2,5 +2,17 @@ from pydantic import BaseModel, Field
 
 
 class MemFilterParams(BaseModel):
-    page: int = Field(gt=0)
+    """
+    Параметры фильтрации мемов.
+
+    :cvar page: Номер страницы, используется если не передан курсор.
+    :cvar per_page: Количество мемов на странице.
+    :cvar after: Курсор, после которого начинается страница.
+    :cvar q: Поисковый запрос по тексту мемов, найденные мемы упорядочиваются по релевантности.
+        Поддерживает синтаксис веб-поиска: фразы в кавычках, `or` и исключение слов через `-`.
+    """
+
+    page: int = Field(default=1, gt=0)
     per_page: int = Field(gt=0)
+    after: str | None = None
+    q: str | None = Field(default=None, min_length=1, max_length=256)
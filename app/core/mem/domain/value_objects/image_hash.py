@@ -0,0 +1,25 @@
+"""
+Объект значение хэша содержимого картинки мема.
+"""
+
+from dataclasses import dataclass
+
+from app.core.mem.domain.exceptions.base_mem_exceptions import MemTypeError
+
+
+@dataclass(slots=True)
+class ImageHash:
+    """
+    Объект значение хэша содержимого картинки мема.
+
+    :ivar hash: SHA-256 хэш содержимого картинки в шестнадцатеричном виде.
+    """
+
+    hash: str
+
+    def __post_init__(self):
+        """
+        Проверяет хэш на тип данных
+        """
+        if not isinstance(self.hash, str):
+            raise MemTypeError(extra_msg_exception='Хэш картинки мема должен быть типа `str`')
@@ -0,0 +1,70 @@
+"""
+Генератор вариантов картинок на Pillow PillowImageVariantGenerator.
+"""
+import asyncio
+from concurrent.futures import Executor
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+from app.core.mem.domain.image_variant_generator import ImageVariantGenerator
+from app.core.mem.domain.utils.image_variant import ImageVariant
+
+
+def _resize_to_webp(image: bytes, sizes: dict[ImageVariant, int], quality: int) -> dict[ImageVariant, bytes]:
+    """
+    Уменьшает картинку до каждого из размеров с сохранением пропорций и кодирует в WebP.
+    Картинки меньше размера варианта не увеличиваются.
+
+    :param image: Данные оригинальной картинки.
+    :param sizes: Максимальный размер большей стороны для каждого варианта.
+    :param quality: Качество WebP от 0 до 100.
+    :return: Данные вариантов картинки.
+    """
+    with Image.open(BytesIO(image)) as original:
+        original = ImageOps.exif_transpose(original)
+        if original.mode not in ('RGB', 'RGBA'):
+            original = original.convert('RGBA' if 'transparency' in original.info else 'RGB')
+
+        variants = {}
+        for variant, size in sizes.items():
+            resized = original.copy()
+            resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+            output = BytesIO()
+            resized.save(output, format='WEBP', quality=quality)
+            variants[variant] = output.getvalue()
+        return variants
+
+
+class PillowImageVariantGenerator(ImageVariantGenerator):
+    """
+    Генератор вариантов картинок на Pillow.
+    Декодирование и кодирование картинок затратны по CPU, поэтому выполняются в отдельном пуле.
+
+    :ivar sizes: Максимальный размер большей стороны для каждого варианта.
+    :ivar quality: Качество WebP от 0 до 100.
+    :ivar executor: Пул для обработки картинок.
+    """
+
+    def __init__(self, sizes: dict[ImageVariant, int], quality: int = 80, executor: Executor = None):
+        """
+        Конструктор PillowImageVariantGenerator.
+
+        :param sizes: Максимальный размер большей стороны для каждого варианта.
+        :param quality: Качество WebP от 0 до 100.
+        :param executor: Пул для обработки картинок.
+            Если не передан, используется пул цикла событий по умолчанию.
+        """
+        self.sizes = sizes
+        self.quality = quality
+        self.executor = executor
+
+    async def generate(self, image: bytes) -> dict[ImageVariant, bytes]:
+        """
+        Создаёт варианты картинки в пуле, не блокируя цикл событий.
+
+        :param image: Данные оригинальной картинки.
+        :return: Данные вариантов картинки в формате WebP.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _resize_to_webp, image, self.sizes, self.quality)
@@ -0,0 +1,24 @@
+"""
+ImageRefDao модель DAO для счётчиков ссылок на картинки в базе данных.
+"""
+
+from sqlalchemy import String
+from sqlalchemy.orm import MappedColumn, mapped_column
+
+from app.core.shared_kernel.db.dao import BaseDao
+
+
+class ImageRefDao(BaseDao):
+    """
+    Модель DAO для счётчиков ссылок мемов на картинки, хранящиеся по хэшу содержимого.
+    Не соответствует сущности доменной области.
+
+    :cvar __tablename__: Название таблицы в базе данных.
+    :cvar hash: Хэш содержимого картинки, первичный ключ.
+    :cvar ref_count: Количество мемов, ссылающихся на картинку.
+    """
+
+    __tablename__ = "image_refs"
+
+    hash: MappedColumn[str] = mapped_column(String(64), primary_key=True)
+    ref_count: MappedColumn[int] = mapped_column(default=0)
@@ -2,17 +2,22 @@
 MemDao модель DAO для работы с мемами в базе данных.
 """
 
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import String
+from sqlalchemy import String, DateTime, func, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import MappedColumn, mapped_column
 
 from app.core.mem.domain.mem_entity import Mem
+from app.core.mem.domain.value_objects.image_hash import ImageHash
 from app.core.mem.domain.value_objects.image_path import ImagePath
 from app.core.mem.domain.value_objects.mem_text import MemText
 from app.core.mem.domain.value_objects.mem_uuid import MemUUID
 from app.core.shared_kernel.db.dao import BaseDao
 
+TEXT_SEARCH_CONFIG = 'russian'
+
 
 class MemDao(BaseDao):
     """
@@ -22,13 +27,28 @@ class MemDao(BaseDao):
     :cvar id: Уникальный идентификатор мема, первичный ключ.
     :cvar text: Текст мема.
     :cvar image_path: Путь к картинке мема.
+    :cvar image_hash: Хэш содержимого картинки мема, если картинка хранится по хэшу.
+    :cvar version: Версия мема, увеличивается при каждом обновлении.
+    :cvar updated_at: Время последнего изменения мема.
+    :cvar text_search: Поисковый вектор текста мема, вычисляется базой данных.
+        Не загружается вместе с мемом, используется только в условиях полнотекстового поиска.
     """
 
     __tablename__ = "memes"
+    __table_args__ = (
+        Index('ix_memes_text_search', 'text_search', postgresql_using='gin'),
+    )
 
     id: MappedColumn[UUID] = mapped_column(primary_key=True)
     text: MappedColumn[str] = mapped_column(String)
     image_path: MappedColumn[str | None] = mapped_column(String, nullable=True)
+    image_hash: MappedColumn[str | None] = mapped_column(String(64), nullable=True, index=True)
+    version: MappedColumn[int] = mapped_column(server_default='1')
+    updated_at: MappedColumn[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    text_search: MappedColumn[str] = mapped_column(TSVECTOR,
+                                                   Computed(f"to_tsvector('{TEXT_SEARCH_CONFIG}', text)",
+                                                            persisted=True),
+                                                   deferred=True)
 
     def to_entity(self) -> Mem:
         """
@@ -37,11 +57,15 @@ class MemDao(BaseDao):
         :return: Созданная сущность мема.
         """
         image_path = ImagePath(self.image_path) if self.image_path else None
+        image_hash = ImageHash(self.image_hash) if self.image_hash else None
 
         return Mem(
             uuid=MemUUID(self.id),
             text=MemText(self.text),
-            image_path=image_path
+            image_path=image_path,
+            image_hash=image_hash,
+            version=self.version,
+            updated_at=self.updated_at
         )
 
     @classmethod
@@ -53,9 +77,13 @@ class MemDao(BaseDao):
         :return: Созданная модель DAO мема.
         """
         image_path = entity.image_path.path if entity.image_path else None
+        image_hash = entity.image_hash.hash if entity.image_hash else None
 
         return cls(
             id=entity.uuid.uuid,
             text=entity.text.text,
-            image_path=image_path
+            image_path=image_path,
+            image_hash=image_hash,
+            version=entity.version,
+            updated_at=entity.updated_at
         )
@@ -0,0 +1,179 @@
+"""
+Кэширующий репозиторий мемов CachedMemRepository.
+"""
+from typing import Sequence, AsyncIterator
+from uuid import UUID
+
+from app.core.mem.domain.mem_entity import Mem
+from app.core.mem.domain.mem_repository import MemRepository
+from app.core.mem.domain.utils.mem_count import MemCount
+from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
+from app.core.shared_kernel.cache.lru_ttl_cache import LRUTTLCache
+
+
+class CachedMemRepository(MemRepository):
+    """
+    Кэширующий репозиторий мемов.
+    Оборачивает другой репозиторий мемов и кэширует получение мема по идентификатору.
+    При изменении или удалении мема запись в кэше сбрасывается, а мем, прочитанный
+    одновременно с изменением, не сохраняется в кэш.
+
+    Кэш общий для всех запросов процесса, поэтому изменения, сделанные другими процессами,
+    становятся видны не позже истечения времени жизни записи.
+
+    :ivar repository: Оборачиваемый репозиторий мемов.
+    :ivar cache: Кэш мемов по идентификатору.
+    :ivar count_cache: Кэш количества мемов по поисковому запросу, None - количество не кэшируется.
+    """
+
+    def __init__(self, repository: MemRepository, cache: LRUTTLCache[UUID, Mem],
+                 count_cache: LRUTTLCache[str | None, MemCount] = None):
+        """
+        Конструктор CachedMemRepository.
+
+        :param repository: Оборачиваемый репозиторий мемов.
+        :param cache: Кэш мемов по идентификатору.
+        :param count_cache: Кэш количества мемов по поисковому запросу, None - количество не кэшируется.
+        """
+        self.repository = repository
+        self.cache = cache
+        self.count_cache = count_cache
+
+    async def add(self, entity: Mem | list[Mem]) -> Mem | Sequence[Mem]:
+        """
+        Добавляет мем и сбрасывает его запись в кэше.
+
+        :param entity: Мем или список мемов для добавления.
+        :return: Добавленный мем или список добавленных мемов.
+        """
+        entities = entity if isinstance(entity, list) else [entity]
+        try:
+            return await self.repository.add(entity)
+        finally:
+            for mem in entities:
+                self.cache.delete(mem.uuid.uuid)
+            self._clear_count_cache()
+
+    async def update(self, entity: Mem) -> Mem:
+        """
+        Обновляет мем и сбрасывает его запись в кэше.
+
+        :param entity: Мем для обновления.
+        :return: Обновлённый мем.
+        """
+        try:
+            return await self.repository.update(entity)
+        finally:
+            self.cache.delete(entity.uuid.uuid)
+
+    async def get_by_id(self, id_: UUID, use_primary: bool = False) -> Mem | None:
+        """
+        Получает мем по идентификатору из кэша или из оборачиваемого репозитория.
+        Мем с чтением из основного хранилища всегда получается из оборачиваемого репозитория.
+
+        :param id_: Уникальный идентификатор мема.
+        :param use_primary: Получить мем из основного хранилища, минуя кэш и реплики.
+        :return: Мем или None, если мем не был найден.
+        """
+        if use_primary:
+            return await self.repository.get_by_id(id_, use_primary=True)
+
+        mem = self.cache.get(id_)
+        if mem is not None:
+            return mem
+
+        generation = self.cache.generation
+        mem = await self.repository.get_by_id(id_)
+        if mem is not None:
+            self.cache.set(id_, mem, generation=generation)
+        return mem
+
+    async def get_by_ids(self, ids: Sequence[UUID]) -> Sequence[Mem]:
+        """
+        Получает мемы по списку идентификаторов: найденные в кэше - из кэша,
+        остальные - одним запросом к оборачиваемому репозиторию.
+
+        :param ids: Уникальные идентификаторы мемов.
+        :return: Найденные мемы в порядке запрошенных идентификаторов без повторов,
+            не найденные мемы пропускаются.
+        """
+        ids = list(dict.fromkeys(ids))
+        memes_by_id = {}
+        missing_ids = []
+        for id_ in ids:
+            mem = self.cache.get(id_)
+            if mem is None:
+                missing_ids.append(id_)
+            else:
+                memes_by_id[id_] = mem
+
+        if missing_ids:
+            generation = self.cache.generation
+            for mem in await self.repository.get_by_ids(missing_ids):
+                self.cache.set(mem.uuid.uuid, mem, generation=generation)
+                memes_by_id[mem.uuid.uuid] = mem
+        return [memes_by_id[id_] for id_ in ids if id_ in memes_by_id]
+
+    async def get_all(self) -> Sequence[Mem]:
+        """
+        Получает все мемы.
+
+        :return: Список мемов.
+        """
+        return await self.repository.get_all()
+
+    async def get_by_filter(self, mem_filter_params: MemFilterParams, limit: int = None) -> Sequence[Mem]:
+        """
+        Получает мемы по фильтру.
+
+        :param mem_filter_params: Параметры фильтра.
+        :param limit: Максимальное количество мемов, по умолчанию - размер страницы.
+        :return: Список отфильтрованных мемов.
+        """
+        return await self.repository.get_by_filter(mem_filter_params=mem_filter_params, limit=limit)
+
+    async def count(self, q: str | None = None) -> MemCount:
+        """
+        Получает количество мемов из кэша или из оборачиваемого репозитория.
+        Кэш сбрасывается при добавлении и удалении мемов в этом процессе.
+
+        :param q: Поисковый запрос по тексту мемов.
+        :return: Количество мемов.
+        """
+        if self.count_cache is None:
+            return await self.repository.count(q=q)
+
+        mem_count = self.count_cache.get(q)
+        if mem_count is None:
+            generation = self.count_cache.generation
+            mem_count = await self.repository.count(q=q)
+            self.count_cache.set(q, mem_count, generation=generation)
+        return mem_count
+
+    def stream_all(self, batch_size: int) -> AsyncIterator[Mem]:
+        """
+        Последовательно получает все мемы из оборачиваемого репозитория, минуя кэш.
+
+        :param batch_size: Количество мемов, получаемых из хранилища за раз.
+        :return: Асинхронный итератор мемов.
+        """
+        return self.repository.stream_all(batch_size=batch_size)
+
+    async def delete_by_id(self, id_: UUID) -> None:
+        """
+        Удаляет мем по идентификатору и сбрасывает его запись в кэше.
+
+        :param id_: Уникальный идентификатор мема.
+        """
+        try:
+            await self.repository.delete_by_id(id_)
+        finally:
+            self.cache.delete(id_)
+            self._clear_count_cache()
+
+    def _clear_count_cache(self) -> None:
+        """
+        Сбрасывает кэш количества мемов.
+        """
+        if self.count_cache is not None:
+            self.count_cache.clear()
@@ -0,0 +1,256 @@
+"""
+Репозиторий изображений с кэшем на локальном диске DiskCachedImageRepository.
+"""
+import asyncio
+import os
+import weakref
+from concurrent.futures import Executor
+from functools import partial
+from io import BytesIO
+from typing import Any, AsyncIterator, BinaryIO, Callable
+
+from app.core.mem.domain.image_repository import ImageRepository
+from app.core.mem.domain.utils.byte_range import ByteRange
+from app.core.mem.domain.utils.image_stream import ImageStream
+from app.core.shared_kernel.cache.disk_lru_cache import DiskLRUCache, DiskCacheWriter
+
+
+class DiskCachedImageRepository(ImageRepository):
+    """
+    Репозиторий изображений с кэшем на локальном диске.
+    Оборачивает любой другой репозиторий изображений: прочитанные изображения сохраняются на диск
+    и при следующих обращениях отдаются с него. При сохранении или удалении изображения
+    его копия в кэше сбрасывается. Запись в кэш начинается до чтения из оборачиваемого репозитория,
+    поэтому сохранение или удаление изображения во время чтения отменяет запись устаревших данных.
+
+    :ivar repository: Оборачиваемый репозиторий изображений.
+    :ivar cache: Дисковый кэш изображений.
+    :ivar executor: Пул для блокирующих операций с диском.
+    :ivar chunk_size: Размер части изображения в байтах при чтении из кэша.
+    """
+
+    def __init__(self, repository: ImageRepository, cache: DiskLRUCache,
+                 executor: Executor = None, chunk_size: int = 64 * 2**10):
+        """
+        Конструктор DiskCachedImageRepository.
+
+        :param repository: Оборачиваемый репозиторий изображений.
+        :param cache: Дисковый кэш изображений.
+        :param executor: Пул для блокирующих операций с диском.
+            Если не передан, используется пул цикла событий по умолчанию.
+        :param chunk_size: Размер части изображения в байтах при чтении из кэша.
+        """
+        self.repository = repository
+        self.cache = cache
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    async def save_image(self, path: str, image_stream: BytesIO) -> None:
+        """
+        Сохраняет изображение в оборачиваемый репозиторий и сбрасывает его копию в кэше.
+
+        :param path: Путь для изображения.
+        :param image_stream: Двоичный поток с данными изображения.
+        """
+        try:
+            await self.repository.save_image(path=path, image_stream=image_stream)
+        finally:
+            await self._run(self.cache.delete, path)
+
+    async def save_image_stream(self, path: str, chunks: AsyncIterator[bytes]) -> int:
+        """
+        Сохраняет изображение по частям в оборачиваемый репозиторий и сбрасывает его копию в кэше.
+
+        :param path: Путь для изображения.
+        :param chunks: Асинхронный итератор частей изображения.
+        :return: Размер сохранённого изображения в байтах.
+        """
+        try:
+            return await self.repository.save_image_stream(path=path, chunks=chunks)
+        finally:
+            await self._run(self.cache.delete, path)
+
+    async def copy_image(self, source_path: str, path: str) -> None:
+        """
+        Копирует изображение в оборачиваемом репозитории и сбрасывает копию в кэше по новому пути.
+
+        :param source_path: Путь копируемого изображения.
+        :param path: Путь для копии изображения.
+        """
+        try:
+            await self.repository.copy_image(source_path=source_path, path=path)
+        finally:
+            await self._run(self.cache.delete, path)
+
+    async def get_image(self, path: str) -> BytesIO:
+        """
+        Получает изображение из кэша, а при промахе - из оборачиваемого репозитория с сохранением в кэш.
+
+        :param path: Путь для изображения.
+        :return: Двоичный поток с данными изображения.
+        """
+        file = await self._run(self.cache.open, path)
+        if file is not None:
+            return await self._run(self._read_file, file)
+
+        writer = await self._run(self.cache.begin_write, path)
+        try:
+            image_stream = await self.repository.get_image(path=path)
+            await self._run(writer.write, image_stream.getvalue())
+        except BaseException:
+            await self._run(self.cache.abort_write, writer)
+            raise
+        await self._run(self.cache.commit_write, writer)
+        return image_stream
+
+    async def stream_image(self, path: str) -> ImageStream:
+        """
+        Открывает изображение для чтения по частям из кэша, а при промахе - из оборачиваемого репозитория.
+        Части, прочитанные из оборачиваемого репозитория, одновременно записываются в кэш;
+        изображение попадает в кэш, только если поток был прочитан полностью.
+
+        :param path: Путь для изображения.
+        :return: Поток с частями изображения.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        file = await self._run(self.cache.open, path)
+        if file is not None:
+            return ImageStream(chunks=self._iter_file(file),
+                               size=os.fstat(file.fileno()).st_size)
+
+        writer = await self._run(self.cache.begin_write, path)
+        try:
+            image_stream = await self.repository.stream_image(path=path)
+        except BaseException:
+            await self._run(self.cache.abort_write, writer)
+            raise
+        chunks = self._tee(writer, image_stream.chunks)
+        # Если поток так и не начали читать, запись отменяется при сборке итератора
+        weakref.finalize(chunks, self._abort_unfinished_write, writer)
+        return ImageStream(chunks=chunks, size=image_stream.size)
+
+    async def get_image_size(self, path: str) -> int:
+        """
+        Получает размер изображения из кэша, а при промахе - из оборачиваемого репозитория.
+
+        :param path: Путь для изображения.
+        :return: Размер изображения в байтах.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        file = await self._run(self.cache.open, path)
+        if file is None:
+            return await self.repository.get_image_size(path=path)
+        with file:
+            return os.fstat(file.fileno()).st_size
+
+    async def stream_image_range(self, path: str, byte_range: ByteRange) -> ImageStream:
+        """
+        Открывает диапазон байтов изображения из кэша, а при промахе - из оборачиваемого репозитория.
+        Диапазоны не сохраняются в кэш, так как кэшируются только изображения целиком.
+
+        :param path: Путь для изображения.
+        :param byte_range: Диапазон байтов в пределах изображения.
+        :return: Поток с частями диапазона.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        file = await self._run(self.cache.open, path)
+        if file is None:
+            return await self.repository.stream_image_range(path=path, byte_range=byte_range)
+
+        await self._run(file.seek, byte_range.start)
+        return ImageStream(chunks=self._iter_file(file, length=byte_range.length),
+                           size=byte_range.length)
+
+    async def get_image_url(self, path: str, internal: bool = False) -> str:
+        """
+        Получает ссылку на изображение из оборачиваемого репозитория.
+
+        :param path: Путь для изображения.
+        :param internal: Ссылка для использования внутри сети приложения, иначе - для клиентов.
+        :return: Ссылка на изображение.
+        """
+        return await self.repository.get_image_url(path=path, internal=internal)
+
+    async def delete_image(self, path: str) -> None:
+        """
+        Удаляет изображение из оборачиваемого репозитория и из кэша.
+
+        :param path: Путь для изображения.
+        """
+        try:
+            await self.repository.delete_image(path=path)
+        finally:
+            await self._run(self.cache.delete, path)
+
+    async def _iter_file(self, file: BinaryIO, length: int = None) -> AsyncIterator[bytes]:
+        """
+        Читает файл из кэша частями с текущей позиции.
+
+        :param file: Открытый файл.
+        :param length: Количество байтов для чтения, по умолчанию - до конца файла.
+        :return: Асинхронный итератор частей.
+        """
+        remaining = length
+        try:
+            while remaining is None or remaining > 0:
+                read_size = self.chunk_size if remaining is None else min(self.chunk_size, remaining)
+                chunk = await self._run(file.read, read_size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            file.close()
+
+    async def _tee(self, writer: DiskCacheWriter, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        """
+        Передаёт части изображения дальше, одновременно записывая их в кэш.
+
+        :param writer: Запись в кэш, начатая до чтения изображения.
+        :param chunks: Асинхронный итератор частей из оборачиваемого репозитория.
+        :return: Асинхронный итератор тех же частей.
+        """
+        completed = False
+        try:
+            async for chunk in chunks:
+                await self._run(writer.write, chunk)
+                yield chunk
+            completed = True
+        finally:
+            if completed:
+                await self._run(self.cache.commit_write, writer)
+            else:
+                await self._run(self.cache.abort_write, writer)
+                if hasattr(chunks, 'aclose'):
+                    await chunks.aclose()
+
+    def _abort_unfinished_write(self, writer: DiskCacheWriter) -> None:
+        """
+        Отменяет запись в кэш, если она не была зафиксирована или отменена.
+
+        :param writer: Запись.
+        """
+        if not writer.file.closed:
+            self.cache.abort_write(writer)
+
+    @staticmethod
+    def _read_file(file: BinaryIO) -> BytesIO:
+        """
+        Читает файл из кэша целиком и закрывает его.
+
+        :param file: Открытый файл.
+        :return: Двоичный поток с данными файла.
+        """
+        with file:
+            return BytesIO(file.read())
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Выполняет блокирующую функцию в пуле, не блокируя цикл событий.
+
+        :param func: Блокирующая функция.
+        :return: Результат функции.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
@@ -0,0 +1,92 @@
+"""
+Реализация репозитория базы данных для счётчиков ссылок на картинки ImageRefDBRepository.
+"""
+import asyncio
+from typing import Awaitable, Callable
+
+from sqlalchemy import update, delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.mem.domain.image_ref_repository import ImageRefRepository
+from app.core.mem.infrastructure.models.image_ref_dao import ImageRefDao
+
+
+class ImageRefDBRepository(ImageRefRepository):
+    """
+    Реализация репозитория базы данных для счётчиков ссылок на картинки.
+    Счётчики изменяются атомарно одним запросом, поэтому безопасны при параллельных загрузках.
+    Каждое изменение счётчика фиксируется сразу, независимо от остальных записей запроса.
+    Строка счётчика, дошедшего до нуля, остаётся заблокированной в транзакции до удаления картинки
+    из хранилища, поэтому добавление ссылки на ту же картинку из другого процесса ждёт завершения удаления.
+    Сессия не допускает параллельного использования, поэтому изменения счётчиков из параллельных задач
+    одного запроса выполняются по очереди.
+
+    :ivar session: Асинхронная сессия базы данных.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Конструктор ImageRefDBRepository.
+
+        :param session: Асинхронная сессия базы данных.
+        """
+        self.session = session
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, image_hash: str) -> int:
+        """
+        Добавляет ссылку на картинку, создавая счётчик при его отсутствии.
+
+        :param image_hash: Хэш содержимого картинки.
+        :return: Количество ссылок на картинку после добавления.
+        """
+        stmt = (
+            insert(ImageRefDao)
+            .values(hash=image_hash, ref_count=1)
+            .on_conflict_do_update(index_elements=[ImageRefDao.hash],
+                                   set_={'ref_count': ImageRefDao.ref_count + 1})
+            .returning(ImageRefDao.ref_count)
+        )
+        async with self._lock:
+            result = await self.session.execute(stmt)
+            ref_count = result.scalar_one()
+            await self.session.commit()
+        return ref_count
+
+    async def release(self, image_hash: str, delete_image: Callable[[], Awaitable[None]] = None) -> int:
+        """
+        Удаляет ссылку на картинку. Счётчик без ссылок удаляется.
+        Картинка без ссылок удаляется из хранилища до фиксации транзакции, пока строка счётчика заблокирована.
+        Если удалить картинку не удалось, счётчик всё равно удаляется: следующая ссылка загрузит картинку заново.
+
+        :param image_hash: Хэш содержимого картинки.
+        :param delete_image: Функция удаления картинки из хранилища, вызываемая после удаления последней ссылки.
+        :return: Количество оставшихся ссылок на картинку.
+        """
+        stmt = (
+            update(ImageRefDao)
+            .filter_by(hash=image_hash)
+            .values(ref_count=ImageRefDao.ref_count - 1)
+            .returning(ImageRefDao.ref_count)
+        )
+        async with self._lock:
+            try:
+                result = await self.session.execute(stmt)
+                ref_count = result.scalar_one_or_none()
+                if ref_count is None:
+                    ref_count = 0
+                elif ref_count <= 0:
+                    ref_count = 0
+                    try:
+                        if delete_image is not None:
+                            await delete_image()
+                    finally:
+                        await self.session.execute(delete(ImageRefDao).filter_by(hash=image_hash))
+                        await self.session.commit()
+                    return ref_count
+                await self.session.commit()
+            except BaseException:
+                await self.session.rollback()
+                raise
+        return ref_count
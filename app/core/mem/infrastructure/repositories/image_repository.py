@@ -1,11 +1,22 @@
 """
 Реализация репозитория S3 хранилища для изображений мемов.
 """
+import asyncio
+import time
+from concurrent.futures import Executor
+from functools import partial
 from io import BytesIO
+from typing import Any, AsyncIterator, Callable
 
-from mypy_boto3_s3.service_resource import Bucket
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+from mypy_boto3_s3 import S3Client
 
+from app.core.mem.domain.exceptions.image_exceptions import ImageNotFoundException
 from app.core.mem.domain.image_repository import ImageRepository
+from app.core.mem.domain.utils.byte_range import ByteRange
+from app.core.mem.domain.utils.image_stream import ImageStream
+from app.core.shared_kernel.metrics.metrics import S3_OPERATION_DURATION
 from app.settings import ImageStorageSettings
 
 settings = ImageStorageSettings()
@@ -14,47 +25,224 @@ settings = ImageStorageSettings()
 class ImageS3Repository(ImageRepository):
     """
     Реализация репозитория S3 хранилища для изображений мемов.
+
+    Вызовы boto3 блокирующие, поэтому выполняются в пуле потоков, чтобы не останавливать цикл событий.
+    Используются только методы низкоуровневого клиента: он потокобезопасен, в отличие от ресурсов boto3.
     """
 
-    def __init__(self, bucket: Bucket):
+    def __init__(self, client: S3Client, executor: Executor = None, public_client: S3Client = None):
         """
         Конструктор ImageS3Repository.
 
-        :param bucket: Бакет для работы с изображениями в S3 хранилище.
+        :param client: Клиент для работы с изображениями в S3 хранилище.
+        :param executor: Пул для выполнения блокирующих вызовов boto3.
+            Если не передан, используется пул цикла событий по умолчанию.
+        :param public_client: Клиент S3 для подписи ссылок, выдаваемых клиентам приложения.
+            Если не передан, используется клиент хранилища.
         """
 
-        self.bucket = bucket
+        self.client = client
         self.bucket_name = settings.bucket_name
+        self.executor = executor
+        self.public_client = public_client or client
 
-    def save_image(self, path: str, image_stream: BytesIO) -> None:
+    async def save_image(self, path: str, image_stream: BytesIO) -> None:
         """
         Сохраняет изображение в хранилище.
 
         :param path: Путь для изображения.
         :param image_stream: Двоичный поток с данными изображения.
         """
-        self.bucket.upload_fileobj(Fileobj=image_stream, Key=path)
+        await self._run(self.client.upload_fileobj, Fileobj=image_stream, Bucket=self.bucket_name, Key=path)
+
+    async def save_image_stream(self, path: str, chunks: AsyncIterator[bytes]) -> int:
+        """
+        Сохраняет изображение в хранилище по частям через multipart-загрузку.
+        Части накапливаются до `multipart_part_size` (минимальный размер части S3) и сразу отправляются
+        в хранилище, поэтому в памяти находится не больше одной части. Изображение меньше одной части
+        сохраняется одним запросом. При ошибке незавершённая загрузка отменяется.
 
-    def get_image(self, path: str) -> BytesIO:
+        :param path: Путь для изображения.
+        :param chunks: Асинхронный итератор частей изображения.
+        :return: Размер сохранённого изображения в байтах.
+        """
+        client = self.client
+        buffer = bytearray()
+        size = 0
+        upload_id = None
+        parts = []
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                if len(buffer) < settings.multipart_part_size:
+                    continue
+                if upload_id is None:
+                    upload = await self._run(client.create_multipart_upload, Bucket=self.bucket_name, Key=path)
+                    upload_id = upload['UploadId']
+                parts.append(await self._upload_part(path, upload_id, len(parts) + 1, bytes(buffer)))
+                buffer.clear()
+
+            if upload_id is None:
+                await self._run(client.put_object, Bucket=self.bucket_name, Key=path, Body=bytes(buffer))
+                return size
+
+            if buffer:
+                parts.append(await self._upload_part(path, upload_id, len(parts) + 1, bytes(buffer)))
+            await self._run(client.complete_multipart_upload, Bucket=self.bucket_name, Key=path,
+                            UploadId=upload_id, MultipartUpload={'Parts': parts})
+        except BaseException:
+            if upload_id is not None:
+                await self._run(client.abort_multipart_upload, Bucket=self.bucket_name, Key=path,
+                                UploadId=upload_id)
+            raise
+        return size
+
+    async def copy_image(self, source_path: str, path: str) -> None:
+        """
+        Копирует изображение внутри хранилища без передачи данных через приложение.
+
+        :param source_path: Путь копируемого изображения.
+        :param path: Путь для копии изображения.
+        """
+        await self._run(self.client.copy_object, Bucket=self.bucket_name, Key=path,
+                        CopySource={'Bucket': self.bucket_name, 'Key': source_path})
+
+    async def get_image(self, path: str) -> BytesIO:
         """
         Получает изображение из хранилища.
         :param path: Путь для изображения.
         :return: Двоичный поток с данными изображения.
         """
         image_stream = BytesIO()
-        self.bucket.download_fileobj(Key=path, Fileobj=image_stream)
+        await self._run(self.client.download_fileobj, Bucket=self.bucket_name, Key=path, Fileobj=image_stream)
         image_stream.seek(0)
         return image_stream
 
-    def delete_image(self, path: str) -> None:
+    async def stream_image(self, path: str) -> ImageStream:
+        """
+        Открывает изображение в хранилище для чтения по частям.
+        Объект запрашивается сразу, а его тело читается частями по мере потребления потока.
+
+        :param path: Путь для изображения.
+        :return: Поток с частями изображения.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        response = await self._get_object(path)
+        return ImageStream(chunks=self._iter_body(response['Body']),
+                           size=response.get('ContentLength'))
+
+    async def get_image_size(self, path: str) -> int:
+        """
+        Получает размер изображения по метаданным объекта без чтения его данных.
+
+        :param path: Путь для изображения.
+        :return: Размер изображения в байтах.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        try:
+            response = await self._run(self.client.head_object, Bucket=self.bucket_name, Key=path)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                raise ImageNotFoundException from e
+            raise
+        return response['ContentLength']
+
+    async def stream_image_range(self, path: str, byte_range: ByteRange) -> ImageStream:
+        """
+        Открывает диапазон байтов изображения в хранилище для чтения по частям.
+
+        :param path: Путь для изображения.
+        :param byte_range: Диапазон байтов в пределах изображения.
+        :return: Поток с частями диапазона.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        response = await self._get_object(path, Range=f'bytes={byte_range.start}-{byte_range.end}')
+        return ImageStream(chunks=self._iter_body(response['Body']),
+                           size=response.get('ContentLength'))
+
+    async def get_image_url(self, path: str, internal: bool = False) -> str:
+        """
+        Получает подписанную ссылку на изображение со временем жизни `url_expiration`.
+        Подпись вычисляется локально, без обращения к хранилищу.
+
+        :param path: Путь для изображения.
+        :param internal: Ссылка для использования внутри сети приложения, иначе - для клиентов.
+        :return: Ссылка на изображение.
+        """
+        client = self.client if internal else self.public_client
+        return client.generate_presigned_url('get_object',
+                                             Params={'Bucket': self.bucket_name, 'Key': path},
+                                             ExpiresIn=settings.url_expiration)
+
+    async def delete_image(self, path: str) -> None:
         """
         Удаляет изображение из хранилища.
         :param path: Путь для изображения.
         """
-        self.bucket.delete_objects(Delete={
+        await self._run(self.client.delete_objects, Bucket=self.bucket_name, Delete={
             'Objects': [
                 {
                     'Key': path
                 }
             ]
         })
+
+    async def _get_object(self, path: str, **kwargs) -> dict[str, Any]:
+        """
+        Запрашивает объект из хранилища.
+
+        :param path: Путь для изображения.
+        :return: Ответ хранилища с телом объекта.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        try:
+            return await self._run(self.client.get_object, Bucket=self.bucket_name, Key=path, **kwargs)
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                raise ImageNotFoundException from e
+            raise
+
+    async def _upload_part(self, path: str, upload_id: str, part_number: int, data: bytes) -> dict[str, Any]:
+        """
+        Отправляет часть multipart-загрузки.
+
+        :param path: Путь для изображения.
+        :param upload_id: Идентификатор multipart-загрузки.
+        :param part_number: Номер части, начиная с 1.
+        :param data: Данные части.
+        :return: Описание отправленной части для завершения загрузки.
+        """
+        response = await self._run(self.client.upload_part, Bucket=self.bucket_name, Key=path,
+                                   UploadId=upload_id, PartNumber=part_number, Body=data)
+        return {'ETag': response['ETag'], 'PartNumber': part_number}
+
+    async def _iter_body(self, body: StreamingBody) -> AsyncIterator[bytes]:
+        """
+        Читает тело объекта S3 частями размера `chunk_size`.
+
+        :param body: Тело объекта S3.
+        :return: Асинхронный итератор частей.
+        """
+        try:
+            while chunk := await self._run(body.read, settings.chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Выполняет блокирующую функцию в пуле, не блокируя цикл событий.
+        Время выполнения учитывается в метрике операций с S3 хранилищем по имени функции.
+
+        :param func: Блокирующая функция.
+        :return: Результат функции.
+        """
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+        finally:
+            S3_OPERATION_DURATION.labels(operation=getattr(func, '__name__', 'unknown')).observe(
+                time.perf_counter() - started
+            )
@@ -1,11 +1,18 @@
 """
 Реализация репозитория базы данных для мемов MemDBRepository.
 """
-from sqlalchemy import select
+from typing import AsyncIterator, Sequence
+from uuid import UUID
+
+from sqlalchemy import select, func, text, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.mem.domain.exceptions.mem_filter_exceptions import InvalidMemCursorError
 from app.core.mem.domain.mem_entity import Mem
 from app.core.mem.domain.mem_repository import MemRepository
+from app.core.mem.domain.utils.mem_count import MemCount
 from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
 from app.core.mem.infrastructure.models.mem_dao import MemDao
 from app.core.mem.infrastructure.repositories.utils.mem_filter import MemFilter
@@ -17,23 +24,136 @@ class MemDBRepository(MemRepository, BaseDBRepository[Mem]):
     Реализация репозитория базы данных для мемов.
 
     :cvar dao: DAO модель для работы с мемами в базе данных.
+
+    :ivar exact_count_threshold: Количество мемов, до которого общее количество считается точно.
     """
     @property
     def dao(self) -> type[MemDao]:
         return MemDao
 
-    async def get_by_filter(self, mem_filter_params: MemFilterParams) -> list[Mem]:
+    def __init__(self, session: AsyncSession, exact_count_threshold: int = 10000):
+        """
+        Конструктор MemDBRepository.
+
+        :param session: Асинхронная сессия базы данных.
+        :param exact_count_threshold: Количество мемов, до которого общее количество считается точно.
+        """
+        super().__init__(session)
+        self.exact_count_threshold = exact_count_threshold
+
+    async def get_by_ids(self, ids: Sequence[UUID]) -> list[Mem]:
+        """
+        Получает сущности мемов по списку идентификаторов одним запросом `id = ANY(:ids)`.
+        Идентификаторы передаются одним параметром-массивом, поэтому текст запроса не зависит
+        от их количества и подготовленный запрос переиспользуется.
+        Запрос может быть выполнен на реплике базы данных.
+
+        :param ids: Уникальные идентификаторы мемов.
+        :return: Найденные мемы в порядке запрошенных идентификаторов без повторов,
+            не найденные мемы пропускаются.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+
+        get_query = (
+            select(self.dao)
+            .where(self.dao.id == any_(literal(ids, ARRAY(self.dao.id.type))))
+            .execution_options(read_replica=True)
+        )
+        try:
+            result = await self.session.execute(get_query)
+            memes_by_id = {dao.id: dao.to_entity() for dao in result.scalars()}
+        finally:
+            await self.release_connection()
+        return [memes_by_id[id_] for id_ in ids if id_ in memes_by_id]
+
+    async def count(self, q: str | None = None) -> MemCount:
         """
-        Получает сущность мема по фильтру.
+        Получает общее количество мемов, при поисковом запросе - количество найденных мемов.
+        Без поиска количество оценивается по статистике таблицы `pg_class.reltuples`, а точный COUNT
+        выполняется, только если оценка не больше `exact_count_threshold` или статистики ещё нет.
+        При поиске найденные мемы считаются не дальше `exact_count_threshold`, большее количество
+        возвращается как оценка снизу.
+        Запросы могут быть выполнены на реплике базы данных.
+
+        :param q: Поисковый запрос по тексту мемов.
+        :return: Количество мемов.
+        """
+        try:
+            if q:
+                limited_query = (
+                    select(self.dao.id)
+                    .where(MemFilter.search_condition(q))
+                    .limit(self.exact_count_threshold + 1)
+                    .subquery()
+                )
+                count_query = select(func.count()).select_from(limited_query).execution_options(read_replica=True)
+                found_count = await self.session.scalar(count_query)
+                if found_count > self.exact_count_threshold:
+                    return MemCount(value=self.exact_count_threshold, is_estimate=True)
+                return MemCount(value=found_count)
+
+            # reltuples равен -1, пока таблица не анализировалась
+            estimate_query = (
+                text('SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)')
+                .bindparams(table_name=self.dao.__tablename__)
+                .execution_options(read_replica=True)
+            )
+            estimate = await self.session.scalar(estimate_query)
+            if estimate is not None and estimate > self.exact_count_threshold:
+                return MemCount(value=estimate, is_estimate=True)
+
+            count_query = select(func.count()).select_from(self.dao).execution_options(read_replica=True)
+            return MemCount(value=await self.session.scalar(count_query))
+        finally:
+            await self.release_connection()
+
+    async def get_by_filter(self, mem_filter_params: MemFilterParams, limit: int = None) -> list[Mem]:
+        """
+        Получает сущности мемов по фильтру в порядке их идентификаторов.
+        Запрос может быть выполнен на реплике базы данных.
 
         :param mem_filter_params: Параметры фильтра.
+        :param limit: Максимальное количество мемов, по умолчанию - размер страницы.
         :return: Список отфильтрованных мемов.
+        :raise InvalidMemCursorError: Некорректный курсор или мем курсора поиска удалён либо больше не находится.
         """
-        get_query = select(self.dao)
-        filter_query = MemFilter.filter_query(query=get_query, mem_filter_params=mem_filter_params)
+        get_query = select(self.dao).execution_options(read_replica=True)
+        filter_query = MemFilter.filter_query(query=get_query, mem_filter_params=mem_filter_params, limit=limit)
+        anchor_query = MemFilter.cursor_anchor_query(mem_filter_params)
         try:
             result = await self.session.execute(filter_query)
             result = result.scalars().all()
+            # Без мема курсора страница всегда пуста, поэтому он проверяется только для пустой страницы
+            if not result and anchor_query is not None:
+                anchor_rank = await self.session.scalar(anchor_query.execution_options(read_replica=True))
+                if anchor_rank is None:
+                    raise InvalidMemCursorError
         except NoResultFound:
             return []
+        finally:
+            await self.release_connection()
         return [dao.to_entity() for dao in result]
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[Mem]:
+        """
+        Последовательно получает все мемы в порядке их идентификаторов через серверный курсор.
+        Строки читаются из базы данных пакетами по `batch_size`, в памяти хранится только текущий пакет.
+        Запрос может быть выполнен на реплике базы данных.
+
+        :param batch_size: Количество строк, получаемых из базы данных за раз.
+        :return: Асинхронный итератор мемов.
+        """
+        stream_query = (
+            select(self.dao)
+            .order_by(self.dao.id)
+            .execution_options(yield_per=batch_size, read_replica=True)
+        )
+        result = await self.session.stream_scalars(stream_query)
+        try:
+            async for dao in result:
+                yield dao.to_entity()
+        finally:
+            await result.close()
+            await self.release_connection()
@@ -1,6 +1,9 @@
-from sqlalchemy import Select
+from sqlalchemy import Select, ColumnElement, func, select, tuple_
+from sqlalchemy.orm import aliased
 
+from app.core.mem.domain.utils.mem_cursor import MemCursor
 from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
+from app.core.mem.infrastructure.models.mem_dao import MemDao, TEXT_SEARCH_CONFIG
 
 
 class MemFilter:
@@ -9,6 +12,112 @@ class MemFilter:
     """
 
     @classmethod
-    def filter_query(cls, query: Select, mem_filter_params: MemFilterParams) -> Select:
+    def filter_query(cls, query: Select, mem_filter_params: MemFilterParams, limit: int = None) -> Select:
+        """
+        Применяет к запросу порядок и постраничную выборку.
+        С курсором страница выбирается по первичному ключу (keyset), без него - смещением по номеру страницы.
+        С поисковым запросом выбираются только найденные мемы в порядке убывания релевантности.
+
+        :param query: Запрос мемов.
+        :param mem_filter_params: Параметры фильтра.
+        :param limit: Максимальное количество мемов, по умолчанию - размер страницы.
+            Смещение страницы всегда вычисляется по размеру страницы.
+        :return: Отфильтрованный запрос.
+        :raise InvalidMemCursorError: Некорректный курсор.
+        """
+        limit = mem_filter_params.per_page if limit is None else limit
+        if mem_filter_params.q:
+            return cls._search_query(query, mem_filter_params, limit)
+
+        query = query.order_by(MemDao.id)
+        if mem_filter_params.after:
+            cursor = MemCursor.decode(mem_filter_params.after)
+            return query.where(MemDao.id > cursor.uuid).limit(limit)
+
+        offset = (mem_filter_params.page - 1) * mem_filter_params.per_page
+        return query.offset(offset).limit(limit)
+
+    @classmethod
+    def search_condition(cls, q: str) -> ColumnElement[bool]:
+        """
+        Создаёт условие полнотекстового поиска мемов, использующее GIN-индекс поискового вектора.
+
+        :param q: Поисковый запрос в синтаксисе веб-поиска.
+        :return: Условие поиска.
+        """
+        return MemDao.text_search.bool_op('@@')(cls.get_search_query(q))
+
+    @classmethod
+    def get_search_query(cls, q: str) -> ColumnElement:
+        """
+        Создаёт поисковый запрос tsquery из строки в синтаксисе веб-поиска.
+
+        :param q: Поисковый запрос.
+        :return: Выражение tsquery.
+        """
+        return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, q)
+
+    @classmethod
+    def cursor_anchor_query(cls, mem_filter_params: MemFilterParams) -> Select | None:
+        """
+        Создаёт запрос релевантности мема, на который указывает курсор поиска.
+        Если мем удалён или больше не находится поисковым запросом, запрос не вернёт строк:
+        продолжить выборку после такого курсора нельзя.
+
+        :param mem_filter_params: Параметры фильтра.
+        :return: Запрос релевантности мема курсора или None, если выборка не поисковая или без курсора.
+        :raise InvalidMemCursorError: Некорректный курсор.
+        """
+        if not (mem_filter_params.q and mem_filter_params.after):
+            return None
+
+        cursor = MemCursor.decode(mem_filter_params.after)
+        return cls._cursor_rank_query(cursor, mem_filter_params.q)
+
+    @classmethod
+    def _cursor_rank_query(cls, cursor: MemCursor, q: str) -> Select:
+        """
+        Создаёт запрос релевантности мема курсора среди найденных поисковым запросом мемов.
+
+        :param cursor: Курсор.
+        :param q: Поисковый запрос.
+        :return: Запрос релевантности мема курсора.
+        """
+        cursor_mem = aliased(MemDao)
+        return (
+            select(func.ts_rank(cursor_mem.text_search, cls.get_search_query(q)))
+            .where(cursor_mem.id == cursor.uuid,
+                   cursor_mem.text_search.bool_op('@@')(cls.get_search_query(q)))
+        )
+
+    @classmethod
+    def _search_query(cls, query: Select, mem_filter_params: MemFilterParams, limit: int) -> Select:
+        """
+        Применяет к запросу полнотекстовый поиск по GIN-индексу и порядок по релевантности.
+        Курсор хранит только идентификатор последнего мема, его релевантность вычисляется заново
+        поиском по первичному ключу, а страница выбирается по паре (релевантность, идентификатор).
+        Если мем курсора удалён или больше не находится, страница пуста, см. :meth:`cursor_anchor_query`.
+
+        :param query: Запрос мемов.
+        :param mem_filter_params: Параметры фильтра с поисковым запросом.
+        :param limit: Максимальное количество мемов.
+        :return: Отфильтрованный запрос.
+        :raise InvalidMemCursorError: Некорректный курсор.
+        """
+        ts_query = cls.get_search_query(mem_filter_params.q)
+        rank = func.ts_rank(MemDao.text_search, ts_query)
+        query = (
+            query
+            .where(cls.search_condition(mem_filter_params.q))
+            .order_by(rank.desc(), MemDao.id)
+        )
+
+        if mem_filter_params.after:
+            cursor = MemCursor.decode(mem_filter_params.after)
+            cursor_rank = cls._cursor_rank_query(cursor, mem_filter_params.q).scalar_subquery()
+            # Релевантность упорядочена по убыванию, поэтому сравнивается с обратным знаком
+            query = query.where(tuple_(-rank, MemDao.id) > tuple_(-cursor_rank, cursor.uuid))
+            return query.limit(limit)
+
         offset = (mem_filter_params.page - 1) * mem_filter_params.per_page
-        return query.offset(offset).limit(mem_filter_params.per_page)
+        return query.offset(offset).limit(limit)
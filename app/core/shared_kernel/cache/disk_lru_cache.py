@@ -0,0 +1,271 @@
+"""
+Ограниченный по объёму кэш файлов на локальном диске с вытеснением LRU DiskLRUCache.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import BinaryIO
+
+from app.core.shared_kernel.metrics.metrics import CACHE_HITS, CACHE_MISSES
+
+
+class DiskCacheWriter:
+    """
+    Запись нового файла в дисковый кэш.
+    Данные пишутся во временный файл, который атомарно переносится в кэш при фиксации.
+
+    :ivar name: Имя файла записи в кэше.
+    :ivar temp_path: Путь к временному файлу.
+    :ivar file: Временный файл для данных.
+    :ivar size: Количество записанных байт.
+    :ivar stale: Флаг устаревания записи, устанавливается при сбросе ключа во время записи.
+    """
+
+    def __init__(self, name: str, temp_path: str, file: BinaryIO):
+        """
+        Конструктор DiskCacheWriter.
+
+        :param name: Имя файла записи в кэше.
+        :param temp_path: Путь к временному файлу.
+        :param file: Временный файл для данных.
+        """
+        self.name = name
+        self.temp_path = temp_path
+        self.file = file
+        self.size = 0
+        self.stale = False
+
+    def write(self, data: bytes) -> None:
+        """
+        Дописывает данные во временный файл.
+
+        :param data: Данные.
+        """
+        self.file.write(data)
+        self.size += len(data)
+
+
+class DiskLRUCache:
+    """
+    Ограниченный по объёму кэш файлов на локальном диске с вытеснением LRU.
+    Файлы записываются атомарно: сначала во временный файл, затем переименовываются.
+    Имя файла - хэш ключа, поэтому ключом может быть любая строка, в том числе путь с `/`.
+    Методы блокирующие и потокобезопасные, их следует вызывать из пула потоков.
+
+    :ivar directory: Каталог кэша.
+    :ivar max_bytes: Максимальный суммарный размер файлов в байтах.
+    :ivar hits: Количество попаданий в кэш.
+    :ivar misses: Количество промахов кэша.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, name: str = None):
+        """
+        Конструктор DiskLRUCache.
+        Файлы, оставшиеся в каталоге от предыдущего запуска, учитываются в порядке времени изменения.
+
+        :param directory: Каталог кэша.
+        :param max_bytes: Максимальный суммарный размер файлов в байтах.
+        :param name: Имя кэша в метриках попаданий и промахов, None - метрики не собираются.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._hits_metric = CACHE_HITS.labels(cache=name) if name else None
+        self._misses_metric = CACHE_MISSES.labels(cache=name) if name else None
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._writers: dict[str, set[DiskCacheWriter]] = {}
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @property
+    def size(self) -> int:
+        """
+        Суммарный размер файлов в кэше в байтах.
+        """
+        return self._size
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Доля попаданий в кэш среди всех обращений.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def open(self, key: str) -> BinaryIO | None:
+        """
+        Открывает файл из кэша на чтение и отмечает его как недавно использованный.
+
+        :param key: Ключ.
+        :return: Открытый файл или None, если файла нет в кэше.
+        """
+        name = self._file_name(key)
+        with self._lock:
+            if name in self._entries:
+                try:
+                    file = open(os.path.join(self.directory, name), 'rb')
+                except FileNotFoundError:
+                    self._forget(name)
+                else:
+                    self._entries.move_to_end(name)
+                    self.hits += 1
+                    if self._hits_metric is not None:
+                        self._hits_metric.inc()
+                    return file
+            self.misses += 1
+            if self._misses_metric is not None:
+                self._misses_metric.inc()
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Сохраняет данные в кэш.
+
+        :param key: Ключ.
+        :param data: Данные.
+        """
+        writer = self.begin_write(key)
+        try:
+            writer.write(data)
+        except BaseException:
+            self.abort_write(writer)
+            raise
+        self.commit_write(writer)
+
+    def begin_write(self, key: str) -> DiskCacheWriter:
+        """
+        Начинает запись файла в кэш.
+
+        :param key: Ключ.
+        :return: Запись, в которую следует передавать данные.
+        """
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp_')
+        writer = DiskCacheWriter(name=self._file_name(key), temp_path=temp_path, file=os.fdopen(fd, 'wb'))
+        with self._lock:
+            self._writers.setdefault(writer.name, set()).add(writer)
+        return writer
+
+    def commit_write(self, writer: DiskCacheWriter) -> None:
+        """
+        Фиксирует запись: атомарно переносит файл в кэш и вытесняет старые файлы при переполнении.
+        Устаревшая или не помещающаяся в кэш запись отбрасывается.
+
+        :param writer: Запись.
+        """
+        writer.file.close()
+        with self._lock:
+            self._discard_writer(writer)
+            if writer.stale or writer.size > self.max_bytes:
+                os.unlink(writer.temp_path)
+                return
+
+            os.replace(writer.temp_path, os.path.join(self.directory, writer.name))
+            self._forget(writer.name)
+            self._entries[writer.name] = writer.size
+            self._size += writer.size
+            self._evict()
+
+    def abort_write(self, writer: DiskCacheWriter) -> None:
+        """
+        Отменяет запись и удаляет временный файл.
+
+        :param writer: Запись.
+        """
+        writer.file.close()
+        with self._lock:
+            self._discard_writer(writer)
+        try:
+            os.unlink(writer.temp_path)
+        except FileNotFoundError:
+            pass
+
+    def delete(self, key: str) -> None:
+        """
+        Удаляет файл из кэша. Незавершённые записи этого ключа помечаются устаревшими.
+
+        :param key: Ключ.
+        """
+        name = self._file_name(key)
+        with self._lock:
+            for writer in self._writers.get(name, ()):
+                writer.stale = True
+            if name in self._entries:
+                self._forget(name)
+                self._unlink(name)
+
+    def _evict(self) -> None:
+        """
+        Удаляет давно не использованные файлы, пока объём кэша превышает допустимый.
+        """
+        while self._size > self.max_bytes and self._entries:
+            name = next(iter(self._entries))
+            self._forget(name)
+            self._unlink(name)
+
+    def _forget(self, name: str) -> None:
+        """
+        Удаляет файл из учёта кэша.
+
+        :param name: Имя файла.
+        """
+        size = self._entries.pop(name, None)
+        if size is not None:
+            self._size -= size
+
+    def _discard_writer(self, writer: DiskCacheWriter) -> None:
+        """
+        Удаляет запись из списка незавершённых.
+
+        :param writer: Запись.
+        """
+        writers = self._writers.get(writer.name)
+        if writers is not None:
+            writers.discard(writer)
+            if not writers:
+                del self._writers[writer.name]
+
+    def _unlink(self, name: str) -> None:
+        """
+        Удаляет файл кэша с диска.
+
+        :param name: Имя файла.
+        """
+        try:
+            os.unlink(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _file_name(key: str) -> str:
+        """
+        Получает имя файла кэша по ключу.
+
+        :param key: Ключ.
+        :return: Имя файла.
+        """
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _load(self) -> None:
+        """
+        Учитывает файлы, оставшиеся в каталоге кэша, и удаляет незавершённые временные файлы.
+        """
+        files = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            if entry.name.startswith('.tmp_'):
+                os.unlink(entry.path)
+                continue
+            stat = entry.stat()
+            files.append((stat.st_mtime, entry.name, stat.st_size))
+
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._size += size
+        self._evict()
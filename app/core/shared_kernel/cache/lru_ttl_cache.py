@@ -0,0 +1,151 @@
+"""
+Ограниченный по размеру кэш в памяти процесса с вытеснением LRU и временем жизни записей LRUTTLCache.
+"""
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+from app.core.shared_kernel.metrics.metrics import CACHE_HITS, CACHE_MISSES
+
+Key = TypeVar("Key", bound=Hashable)
+Value = TypeVar("Value")
+
+
+class LRUTTLCache(Generic[Key, Value]):
+    """
+    Ограниченный по размеру кэш в памяти процесса с вытеснением LRU и временем жизни записей.
+    Не потокобезопасен, предназначен для использования из цикла событий.
+
+    Удаление записей увеличивает поколение кэша. Значение, прочитанное из источника после промаха,
+    сохраняется с поколением, полученным до чтения, и отбрасывается, если запись была удалена за время чтения:
+    иначе устаревшее значение вернулось бы в кэш до истечения времени жизни.
+
+    :ivar max_size: Максимальное количество записей.
+    :ivar ttl: Время жизни записи в секундах по умолчанию, None - без ограничения.
+    :ivar hits: Количество попаданий в кэш.
+    :ivar misses: Количество промахов кэша.
+    """
+
+    def __init__(self, max_size: int, ttl: float | None = None, timer: Callable[[], float] = time.monotonic,
+                 name: str = None):
+        """
+        Конструктор LRUTTLCache.
+
+        :param max_size: Максимальное количество записей.
+        :param ttl: Время жизни записи в секундах по умолчанию, None - без ограничения.
+        :param timer: Функция текущего времени в секундах.
+        :param name: Имя кэша в метриках попаданий и промахов, None - метрики не собираются.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._timer = timer
+        self._hits_metric = CACHE_HITS.labels(cache=name) if name else None
+        self._misses_metric = CACHE_MISSES.labels(cache=name) if name else None
+        self._data: OrderedDict[Key, tuple[Value, float | None]] = OrderedDict()
+        self._generation = 0
+        # Поколения последних удалений ключей, не больше max_size; более старые удаления учитываются
+        # одним поколением _forgotten_generation
+        self._invalidations: OrderedDict[Key, int] = OrderedDict()
+        self._forgotten_generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+        Текущее поколение кэша, увеличивается при каждом удалении записей.
+        """
+        return self._generation
+
+    def get(self, key: Key) -> Value | None:
+        """
+        Получает значение из кэша и отмечает его как недавно использованное.
+
+        :param key: Ключ.
+        :return: Значение или None, если записи нет или её время жизни истекло.
+        """
+        item = self._data.get(key)
+        if item is None:
+            self._count_miss()
+            return None
+
+        value, expires_at = item
+        if expires_at is not None and expires_at <= self._timer():
+            del self._data[key]
+            self._count_miss()
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        if self._hits_metric is not None:
+            self._hits_metric.inc()
+        return value
+
+    def set(self, key: Key, value: Value, ttl: float | None = None, generation: int = None) -> None:
+        """
+        Сохраняет значение в кэш, вытесняя давно не использованные записи при переполнении.
+
+        :param key: Ключ.
+        :param value: Значение.
+        :param ttl: Время жизни записи в секундах, по умолчанию используется время жизни кэша.
+        :param generation: Поколение кэша, полученное до чтения значения из источника.
+            Если запись была удалена после этого поколения, значение не сохраняется.
+        """
+        if self.max_size <= 0:
+            return
+        if generation is not None and self._invalidated_since(key, generation):
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self._timer() + ttl if ttl is not None else None
+
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Key) -> None:
+        """
+        Удаляет запись из кэша.
+
+        :param key: Ключ.
+        """
+        self._data.pop(key, None)
+        self._generation += 1
+        self._invalidations[key] = self._generation
+        self._invalidations.move_to_end(key)
+        while len(self._invalidations) > max(self.max_size, 0):
+            _, forgotten_generation = self._invalidations.popitem(last=False)
+            self._forgotten_generation = forgotten_generation
+
+    def clear(self) -> None:
+        """
+        Очищает кэш.
+        """
+        self._data.clear()
+        self._generation += 1
+        self._invalidations.clear()
+        self._forgotten_generation = self._generation
+
+    def _invalidated_since(self, key: Key, generation: int) -> bool:
+        """
+        Проверяет, удалялась ли запись после указанного поколения.
+
+        :param key: Ключ.
+        :param generation: Поколение кэша.
+        :return: True, если запись удалялась или это нельзя исключить.
+        """
+        if self._forgotten_generation > generation:
+            return True
+        return self._invalidations.get(key, 0) > generation
+
+    def _count_miss(self) -> None:
+        """
+        Учитывает промах кэша.
+        """
+        self.misses += 1
+        if self._misses_metric is not None:
+            self._misses_metric.inc()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -41,6 +41,7 @@ class BaseDao(DeclarativeBase):
     def to_dict(self):
         """
         Создаёт словарь из столбцов и их значений модели DAO.
+        Вычисляемые базой данных столбцы не включаются, так как их нельзя записать.
         :return: Словарь вида {название столбца: значение}
         """
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        return {c.name: getattr(self, c.name) for c in self.__table__.columns if c.computed is None}
@@ -2,23 +2,66 @@
 Функции для получения зависимостей базы данных.
 Включает в себя создание асинхронной сессии БД.
 """
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+
 import boto3
-from mypy_boto3_s3 import ServiceResource
-from mypy_boto3_s3.service_resource import Bucket
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
+from botocore.config import Config
+from mypy_boto3_s3 import ServiceResource, S3Client
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession, AsyncEngine
 
+from app.core.shared_kernel.db.instrumented_pool import InstrumentedAsyncAdaptedQueuePool
+from app.core.shared_kernel.db.routing_session import ReplicaRouter, RoutingSession
+from app.core.shared_kernel.metrics.metrics import instrument_engine
 from app.settings import DatabaseSettings, ImageStorageSettings
 
 db_settings = DatabaseSettings()
 image_storage_settings = ImageStorageSettings()
 
-engine = create_async_engine(db_settings.postgres_url.unicode_string(), echo=False)
-async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+def create_db_engine(url: str) -> AsyncEngine:
+    """
+    Создаёт асинхронный движок базы данных с настройками пула соединений и сбором метрик запросов.
+
+    :param url: Url подключения к PostgreSQL.
+    :return: Асинхронный движок SQLAlchemy.
+    """
+    db_engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=db_settings.db_pool_size,
+        max_overflow=db_settings.db_max_overflow,
+        pool_timeout=db_settings.db_pool_timeout,
+        pool_recycle=db_settings.db_pool_recycle,
+        pool_pre_ping=db_settings.db_pool_pre_ping,
+        # statement_cache_size - кэш asyncpg, prepared_statement_cache_size - кэш диалекта SQLAlchemy
+        connect_args={'statement_cache_size': db_settings.db_statement_cache_size,
+                      'prepared_statement_cache_size': db_settings.db_statement_cache_size},
+    )
+    instrument_engine(db_engine)
+    return db_engine
+
+
+engine = create_db_engine(db_settings.postgres_url.unicode_string())
+replica_engines = [create_db_engine(replica_url.unicode_string())
+                   for replica_url in db_settings.postgres_replica_urls]
+replica_router = ReplicaRouter(replica_engines, lag_window=db_settings.db_replica_lag_window) \
+    if replica_engines else None
+async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False,
+                                         sync_session_class=RoutingSession, replica_router=replica_router)
+
+image_executor = ThreadPoolExecutor(max_workers=image_storage_settings.max_workers,
+                                    thread_name_prefix='images')
 
 
 async def get_async_db_session() -> AsyncSession:
     """
     Получает асинхронную сессию для взаимодействия с базой данных.
+    Запросы чтения, помеченные в репозиториях, выполняются на репликах, если они настроены.
+    Соединение берётся из пула только при первом запросе сессии, а репозитории возвращают его
+    сразу после чтения или фиксации записи, поэтому запросы, обслуженные из кэша или хранилища,
+    не занимают соединение с базой данных.
 
     :return: Асинхронная сессия SQLAlchemy.
     """
@@ -34,17 +77,89 @@ async def get_async_db_session() -> AsyncSession:
             await session.close()
 
 
+def create_s3_config() -> Config:
+    """
+    Создаёт настройки клиентов S3: размер пула HTTP-соединений, время ожидания и повторы запросов.
+    Соединений не меньше, чем потоков для операций с S3 хранилищем, иначе потоки ждали бы свободного соединения.
+
+    :return: Настройки клиента botocore.
+    """
+    max_pool_connections = max(db_settings.s3_max_pool_connections, image_storage_settings.max_workers)
+    return Config(max_pool_connections=max_pool_connections,
+                  connect_timeout=db_settings.s3_connect_timeout,
+                  read_timeout=db_settings.s3_read_timeout,
+                  retries={'total_max_attempts': db_settings.s3_max_attempts, 'mode': db_settings.s3_retry_mode})
+
+
 def get_s3_resource() -> ServiceResource:
+    """
+    Создаёт ресурс S3 для служебных операций, например создания бакета при запуске.
+    Ресурсы boto3 не потокобезопасны, поэтому ресурс создаётся при каждом вызове
+    и не передаётся в пул потоков.
+
+    :return: Ресурс S3.
+    """
     return boto3.resource(service_name='s3',
                           endpoint_url=db_settings.s3_storage_url,
                           aws_access_key_id=db_settings.s3_access_key_id,
                           aws_secret_access_key=db_settings.s3_secret_access_key,
-                          region_name='ru-central1')
+                          region_name='ru-central1',
+                          config=create_s3_config())
 
 
-def get_s3_bucket_image() -> Bucket:
+@lru_cache
+def get_s3_client() -> S3Client:
+    """
+    Получает общий для процесса клиент S3 для операций с хранилищем.
+    Клиент создаётся один раз: описание сервиса botocore разбирается однократно, а HTTP-соединения
+    переиспользуются между запросами. Низкоуровневый клиент boto3 потокобезопасен,
+    поэтому его можно использовать из пула потоков, в отличие от ресурсов.
+
+    :return: Клиент S3.
+    """
+    return boto3.client(service_name='s3',
+                        endpoint_url=db_settings.s3_storage_url,
+                        aws_access_key_id=db_settings.s3_access_key_id,
+                        aws_secret_access_key=db_settings.s3_secret_access_key,
+                        region_name='ru-central1',
+                        config=create_s3_config())
+
+
+@lru_cache
+def get_s3_public_client() -> S3Client | None:
+    """
+    Получает клиент S3 для подписи ссылок, доступных клиентам приложения.
+    Клиент создаётся один раз, подпись ссылок выполняется локально, без обращения к хранилищу.
+
+    :return: Клиент S3 или None, если публичный url S3 не задан.
+    """
+    if not db_settings.s3_public_url:
+        return None
 
-    s3_resource = get_s3_resource()
-    bucket = s3_resource.Bucket(image_storage_settings.bucket_name)
+    return boto3.client(service_name='s3',
+                        endpoint_url=db_settings.s3_public_url,
+                        aws_access_key_id=db_settings.s3_access_key_id,
+                        aws_secret_access_key=db_settings.s3_secret_access_key,
+                        region_name='ru-central1',
+                        config=create_s3_config())
 
-    return bucket
+
+def close_s3_clients() -> None:
+    """
+    Закрывает HTTP-соединения созданных клиентов S3 и сбрасывает их,
+    чтобы при следующем обращении клиенты были созданы заново.
+    """
+    for cached_func in (get_s3_client, get_s3_public_client):
+        client = cached_func() if cached_func.cache_info().currsize else None
+        if client is not None:
+            client.close()
+        cached_func.cache_clear()
+
+
+def get_image_executor() -> Executor:
+    """
+    Получает общий пул потоков для блокирующих операций с S3 хранилищем.
+
+    :return: Пул потоков.
+    """
+    return image_executor
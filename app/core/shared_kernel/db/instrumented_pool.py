@@ -0,0 +1,104 @@
+"""
+Пул соединений SQLAlchemy со сбором статистики InstrumentedAsyncAdaptedQueuePool.
+"""
+import bisect
+import math
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from app.core.shared_kernel.db.schemas.pool_stats_schema import PoolStatsSchema, PoolWaitHistogramSchema
+
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, math.inf)
+
+
+class PoolWaitHistogram:
+    """
+    Гистограмма времени ожидания соединения из пула.
+    Не потокобезопасна, предназначена для использования из цикла событий.
+
+    :ivar count: Общее количество ожиданий.
+    :ivar sum: Суммарное время ожидания в секундах.
+    :ivar timeouts: Количество ожиданий, завершившихся таймаутом.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = WAIT_BUCKETS):
+        """
+        Конструктор PoolWaitHistogram.
+
+        :param buckets: Возрастающие границы корзин в секундах, последняя - бесконечность.
+        """
+        self._buckets = buckets
+        self._bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.timeouts = 0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Учитывает время одного ожидания.
+
+        :param seconds: Время ожидания в секундах.
+        """
+        self._bucket_counts[bisect.bisect_left(self._buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def to_schema(self) -> PoolWaitHistogramSchema:
+        """
+        Преобразует гистограмму в схему с накопительными значениями корзин.
+
+        :return: Схема гистограммы.
+        """
+        buckets = {}
+        cumulative = 0
+        for bound, bucket_count in zip(self._buckets, self._bucket_counts):
+            cumulative += bucket_count
+            buckets['+Inf' if math.isinf(bound) else str(bound)] = cumulative
+        return PoolWaitHistogramSchema(buckets=buckets, count=self.count, sum=self.sum, timeouts=self.timeouts)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Асинхронный пул соединений SQLAlchemy, измеряющий время ожидания выдачи соединения.
+    Статистика сбрасывается при пересоздании пула, например после `engine.dispose()`.
+
+    :ivar wait_histogram: Гистограмма времени ожидания соединения.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Конструктор InstrumentedAsyncAdaptedQueuePool.
+        Принимает те же аргументы, что и :class:`AsyncAdaptedQueuePool`.
+        """
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = PoolWaitHistogram()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """
+        Выдаёт соединение из пула, учитывая время ожидания и таймауты.
+
+        :return: Запись соединения пула.
+        """
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.wait_histogram.timeouts += 1
+            raise
+        finally:
+            self.wait_histogram.observe(time.perf_counter() - started)
+
+    def get_stats(self) -> PoolStatsSchema:
+        """
+        Получает текущее состояние пула.
+
+        :return: Состояние пула.
+        """
+        return PoolStatsSchema(size=self.size(),
+                               max_overflow=self._max_overflow,
+                               checked_in=self.checkedin(),
+                               checked_out=self.checkedout(),
+                               overflow=self.overflow(),
+                               wait=self.wait_histogram.to_schema())
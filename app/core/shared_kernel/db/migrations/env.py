@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from app.core.user.infrastructure.models.user_dao import UserDao
 from app.core.mem.infrastructure.models.mem_dao import MemDao
+from app.core.mem.infrastructure.models.image_ref_dao import ImageRefDao
 from app.core.shared_kernel.db.dao import BaseDao
 
 from app.settings import DatabaseSettings
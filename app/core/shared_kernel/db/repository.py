@@ -43,30 +43,37 @@ class BaseDBRepository(BaseRepository[Entity], ABC):
     async def add(self, entity: Entity | list[Entity]) -> Entity | Sequence[Entity]:
         """
         Добавляет сущность в базу данных.
+        Список сущностей добавляется в одной транзакции многострочными INSERT, а не по одной строке.
 
         :param entity: Сущность доменной области или список сущностей для добавления.
-        :return: Добавленная сущность или список добавленных сущностей.
+        :return: Добавленная сущность или список добавленных сущностей в порядке их передачи.
         :raise EntityExistsException: Нарушение целостности базы данных при добавлении сущности,
             которая уже существует.
         """
 
-        add_dao = self.dao.from_entity(entity)
+        entities = entity if isinstance(entity, list) else [entity]
+        if not entities:
+            return []
+
+        add_values = [self.dao.from_entity(add_entity).to_dict() for add_entity in entities]
         stmt = (
             insert(self.dao)
-            .values(add_dao.to_dict())
-            .returning(self.dao)
+            .returning(self.dao, sort_by_parameter_order=True)
         )
         try:
-            result = await self.session.execute(stmt)
-            result = result.scalars().all()
+            result = await self.session.scalars(stmt, add_values)
+            result = result.all()
             await self.session.commit()
         except IntegrityError as e:
+            await self.session.rollback()
             raise EntityExistsException from e
-        return result[0].to_entity() if len(result) == 1 else [dao.to_entity() for dao in result]
+        added_entities = [dao.to_entity() for dao in result]
+        return added_entities if isinstance(entity, list) else added_entities[0]
 
     async def update(self, entity: Entity) -> Entity:
         """
         Обновляет сущность в базе данных.
+        Если у модели DAO есть столбец `version`, он увеличивается на единицу в том же запросе.
 
         :param entity: Сущность доменной области для обновления.
         :return: Обновлённая сущность.
@@ -75,9 +82,12 @@ class BaseDBRepository(BaseRepository[Entity], ABC):
         """
 
         update_dao = self.dao.from_entity(entity)
+        update_values = update_dao.to_dict()
+        if 'version' in update_values:
+            update_values['version'] = self.dao.version + 1
         stmt = (
             update(self.dao)
-            .values(update_dao.to_dict())
+            .values(update_values)
             .filter_by(id=update_dao.id)
             .returning(self.dao)
         )
@@ -87,37 +97,49 @@ class BaseDBRepository(BaseRepository[Entity], ABC):
             result = result.scalar_one()
             await self.session.commit()
         except NoResultFound as e:
+            await self.session.rollback()
             raise EntityNotFoundException from e
         except IntegrityError as e:
+            await self.session.rollback()
             raise EntityExistsException from e
         return result.to_entity()
 
-    async def get_by_id(self, id_: UUID) -> Entity | None:
+    async def get_by_id(self, id_: UUID, use_primary: bool = False) -> Entity | None:
         """
         Получает сущность по её идентификатору.
 
+        Запрос может быть выполнен на реплике базы данных, если не требуется чтение с основной базы данных.
+        Строка не блокируется: соединение возвращается в пул сразу после чтения.
+
         :param id_: Уникальный идентификатор сущности.
+        :param use_primary: Читать с основной базы данных, а не с реплики, например внутри изменения сущности.
         :return: Сущность или None, если сущность не была найдена.
         """
 
         stmt = (
             select(self.dao)
             .filter_by(id=id_)
+            .execution_options(read_replica=not use_primary)
         )
 
-        result = await self.session.execute(stmt)
-        result = result.scalar_one_or_none()
+        try:
+            result = await self.session.execute(stmt)
+            result = result.scalar_one_or_none()
+        finally:
+            await self.release_connection()
         return result.to_entity() if result else None
 
     async def get_all(self) -> Sequence[Entity]:
         """
         Получает все сущности.
+        Запрос может быть выполнен на реплике базы данных.
 
         :return: Список сущностей.
         """
 
         stmt = (
             select(self.dao)
+            .execution_options(read_replica=True)
         )
 
         try:
@@ -125,6 +147,8 @@ class BaseDBRepository(BaseRepository[Entity], ABC):
             result = result.scalars().all()
         except NoResultFound:
             return []
+        finally:
+            await self.release_connection()
 
         return [dao.to_entity() for dao in result]
 
@@ -142,5 +166,15 @@ class BaseDBRepository(BaseRepository[Entity], ABC):
 
         result = await self.session.execute(stmt)
         if not result.rowcount:
+            await self.session.rollback()
             raise EntityNotFoundException
         await self.session.commit()
+
+    async def release_connection(self) -> None:
+        """
+        Завершает транзакцию только для чтения и возвращает соединение в пул.
+        Сессия остаётся пригодной для следующих запросов и возьмёт соединение заново при первом из них,
+        поэтому соединение не занято, пока запрос обрабатывается без базы данных: из кэша или хранилища.
+        Вызывается после запросов чтения, так как все записи в репозиториях фиксируются сразу.
+        """
+        await self.session.close()
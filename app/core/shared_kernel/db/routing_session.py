@@ -0,0 +1,95 @@
+"""
+Маршрутизация запросов сессии между основной базой данных и репликами ReplicaRouter, RoutingSession.
+"""
+import itertools
+import time
+from typing import Callable, Sequence
+
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+READ_REPLICA_OPTION = 'read_replica'
+
+
+class ReplicaRouter:
+    """
+    Выбирает реплику для запросов чтения и отслеживает записи в основную базу данных.
+    После записи чтения в течение `lag_window` секунд выполняются на основной базе,
+    чтобы не получить с отстающей реплики данные без только что записанных изменений.
+    Время последней записи учитывается только в пределах процесса: при нескольких процессах-обработчиках
+    чтение в другом процессе сразу после записи может получить устаревшие данные с реплики.
+    Чтения, по которым выполняется запись, следует выполнять без опции `read_replica`.
+
+    :ivar lag_window: Время в секундах после записи, в течение которого реплики не используются.
+    """
+
+    def __init__(self,
+                 replica_engines: Sequence[AsyncEngine],
+                 lag_window: float,
+                 timer: Callable[[], float] = time.monotonic):
+        """
+        Конструктор ReplicaRouter.
+
+        :param replica_engines: Движки реплик базы данных.
+        :param lag_window: Время в секундах после записи, в течение которого реплики не используются.
+        :param timer: Функция текущего времени в секундах.
+        """
+        self.lag_window = lag_window
+        self._replicas = itertools.cycle([replica.sync_engine for replica in replica_engines]) \
+            if replica_engines else None
+        self._timer = timer
+        self._last_write_at: float | None = None
+
+    def mark_write(self) -> None:
+        """
+        Отмечает запись в основную базу данных.
+        """
+        self._last_write_at = self._timer()
+
+    def get_replica(self) -> Engine | None:
+        """
+        Выбирает реплику для чтения по кругу.
+
+        :return: Движок реплики или None, если реплик нет или недавно была запись.
+        """
+        if self._replicas is None:
+            return None
+        if self._last_write_at is not None and self._timer() - self._last_write_at < self.lag_window:
+            return None
+        return next(self._replicas)
+
+
+class RoutingSession(Session):
+    """
+    Синхронная сессия для :class:`AsyncSession`, выполняющая запросы чтения на репликах.
+    На реплику направляются только запросы с опцией выполнения `read_replica=True`
+    до первой записи в сессии; остальные запросы выполняются на основной базе данных.
+
+    :ivar replica_router: Маршрутизатор реплик, None - реплики не используются.
+    """
+
+    def __init__(self, *args, replica_router: ReplicaRouter = None, **kwargs):
+        """
+        Конструктор RoutingSession.
+        Принимает те же аргументы, что и :class:`Session`.
+
+        :param replica_router: Маршрутизатор реплик, None - реплики не используются.
+        """
+        super().__init__(*args, **kwargs)
+        self.replica_router = replica_router
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        """
+        Выбирает движок для выполнения запроса.
+        """
+        if self.replica_router is not None and clause is not None:
+            if isinstance(clause, UpdateBase):
+                self.info['has_writes'] = True
+                self.replica_router.mark_write()
+            elif clause.get_execution_options().get(READ_REPLICA_OPTION) and not self.info.get('has_writes'):
+                replica = self.replica_router.get_replica()
+                if replica is not None:
+                    return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
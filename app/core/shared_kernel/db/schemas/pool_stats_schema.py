@@ -0,0 +1,49 @@
+from pydantic import BaseModel
+
+
+class PoolWaitHistogramSchema(BaseModel):
+    """
+    Гистограмма времени ожидания соединения из пула.
+
+    :cvar buckets: Количество ожиданий не дольше границы корзины в секундах, накопительно.
+    :cvar count: Общее количество ожиданий.
+    :cvar sum: Суммарное время ожидания в секундах.
+    :cvar timeouts: Количество ожиданий, завершившихся таймаутом.
+    """
+
+    buckets: dict[str, int]
+    count: int
+    sum: float
+    timeouts: int
+
+
+class PoolStatsSchema(BaseModel):
+    """
+    Состояние пула соединений с базой данных.
+
+    :cvar size: Постоянный размер пула.
+    :cvar max_overflow: Максимальное количество соединений сверх размера пула.
+    :cvar checked_in: Количество свободных соединений в пуле.
+    :cvar checked_out: Количество выданных соединений.
+    :cvar overflow: Количество открытых соединений сверх размера пула, отрицательное - пул ещё не заполнен.
+    :cvar wait: Гистограмма времени ожидания соединения.
+    """
+
+    size: int
+    max_overflow: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    wait: PoolWaitHistogramSchema
+
+
+class EnginePoolStatsSchema(BaseModel):
+    """
+    Состояние пулов соединений с основной базой данных и её репликами.
+
+    :cvar primary: Состояние пула соединений с основной базой данных.
+    :cvar replicas: Состояния пулов соединений с репликами в порядке их настройки.
+    """
+
+    primary: PoolStatsSchema
+    replicas: list[PoolStatsSchema]
@@ -37,11 +37,13 @@ class BaseRepository(ABC, Generic[Entity]):
         ...
 
     @abstractmethod
-    async def get_by_id(self, id_: UUID) -> Entity | None:
+    async def get_by_id(self, id_: UUID, use_primary: bool = False) -> Entity | None:
         """
         Получает сущность по её идентификатору.
 
         :param id_: Уникальный идентификатор сущности.
+        :param use_primary: Получить сущность в актуальном состоянии из основного хранилища, а не из кэша
+            или реплики, например внутри изменения сущности. Сущность при этом не блокируется.
         :return: Сущность или None, если сущность не была найдена.
         """
         ...
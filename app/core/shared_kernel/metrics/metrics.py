@@ -0,0 +1,151 @@
+"""
+Метрики Prometheus приложения.
+Включает в себя метрики HTTP-запросов, запросов к базе данных, операций с S3 хранилищем и кэшей.
+"""
+import os
+import time
+from contextvars import ContextVar
+
+from prometheus_client import Counter, Gauge, Histogram, multiprocess
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+HTTP_REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'Время обработки HTTP-запроса в секундах.',
+    ['method', 'route', 'status'],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    'http_requests_in_progress',
+    'Количество обрабатываемых HTTP-запросов.',
+    ['method'],
+    multiprocess_mode='livesum',
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    'http_response_size_bytes',
+    'Размер тела HTTP-ответа в байтах.',
+    ['method', 'route'],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000, float('inf')),
+)
+HTTP_REQUEST_DB_DURATION = Histogram(
+    'http_request_db_duration_seconds',
+    'Суммарное время запросов к базе данных за один HTTP-запрос в секундах.',
+    ['method', 'route'],
+)
+DB_QUERY_DURATION = Histogram(
+    'db_query_duration_seconds',
+    'Время выполнения запроса к базе данных в секундах.',
+    ['operation'],
+)
+DB_QUERY_ERRORS = Counter(
+    'db_query_errors',
+    'Количество запросов к базе данных, завершившихся ошибкой.',
+    ['operation'],
+)
+S3_OPERATION_DURATION = Histogram(
+    's3_operation_duration_seconds',
+    'Время операции с S3 хранилищем в секундах.',
+    ['operation'],
+)
+PASSWORD_HASHING_QUEUE_DEPTH = Gauge(
+    'password_hashing_queue_depth',
+    'Количество запросов, ожидающих хэширования пароля.',
+    multiprocess_mode='livesum',
+)
+PASSWORD_HASHING_IN_PROGRESS = Gauge(
+    'password_hashing_in_progress',
+    'Количество выполняющихся хэширований паролей.',
+    multiprocess_mode='livesum',
+)
+CACHE_HITS = Counter(
+    'cache_hits',
+    'Количество попаданий в кэш.',
+    ['cache'],
+)
+CACHE_MISSES = Counter(
+    'cache_misses',
+    'Количество промахов кэша.',
+    ['cache'],
+)
+
+MULTIPROC_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
+
+class RequestDbTimer:
+    """
+    Накопитель времени запросов к базе данных в пределах одного HTTP-запроса.
+
+    :ivar seconds: Суммарное время запросов в секундах.
+    """
+
+    def __init__(self):
+        """
+        Конструктор RequestDbTimer.
+        """
+        self.seconds = 0.0
+
+
+request_db_timer: ContextVar[RequestDbTimer | None] = ContextVar('request_db_timer', default=None)
+
+
+def reset_multiprocess_dir() -> None:
+    """
+    Удаляет файлы метрик прошлых запусков из каталога метрик процессов-обработчиков.
+    Вызывается один раз до запуска процессов-обработчиков, иначе счётчики продолжатся со старых значений.
+    Файлы текущего процесса сохраняются: с одним процессом-обработчиком он сам обрабатывает запросы.
+    """
+    directory = os.environ.get(MULTIPROC_DIR_ENV)
+    if not directory or not os.path.isdir(directory):
+        return
+    current_process_suffix = f'_{os.getpid()}.db'
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.endswith('.db') and not entry.name.endswith(current_process_suffix):
+            os.unlink(entry.path)
+
+
+def mark_process_dead() -> None:
+    """
+    Отмечает завершение текущего процесса-обработчика, чтобы его показатели `livesum`
+    больше не учитывались в метриках.
+    """
+    if MULTIPROC_DIR_ENV in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def get_query_operation(statement: str) -> str:
+    """
+    Получает вид запроса к базе данных по первому слову SQL-выражения.
+
+    :param statement: SQL-выражение.
+    :return: Вид запроса в нижнем регистре, например `select` или `insert`.
+    """
+    operation, _, _ = statement.lstrip().partition(' ')
+    return operation.lower() or 'unknown'
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Подключает к движку базы данных сбор времени выполнения запросов.
+    Время запроса учитывается в общей гистограмме и во времени текущего HTTP-запроса.
+
+    :param engine: Асинхронный движок SQLAlchemy.
+    """
+
+    @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['query_started'].pop()
+        DB_QUERY_DURATION.labels(operation=get_query_operation(statement)).observe(elapsed)
+        timer = request_db_timer.get()
+        if timer is not None:
+            timer.seconds += elapsed
+
+    @event.listens_for(engine.sync_engine, 'handle_error')
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('query_started'):
+            connection.info['query_started'].pop()
+        DB_QUERY_ERRORS.labels(operation=get_query_operation(exception_context.statement or '')).inc()
@@ -46,4 +46,3 @@ class TokenCorruptedException(AuthenticationException):
         :param msg: Сообщение исключения.
         """
         super().__init__(msg)
-
@@ -3,7 +3,7 @@
 """
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.core.shared_kernel.domain.value_objects.user_role import UserRole
 
@@ -11,11 +11,13 @@ from app.core.shared_kernel.domain.value_objects.user_role import UserRole
 class UserFromTokenSchema(BaseModel):
     """
     Схема пользователя из токена.
+    Неизменяема, так как один экземпляр из кэша проверенных токенов доступа используется всеми запросами с этим токеном.
 
     :cvar uuid: Идентификатор пользователя.
     :cvar role: Роль пользователя.
     :cvar token_id: Идентификатор токена.
     """
+    model_config = ConfigDict(frozen=True)
 
     uuid: UUID
     role: UserRole
@@ -46,10 +46,11 @@ class AuthenticationService:
         :param data: Данные пользователя.
         :return: Пара токенов доступа и обновления.
         """
+        password_hash = await PasswordService.hash_password_async(data.password)
         user = User(
             uuid=UserUUID(uuid4()),
             login=Login(data.login),
-            password_hash=PasswordHash(PasswordService.hash_password(data.password)),
+            password_hash=PasswordHash(password_hash),
             email=Email(data.email),
             name=UserName(first_name=data.name.first_name,
                           second_name=data.name.second_name),
@@ -77,7 +78,7 @@ class AuthenticationService:
         user = await self.user_repository.get_by_login(user_login.login)
         if not user:
             raise UserNotFoundException
-        if not PasswordService.validate_password(user_login.password, user.password_hash.password_hash):
+        if not await PasswordService.validate_password_async(user_login.password, user.password_hash.password_hash):
             raise WrongPasswordException
 
         user_to_token = UserToTokenSchema(uuid=str(user.uuid.uuid),
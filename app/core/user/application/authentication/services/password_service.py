@@ -1,17 +1,52 @@
 """
 Сервис для работы с паролями пользователей.
 """
+import asyncio
 import hashlib
+import hmac
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
+from app.core.shared_kernel.metrics.metrics import PASSWORD_HASHING_QUEUE_DEPTH, PASSWORD_HASHING_IN_PROGRESS
 from app.settings import AuthenticationSettings
 
 settings = AuthenticationSettings()
 
 
+def _pbkdf2_hex(hash_algorithm: str, password: str, salt: str, iterations: int) -> str:
+    """
+    Вычисляет хэш пароля PBKDF2.
+    Функция уровня модуля, чтобы её можно было передать в пул процессов.
+
+    :param hash_algorithm: Алгоритм хэширования.
+    :param password: Пароль.
+    :param salt: Соль.
+    :param iterations: Количество итераций.
+    :return: Хэш пароля в шестнадцатеричном виде.
+    """
+    return hashlib.pbkdf2_hmac(hash_algorithm, password.encode(), salt.encode(), iterations).hex()
+
+
 class PasswordService:
     """
     Сервис для работы с паролями пользователей.
+
+    Асинхронные методы выполняют хэширование в отдельном пуле (потоков или процессов),
+    не блокируя цикл событий. Количество одновременно хэшируемых паролей ограничено,
+    остальные запросы ожидают в очереди. Глубина очереди и количество выполняющихся хэширований
+    экспортируются в метрики Prometheus.
+
+    :cvar _executor: Пул для хэширования паролей.
+    :cvar _semaphore: Ограничитель количества одновременных хэширований.
+    :cvar _queue_depth: Количество запросов, ожидающих хэширования.
+    :cvar _in_progress: Количество выполняющихся хэширований.
     """
+
+    _executor: Executor | None = None
+    _semaphore: asyncio.Semaphore | None = None
+    _queue_depth: int = 0
+    _in_progress: int = 0
+
     @classmethod
     def hash_password(cls, password: str) -> str:
         """
@@ -19,11 +54,7 @@ class PasswordService:
         :param password: Пароль.
         :return: Хэш пароля.
         """
-        hashed = hashlib.pbkdf2_hmac(settings.hash_algorithm,
-                                     password.encode(),
-                                     settings.password_salt.encode(),
-                                     settings.iters_hashing)
-        return hashed.hex()
+        return _pbkdf2_hex(settings.hash_algorithm, password, settings.password_salt, settings.iters_hashing)
 
     @classmethod
     def validate_password(cls, login_password, hashed_password: str) -> bool:
@@ -34,3 +65,97 @@ class PasswordService:
         :return: True, если пароль соответствует хэшу, False иначе.
         """
         return cls.hash_password(login_password) == hashed_password
+
+    @classmethod
+    async def hash_password_async(cls, password: str) -> str:
+        """
+        Хэширует пароль в пуле, не блокируя цикл событий.
+        :param password: Пароль.
+        :return: Хэш пароля.
+        """
+        semaphore = cls._get_semaphore()
+
+        cls._queue_depth += 1
+        PASSWORD_HASHING_QUEUE_DEPTH.inc()
+        try:
+            await semaphore.acquire()
+        finally:
+            cls._queue_depth -= 1
+            PASSWORD_HASHING_QUEUE_DEPTH.dec()
+
+        cls._in_progress += 1
+        PASSWORD_HASHING_IN_PROGRESS.inc()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(cls._get_executor(), _pbkdf2_hex,
+                                              settings.hash_algorithm,
+                                              password,
+                                              settings.password_salt,
+                                              settings.iters_hashing)
+        finally:
+            cls._in_progress -= 1
+            PASSWORD_HASHING_IN_PROGRESS.dec()
+            semaphore.release()
+
+    @classmethod
+    async def validate_password_async(cls, login_password: str, hashed_password: str) -> bool:
+        """
+        Проверяет пароль с хэшом пароля на идентичность, не блокируя цикл событий.
+        :param login_password: Пароль
+        :param hashed_password: Хэш пароля
+        :return: True, если пароль соответствует хэшу, False иначе.
+        """
+        return hmac.compare_digest(await cls.hash_password_async(login_password), hashed_password)
+
+    @classmethod
+    def get_queue_depth(cls) -> int:
+        """
+        Получает количество запросов, ожидающих хэширования.
+        :return: Глубина очереди.
+        """
+        return cls._queue_depth
+
+    @classmethod
+    def get_in_progress(cls) -> int:
+        """
+        Получает количество выполняющихся хэширований.
+        :return: Количество хэширований.
+        """
+        return cls._in_progress
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Останавливает пул хэширования и сбрасывает ограничитель хэширований.
+        Ограничитель привязывается к циклу событий, поэтому после остановки цикла, например после задач
+        инициализации в `asyncio.run`, следующий цикл создаёт собственный ограничитель.
+        """
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+        cls._semaphore = None
+
+    @classmethod
+    def _get_executor(cls) -> Executor:
+        """
+        Получает пул хэширования, создавая его при первом обращении.
+        :return: Пул потоков или процессов.
+        """
+        if cls._executor is None:
+            if settings.hashing_pool == 'process':
+                cls._executor = ProcessPoolExecutor(max_workers=settings.hashing_workers,
+                                                    mp_context=multiprocessing.get_context('spawn'))
+            else:
+                cls._executor = ThreadPoolExecutor(max_workers=settings.hashing_workers,
+                                                   thread_name_prefix='password_hashing')
+        return cls._executor
+
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        """
+        Получает ограничитель одновременных хэширований, создавая его при первом обращении.
+        :return: Семафор.
+        """
+        if cls._semaphore is None:
+            cls._semaphore = asyncio.Semaphore(settings.hashing_max_concurrency)
+        return cls._semaphore
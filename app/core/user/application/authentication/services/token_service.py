@@ -1,12 +1,15 @@
 """
 Сервис для работы с JWT токенами.
 """
+import hashlib
+import time
 from datetime import datetime, timedelta
 from uuid import uuid4, UUID
 
 import jwt
 from jwt import ExpiredSignatureError, InvalidTokenError
 
+from app.core.shared_kernel.cache.lru_ttl_cache import LRUTTLCache
 from app.core.shared_kernel.domain.value_objects.user_role import UserRole
 from app.core.user.application.authentication.exceptions import TokenExpiredException, TokenCorruptedException
 from app.core.user.application.authentication.schemas.access_token_schema import AccessTokenSchema
@@ -21,7 +24,16 @@ settings = AuthenticationSettings()
 class TokenService:
     """
     Сервис для работы с JWT токенами.
+
+    Проверенные токены доступа кэшируются в памяти процесса до истечения их времени жизни,
+    поэтому повторная проверка того же токена не выполняет проверку подписи и разбор токена.
+
+    :cvar _access_token_cache: Кэш пользователей из проверенных токенов доступа по хэшу токена.
     """
+    _access_token_cache: LRUTTLCache[bytes, UserFromTokenSchema] = LRUTTLCache(
+        max_size=settings.access_token_cache_size,
+        name='access_token'
+    )
 
     @classmethod
     def create_access_token(cls, data: UserToTokenSchema) -> AccessTokenSchema:
@@ -41,15 +53,34 @@ class TokenService:
     def decode_access_token(cls, access_token: str) -> UserFromTokenSchema:
         """
         Декодирует токен доступа.
+        Проверенный токен кэшируется до истечения его времени жизни.
         :param access_token: Токен доступа.
         :return: Информация о пользователе.
+        :raise TokenExpiredException: Время жизни токена истекло.
+        :raise TokenCorruptedException: Токен повреждён.
         """
+        token_digest = cls._get_token_digest(access_token)
+        user = cls._access_token_cache.get(token_digest)
+        if user is not None:
+            return user
+
         data = cls._decode(token=access_token, secret_key=settings.access_secret_key)
         user = UserFromTokenSchema(uuid=UUID(data['uuid']),
                                    role=UserRole(data['role']),
                                    token_id=data['token_id'])
+
+        ttl = data['exp'] - time.time()
+        if ttl > 0:
+            cls._access_token_cache.set(token_digest, user, ttl=ttl)
         return user
 
+    @classmethod
+    def clear_access_token_cache(cls) -> None:
+        """
+        Очищает кэш проверенных токенов доступа, например после смены секретного ключа.
+        """
+        cls._access_token_cache.clear()
+
     @classmethod
     def create_refresh_token(cls, data: UserToTokenSchema) -> RefreshTokenSchema:
         """
@@ -94,6 +125,15 @@ class TokenService:
         encoded_jwt = jwt.encode(to_encode, secret_key, settings.jwt_algorithm)
         return encoded_jwt
 
+    @classmethod
+    def _get_token_digest(cls, token: str) -> bytes:
+        """
+        Получает хэш токена для ключа кэша, чтобы не хранить в кэше сами токены.
+        :param token: Токен.
+        :return: Хэш токена SHA-256.
+        """
+        return hashlib.sha256(token.encode()).digest()
+
     @classmethod
     def _decode(cls, token: str, secret_key: str) -> dict:
         """
@@ -118,10 +118,11 @@ class UserService:
         :return: Информация добавленного пользователя.
         :raise UserExistsException: Добавление пользователя, который уже существует.
         """
+        password_hash = await PasswordService.hash_password_async(data.password)
         user = User(
             uuid=UserUUID(uuid4()),
             login=Login(data.login),
-            password_hash=PasswordHash(PasswordService.hash_password(data.password)),
+            password_hash=PasswordHash(password_hash),
             email=Email(data.email),
             name=UserName(first_name=data.name.first_name,
                           second_name=data.name.second_name),
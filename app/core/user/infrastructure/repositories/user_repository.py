@@ -31,8 +31,11 @@ class UserDBRepository(UserRepository, BaseDBRepository[User]):
         :return: Пользователь или None, если пользователь не был найден.
         """
         query = select(self.dao).filter_by(login=login)
-        result = await self.session.execute(query)
-        result = result.scalar_one_or_none()
+        try:
+            result = await self.session.execute(query)
+            result = result.scalar_one_or_none()
+        finally:
+            await self.release_connection()
 
         return result.to_entity() if result else None
 
@@ -50,5 +53,7 @@ class UserDBRepository(UserRepository, BaseDBRepository[User]):
             result = result.scalars().all()
         except NoResultFound:
             return []
+        finally:
+            await self.release_connection()
 
         return [dao.to_entity() for dao in result]
@@ -1,22 +1,99 @@
 import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 import uvicorn
 from fastapi import FastAPI
 
 from app.api.api import api_routers
+from app.api.mem.dependencies import image_variant_executor
+from app.api.metrics.controllers import metrics_router
+from app.api.middlewares.metrics_middleware import MetricsMiddleware
 from app.core.helpers.creation_helper import CreationHelper
+from app.core.mem.application.services.mem_service import MemService
+from app.core.shared_kernel.db.dependencies import engine, replica_engines, image_executor, get_s3_client, \
+    get_s3_public_client, close_s3_clients
+from app.core.shared_kernel.metrics.metrics import reset_multiprocess_dir, mark_process_dead
+from app.core.user.application.authentication.services.password_service import PasswordService
+from app.settings import ServerSettings, ImageStorageSettings
 
-app = FastAPI()
+server_settings = ServerSettings()
+image_storage_settings = ImageStorageSettings()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Жизненный цикл процесса-обработчика запросов.
+    При запуске создаёт общие для процесса клиенты S3, чтобы первые запросы не тратили на это время.
+    При остановке, после завершения обрабатываемых запросов, дожидается фоновых задач
+    и освобождает ресурсы процесса: соединения с базой данных и S3, пулы потоков и процессов.
+
+    :param app: Приложение.
+    """
+    get_s3_client()
+    get_s3_public_client()
+    yield
+    await MemService.wait_background_tasks(timeout=server_settings.graceful_shutdown_timeout)
+    for db_engine in [engine, *replica_engines]:
+        await db_engine.dispose()
+    image_executor.shutdown(wait=True)
+    close_s3_clients()
+    if image_variant_executor is not None:
+        image_variant_executor.shutdown(wait=True)
+    PasswordService.shutdown()
+    mark_process_dead()
+
+
+app = FastAPI(lifespan=lifespan)
 
 for api_router in api_routers:
     app.include_router(api_router, prefix="/api")
 
+app.include_router(metrics_router)
+app.add_middleware(MetricsMiddleware)
+
+
+async def run_startup_tasks() -> None:
+    """
+    Выполняет задачи инициализации системы один раз до запуска процессов-обработчиков.
+    Соединения с базой данных и S3 закрываются, чтобы не передавать их в процессы-обработчики,
+    а пул и ограничитель хэширования паролей сбрасываются, чтобы не использовать их в цикле событий сервера.
+    """
+    try:
+        CreationHelper.create_image_bucket()
+        await CreationHelper.create_base_admin()
+    finally:
+        await engine.dispose()
+        close_s3_clients()
+        PasswordService.shutdown()
+
+
+def check_server_settings() -> None:
+    """
+    Проверяет совместимость настроек сервера с остальными настройками приложения.
+    Дисковый кэш картинок ведёт индекс в памяти процесса и сбрасывает записи только в своём процессе,
+    поэтому несколько процессов-обработчиков в одном каталоге кэша мешали бы друг другу
+    и отдавали бы устаревшие картинки после их изменения.
+
+    :raise ValueError: Несовместимые настройки.
+    """
+    if server_settings.workers > 1 and image_storage_settings.disk_cache_dir:
+        raise ValueError('Дисковый кэш картинок (IMAGES_DISK_CACHE_DIR) поддерживается только '
+                         'с одним процессом-обработчиком (APP_WORKERS=1).')
+
 
-async def main():
-    CreationHelper.create_image_bucket()
-    await CreationHelper.create_base_admin()
-    uvicorn.run(app="main:app", host='0.0.0.0', port=3000, reload=True)
+def main():
+    check_server_settings()
+    reset_multiprocess_dir()
+    asyncio.run(run_startup_tasks())
+    uvicorn.run(app="main:app",
+                host=server_settings.host,
+                port=server_settings.port,
+                workers=server_settings.workers,
+                reload=server_settings.reload,
+                timeout_graceful_shutdown=server_settings.graceful_shutdown_timeout)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -2,6 +2,8 @@
 Настройки проекта.
 """
 
+from typing import Literal
+
 from dotenv import load_dotenv
 from pydantic import PostgresDsn, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -9,6 +11,26 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 load_dotenv()
 
 
+class ServerSettings(BaseSettings):
+    """
+    Настройки HTTP-сервера приложения.
+
+    :cvar host: Адрес, на котором запущен сервер.
+    :cvar port: Порт, на котором запущен сервер.
+    :cvar workers: Количество процессов-обработчиков запросов.
+    :cvar reload: Перезапускать ли сервер при изменении файлов, только для разработки и с одним процессом.
+    :cvar graceful_shutdown_timeout: Время в секундах, в течение которого при остановке сервера
+        завершаются обрабатываемые запросы.
+    """
+    model_config = SettingsConfigDict(env_prefix='app_')
+
+    host: str = '0.0.0.0'
+    port: int = 3000
+    workers: int = 1
+    reload: bool = False
+    graceful_shutdown_timeout: int = 30
+
+
 class DatabaseSettings(BaseSettings):
     """
     Настройки для работы с базой данных.
@@ -17,11 +39,43 @@ class DatabaseSettings(BaseSettings):
     :cvar s3_storage_url: Url подключения к S3.
     :cvar s3_access_key_id: Идентификатор ключа S3.
     :cvar s3_secret_access_key: Секретный ключ S3.
+    :cvar s3_public_url: Url S3, доступный клиентам, для подписанных ссылок на изображения.
+        Если не задан, используется `s3_storage_url`.
+    :cvar db_pool_size: Постоянный размер пула соединений с PostgreSQL.
+    :cvar db_max_overflow: Максимальное количество соединений сверх размера пула.
+    :cvar db_pool_timeout: Время ожидания свободного соединения из пула в секундах.
+    :cvar db_pool_recycle: Время жизни соединения в секундах, после которого оно переоткрывается, -1 - без ограничения.
+    :cvar db_pool_pre_ping: Проверять ли соединение перед выдачей из пула.
+    :cvar db_statement_cache_size: Размер кэша подготовленных выражений asyncpg на соединение,
+        0 - кэш отключён (нужно для PgBouncer в режиме transaction).
+    :cvar postgres_replica_urls: Url подключения к репликам PostgreSQL для запросов чтения.
+    :cvar db_replica_lag_window: Время в секундах после записи, в течение которого чтение
+        выполняется на основной базе данных, а не на репликах.
+    :cvar s3_max_pool_connections: Максимальное количество HTTP-соединений клиента S3;
+        если оно меньше количества потоков для операций с S3 хранилищем, используется количество потоков.
+    :cvar s3_connect_timeout: Время ожидания подключения к S3 в секундах.
+    :cvar s3_read_timeout: Время ожидания ответа S3 в секундах.
+    :cvar s3_max_attempts: Максимальное количество попыток запроса к S3, включая первую.
+    :cvar s3_retry_mode: Режим повторов запросов к S3 botocore: `legacy`, `standard` или `adaptive`.
     """
     postgres_url: PostgresDsn
     s3_access_key_id: str
     s3_secret_access_key: str
     s3_storage_url: str
+    s3_public_url: str | None = None
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100
+    postgres_replica_urls: list[PostgresDsn] = []
+    db_replica_lag_window: float = 1.0
+    s3_max_pool_connections: int = 16
+    s3_connect_timeout: float = 5
+    s3_read_timeout: float = 60
+    s3_max_attempts: int = 3
+    s3_retry_mode: Literal['legacy', 'standard', 'adaptive'] = 'standard'
 
 
 class ImageStorageSettings(BaseSettings):
@@ -29,10 +83,76 @@ class ImageStorageSettings(BaseSettings):
     Настройки для работы с S3 хранилищем с изображенями.
 
     :cvar bucket_name: Имя бакета с изображениями.
+    :cvar max_workers: Максимальное количество потоков для операций с S3 хранилищем.
+    :cvar chunk_size: Размер части изображения в байтах при потоковой отдаче.
+    :cvar disk_cache_dir: Каталог кэша изображений на локальном диске, None - кэш отключён.
+    :cvar disk_cache_max_bytes: Максимальный объём кэша изображений на локальном диске в байтах.
+    :cvar max_upload_size: Максимальный размер загружаемого изображения в байтах.
+    :cvar multipart_part_size: Размер части multipart-загрузки изображения в S3 в байтах, не меньше 5 Мб.
+    :cvar variants_enabled: Создавать ли уменьшенные варианты картинок в формате WebP после загрузки.
+    :cvar variants_thumb_size: Максимальный размер большей стороны миниатюры в пикселях.
+    :cvar variants_medium_size: Максимальный размер большей стороны картинки среднего размера в пикселях.
+    :cvar variants_quality: Качество WebP вариантов картинок от 0 до 100.
+    :cvar variants_pool: Тип пула для создания вариантов картинок: потоки или процессы.
+    :cvar variants_workers: Количество исполнителей в пуле создания вариантов картинок.
+    :cvar url_expiration: Время жизни подписанной ссылки на изображение в секундах.
+    :cvar delivery_mode: Способ отдачи картинки мема: через приложение (`proxy`),
+        перенаправлением на подписанную ссылку (`redirect`) или через X-Accel-Redirect прокси-сервера (`accel`).
+    :cvar accel_redirect_location: Внутренний location прокси-сервера для X-Accel-Redirect.
     """
     model_config = SettingsConfigDict(env_prefix='images_')
 
     bucket_name: str
+    max_workers: int = 16
+    chunk_size: int = 64 * 2**10
+    disk_cache_dir: str | None = None
+    disk_cache_max_bytes: int = 2**30
+    max_upload_size: int = 8 * 2**20
+    multipart_part_size: int = 5 * 2**20
+    variants_enabled: bool = True
+    variants_thumb_size: int = 256
+    variants_medium_size: int = 1024
+    variants_quality: int = 80
+    variants_pool: Literal['thread', 'process'] = 'thread'
+    variants_workers: int = 2
+    url_expiration: int = 300
+    delivery_mode: Literal['proxy', 'redirect', 'accel'] = 'proxy'
+    accel_redirect_location: str = '/internal-images/'
+
+
+class MemSettings(BaseSettings):
+    """
+    Настройки для работы с мемами.
+
+    :cvar cache_enabled: Включено ли кэширование мемов в памяти процесса.
+    :cvar cache_max_size: Максимальное количество мемов в кэше.
+    :cvar cache_ttl: Время жизни мема в кэше в секундах.
+    :cvar batch_max_size: Максимальное количество мемов в одном запросе пакетного добавления.
+    :cvar batch_max_upload_size: Максимальный суммарный размер картинок в одном запросе пакетного добавления в байтах.
+    :cvar batch_upload_concurrency: Количество картинок, одновременно загружаемых в хранилище
+        при пакетном добавлении.
+    :cvar export_batch_size: Количество мемов, читаемых из базы данных и отправляемых клиенту за раз при выгрузке.
+    :cvar image_dedup_enabled: Хранить ли картинки по хэшу содержимого, загружая одинаковые картинки один раз.
+    :cvar http_cache_max_age: Время в секундах, в течение которого клиенты могут не перепроверять мем и его картинку.
+    :cvar count_exact_threshold: Количество мемов, до которого общее количество на странице считается точно;
+        для больших таблиц используется оценка по статистике PostgreSQL.
+    :cvar count_cache_ttl: Время жизни общего количества мемов в кэше в секундах.
+    :cvar lookup_max_size: Максимальное количество идентификаторов в одном запросе получения мемов по списку.
+    """
+    model_config = SettingsConfigDict(env_prefix='memes_')
+
+    cache_enabled: bool = True
+    cache_max_size: int = 10000
+    cache_ttl: float = 60
+    batch_max_size: int = 1000
+    batch_max_upload_size: int = 64 * 2**20
+    batch_upload_concurrency: int = 4
+    export_batch_size: int = 1000
+    image_dedup_enabled: bool = False
+    http_cache_max_age: int = 60
+    count_exact_threshold: int = 10000
+    count_cache_ttl: float = 10
+    lookup_max_size: int = 100
 
 
 class AuthenticationSettings(BaseSettings):
@@ -47,6 +167,10 @@ class AuthenticationSettings(BaseSettings):
     :cvar password_salt: Соль для хэширования пароля пользователя.
     :cvar iters_hashing: Количество итераций для хэширования пароля пользователя.
     :cvar hash_algorithm: Алгоритм для хэширования пароля пользователя.
+    :cvar hashing_pool: Тип пула для хэширования паролей: потоки или процессы.
+    :cvar hashing_workers: Количество потоков или процессов в пуле хэширования.
+    :cvar hashing_max_concurrency: Максимальное количество одновременно хэшируемых паролей.
+    :cvar access_token_cache_size: Максимальное количество проверенных токенов доступа в кэше, 0 - кэш отключён.
     """
 
     access_secret_key: str
@@ -57,6 +181,10 @@ class AuthenticationSettings(BaseSettings):
     password_salt: str
     iters_hashing: int
     hash_algorithm: str
+    hashing_pool: Literal['thread', 'process'] = 'thread'
+    hashing_workers: int = 4
+    hashing_max_concurrency: int = 4
+    access_token_cache_size: int = 10000
 
 
 class BaseAdminSettings(BaseSettings):
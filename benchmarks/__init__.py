@@ -0,0 +1,4 @@
+"""
+Бенчмарки горячих путей приложения.
+Запуск: `python -m benchmarks --output results.json [--compare baseline.json]`.
+"""
@@ -0,0 +1,56 @@
+"""
+Запуск бенчмарков из командной строки.
+"""
+import argparse
+import asyncio
+import sys
+
+from app.core.user.application.authentication.services.password_service import PasswordService
+from benchmarks.cases import BENCHMARKS, ASGI_BENCHMARKS, run_asgi_benchmarks
+from benchmarks.runner import BenchmarkResult, save_results, compare_results
+
+
+async def run(name_filter: str | None, include_asgi: bool) -> list[BenchmarkResult]:
+    """
+    Запускает бенчмарки и печатает их результаты.
+    Бенчмарки, не подходящие под фильтр, не запускаются.
+
+    :param name_filter: Подстрока названия для выбора бенчмарков.
+    :param include_asgi: Запускать ли бенчмарки приложения целиком.
+    :return: Результаты бенчмарков.
+    """
+    def selected(name: str) -> bool:
+        return not name_filter or name_filter in name
+
+    try:
+        results = [await benchmark(name) for name, benchmark in BENCHMARKS.items() if selected(name)]
+        if include_asgi:
+            results.extend(await run_asgi_benchmarks([name for name in ASGI_BENCHMARKS if selected(name)]))
+    finally:
+        PasswordService.shutdown()
+
+    for result in results:
+        print(f'{result.name:<45} median {result.median * 1e6:12.1f} мкс  '
+              f'p95 {result.p95 * 1e6:12.1f} мкс  {result.ops:12.0f} оп/с')
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Бенчмарки горячих путей приложения.')
+    parser.add_argument('--output', help='Путь к JSON-файлу для сохранения результатов.')
+    parser.add_argument('--compare', help='Путь к JSON-файлу базовых результатов для сравнения.')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Допустимое относительное замедление медианы (по умолчанию 0.1).')
+    parser.add_argument('--filter', dest='name_filter', help='Подстрока названия бенчмарков.')
+    parser.add_argument('--no-asgi', action='store_true', help='Не запускать бенчмарки приложения целиком.')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.name_filter, include_asgi=not args.no_asgi))
+    if args.output:
+        save_results(results, args.output)
+    if args.compare and compare_results(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,310 @@
+"""
+Бенчмарки горячих путей мемов и пользователей.
+Каждый бенчмарк подготавливает данные и возвращает результат замера.
+"""
+import os
+from functools import partial
+from io import BytesIO
+from typing import Sequence
+from uuid import uuid4
+
+import httpx
+
+from app.core.mem.application.schemas.mem_create_schema import MemCreateSchema
+from app.core.mem.application.schemas.mem_read_schema import MemReadSchema
+from app.core.mem.application.schemas.mem_update_schema import MemUpdateSchema
+from app.core.mem.application.services.mem_service import MemService
+from app.core.mem.domain.mem_entity import Mem
+from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
+from app.core.mem.domain.value_objects.image_path import ImagePath
+from app.core.mem.domain.value_objects.mem_text import MemText
+from app.core.mem.domain.value_objects.mem_uuid import MemUUID
+from app.core.mem.infrastructure.models.mem_dao import MemDao
+from app.core.shared_kernel.domain.value_objects.user_role import UserRole
+from app.core.user.application.authentication.schemas.user_from_token_schema import UserFromTokenSchema
+from app.core.user.application.authentication.schemas.user_to_token_schema import UserToTokenSchema
+from app.core.user.application.authentication.services.password_service import PasswordService
+from app.core.user.application.authentication.services.token_service import TokenService
+from benchmarks.in_memory import InMemoryMemRepository, InMemoryImageRepository
+from benchmarks.runner import BenchmarkResult, run_benchmark
+
+MEMES_COUNT = 1000
+IMAGE = os.urandom(256 * 1024)
+
+
+def create_mem() -> Mem:
+    """
+    Создаёт мем с картинкой.
+    """
+    return Mem(uuid=MemUUID(uuid4()), text=MemText('Когда бенчмарк наконец-то стабилен'),
+               image_path=ImagePath('mem_image'))
+
+
+async def create_mem_service() -> tuple[MemService, list[Mem]]:
+    """
+    Создаёт сервис мемов на репозиториях в памяти и заполняет его мемами.
+    """
+    memes = [create_mem() for _ in range(MEMES_COUNT)]
+    mem_repository = InMemoryMemRepository()
+    image_repository = InMemoryImageRepository()
+    await mem_repository.add(memes)
+    await image_repository.save_image('mem_image', BytesIO(IMAGE))
+    return MemService(mem_repository=mem_repository, image_repository=image_repository), memes
+
+
+async def bench_mem_dao_from_entity(name: str) -> BenchmarkResult:
+    """
+    Замеряет преобразование сущности мема в модель базы данных.
+
+    :param name: Название бенчмарка.
+    """
+    mem = create_mem()
+    return await run_benchmark(name, lambda: MemDao.from_entity(mem), iterations=1000)
+
+
+async def bench_mem_dao_to_entity(name: str) -> BenchmarkResult:
+    """
+    Замеряет преобразование модели базы данных в сущность мема.
+
+    :param name: Название бенчмарка.
+    """
+    dao = MemDao.from_entity(create_mem())
+    return await run_benchmark(name, dao.to_entity, iterations=1000)
+
+
+async def bench_mem_read_schema_from_entity(name: str) -> BenchmarkResult:
+    """
+    Замеряет создание схемы ответа из сущности мема.
+
+    :param name: Название бенчмарка.
+    """
+    mem = create_mem()
+    return await run_benchmark(name, lambda: MemReadSchema.from_entity(mem),
+                               iterations=1000)
+
+
+async def bench_mem_service_get_by_id(name: str) -> BenchmarkResult:
+    """
+    Замеряет получение мема по идентификатору.
+
+    :param name: Название бенчмарка.
+    """
+    mem_service, memes = await create_mem_service()
+    mem_id = memes[0].uuid.uuid
+    return await run_benchmark(name, lambda: mem_service.get_mem_by_id(mem_id),
+                               iterations=1000)
+
+
+async def bench_mem_service_get_page(name: str) -> BenchmarkResult:
+    """
+    Замеряет получение страницы из 50 мемов.
+
+    :param name: Название бенчмарка.
+    """
+    mem_service, _ = await create_mem_service()
+    mem_filter_params = MemFilterParams(page=10, per_page=50)
+    return await run_benchmark(name,
+                               lambda: mem_service.get_memes_page(mem_filter_params))
+
+
+async def bench_mem_service_get_by_ids(name: str) -> BenchmarkResult:
+    """
+    Замеряет получение 50 мемов по списку идентификаторов.
+
+    :param name: Название бенчмарка.
+    """
+    mem_service, memes = await create_mem_service()
+    mem_ids = [mem.uuid.uuid for mem in memes[:50]]
+    return await run_benchmark(name, lambda: mem_service.get_memes_by_ids(mem_ids))
+
+
+async def bench_mem_service_add_mem(name: str) -> BenchmarkResult:
+    """
+    Замеряет добавление мема без картинки.
+
+    :param name: Название бенчмарка.
+    """
+    mem_service, _ = await create_mem_service()
+    data = MemCreateSchema(text='Новый мем')
+    return await run_benchmark(name, lambda: mem_service.add_mem(data), iterations=1000)
+
+
+async def bench_mem_service_add_mem_with_image(name: str) -> BenchmarkResult:
+    """
+    Замеряет добавление мема с картинкой 256 Кб.
+
+    :param name: Название бенчмарка.
+    """
+    mem_service, _ = await create_mem_service()
+    data = MemCreateSchema(text='Новый мем')
+    return await run_benchmark(name,
+                               lambda: mem_service.add_mem(data, BytesIO(IMAGE)))
+
+
+async def bench_mem_service_update_mem(name: str) -> BenchmarkResult:
+    """
+    Замеряет обновление текста мема.
+
+    :param name: Название бенчмарка.
+    """
+    mem_service, memes = await create_mem_service()
+    data = MemUpdateSchema(uuid=memes[0].uuid.uuid, text='Обновлённый мем')
+    return await run_benchmark(name, lambda: mem_service.update_mem(data), iterations=1000)
+
+
+async def bench_token_encode(name: str) -> BenchmarkResult:
+    """
+    Замеряет создание токена доступа.
+
+    :param name: Название бенчмарка.
+    """
+    data = UserToTokenSchema(uuid=str(uuid4()), role=UserRole.USER.value)
+    return await run_benchmark(name,
+                               lambda: TokenService.create_access_token(data), iterations=1000)
+
+
+async def bench_token_decode(name: str) -> BenchmarkResult:
+    """
+    Замеряет проверку токена доступа из кэша.
+
+    :param name: Название бенчмарка.
+    """
+    data = UserToTokenSchema(uuid=str(uuid4()), role=UserRole.USER.value)
+    access_token = TokenService.create_access_token(data).access_token
+    return await run_benchmark(name,
+                               lambda: TokenService.decode_access_token(access_token), iterations=1000)
+
+
+async def bench_token_decode_uncached(name: str) -> BenchmarkResult:
+    """
+    Замеряет проверку токена доступа без кэша.
+
+    :param name: Название бенчмарка.
+    """
+    data = UserToTokenSchema(uuid=str(uuid4()), role=UserRole.USER.value)
+    access_token = TokenService.create_access_token(data).access_token
+
+    def decode_uncached():
+        TokenService.clear_access_token_cache()
+        return TokenService.decode_access_token(access_token)
+
+    return await run_benchmark(name, decode_uncached, iterations=1000)
+
+
+async def bench_password_hash(name: str) -> BenchmarkResult:
+    """
+    Замеряет синхронное хэширование пароля.
+
+    :param name: Название бенчмарка.
+    """
+    return await run_benchmark(name,
+                               lambda: PasswordService.hash_password('benchmark_password'),
+                               rounds=5, iterations=3)
+
+
+async def bench_password_hash_async(name: str) -> BenchmarkResult:
+    """
+    Замеряет хэширование пароля в пуле.
+
+    :param name: Название бенчмарка.
+    """
+    return await run_benchmark(name,
+                               lambda: PasswordService.hash_password_async('benchmark_password'),
+                               rounds=5, iterations=3)
+
+
+async def asgi_get_mem(client: httpx.AsyncClient, memes: list[Mem]) -> None:
+    """
+    Запрашивает мем со ссылкой на картинку.
+    """
+    (await client.get(f'/api/memes/{memes[0].uuid.uuid}', params={'image_delivery': 'url'})).raise_for_status()
+
+
+async def asgi_get_page(client: httpx.AsyncClient, memes: list[Mem]) -> None:
+    """
+    Запрашивает страницу из 50 мемов.
+    """
+    (await client.get('/api/memes', params={'page': 10, 'per_page': 50})).raise_for_status()
+
+
+async def asgi_lookup_memes(client: httpx.AsyncClient, memes: list[Mem]) -> None:
+    """
+    Запрашивает 50 мемов по списку идентификаторов.
+    """
+    feed_ids = [str(mem.uuid.uuid) for mem in memes[:50]]
+    (await client.post('/api/memes/lookup', json={'ids': feed_ids})).raise_for_status()
+
+
+async def asgi_get_image(client: httpx.AsyncClient, memes: list[Mem]) -> None:
+    """
+    Запрашивает картинку мема через приложение.
+    """
+    (await client.get(f'/api/memes/{memes[0].uuid.uuid}/image')).raise_for_status()
+
+
+async def asgi_add_mem(client: httpx.AsyncClient, memes: list[Mem]) -> None:
+    """
+    Добавляет мем с картинкой 256 Кб.
+    """
+    response = await client.post('/api/memes', params={'text': 'Новый мем'},
+                                 files={'image_file': ('mem.png', IMAGE, 'image/png')})
+    response.raise_for_status()
+
+
+async def run_asgi_benchmarks(names: Sequence[str]) -> list[BenchmarkResult]:
+    """
+    Замеряет обработку HTTP-запросов приложением целиком: маршрутизация, middleware, валидация,
+    сериализация и сервис мемов на репозиториях в памяти вместо PostgreSQL и S3.
+    Если не выбран ни один бенчмарк, приложение не создаётся.
+
+    :param names: Названия запускаемых бенчмарков из `ASGI_BENCHMARKS`.
+    :return: Результаты бенчмарков.
+    """
+    if not names:
+        return []
+
+    from app.api.mem.dependencies import get_mem_service
+    from app.api.shared_dependencies import get_current_user_role
+    from app.main import app
+
+    mem_service, memes = await create_mem_service()
+    app.dependency_overrides[get_mem_service] = lambda: mem_service
+    app.dependency_overrides[get_current_user_role] = lambda: UserFromTokenSchema(uuid=uuid4(),
+                                                                                 role=UserRole.ADMIN,
+                                                                                 token_id='benchmark')
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://bench') as client:
+            results = []
+            for name in names:
+                request, options = ASGI_BENCHMARKS[name]
+                results.append(await run_benchmark(name, partial(request, client, memes), **options))
+            return results
+    finally:
+        app.dependency_overrides.clear()
+
+
+BENCHMARKS = {
+    'mem_dao.from_entity': bench_mem_dao_from_entity,
+    'mem_dao.to_entity': bench_mem_dao_to_entity,
+    'mem_read_schema.from_entity': bench_mem_read_schema_from_entity,
+    'mem_service.get_mem_by_id': bench_mem_service_get_by_id,
+    'mem_service.get_memes_page[50]': bench_mem_service_get_page,
+    'mem_service.get_memes_by_ids[50]': bench_mem_service_get_by_ids,
+    'mem_service.add_mem': bench_mem_service_add_mem,
+    'mem_service.add_mem[image 256K]': bench_mem_service_add_mem_with_image,
+    'mem_service.update_mem': bench_mem_service_update_mem,
+    'token_service.create_access_token': bench_token_encode,
+    'token_service.decode_access_token': bench_token_decode,
+    'token_service.decode_access_token[uncached]': bench_token_decode_uncached,
+    'password_service.hash_password': bench_password_hash,
+    'password_service.hash_password_async': bench_password_hash_async,
+}
+
+# Параметры замера указываются для запросов, которые слишком долги для значений по умолчанию
+ASGI_BENCHMARKS = {
+    'asgi.GET /memes/{id}': (asgi_get_mem, {}),
+    'asgi.GET /memes[50]': (asgi_get_page, {}),
+    'asgi.POST /memes/lookup[50]': (asgi_lookup_memes, {}),
+    'asgi.GET /memes/{id}/image[256K]': (asgi_get_image, {}),
+    'asgi.POST /memes[256K]': (asgi_add_mem, {'rounds': 10, 'iterations': 20}),
+}
@@ -0,0 +1,166 @@
+"""
+Репозитории в памяти процесса для бенчмарков: замена PostgreSQL и S3 хранилища.
+"""
+import dataclasses
+from datetime import datetime, timezone
+from io import BytesIO
+from typing import AsyncIterator, Sequence
+from uuid import UUID
+
+from app.core.mem.domain.exceptions.image_exceptions import ImageNotFoundException
+from app.core.mem.domain.image_repository import ImageRepository
+from app.core.mem.domain.mem_entity import Mem
+from app.core.mem.domain.mem_repository import MemRepository
+from app.core.mem.domain.utils.byte_range import ByteRange
+from app.core.mem.domain.utils.image_stream import ImageStream
+from app.core.mem.domain.utils.mem_count import MemCount
+from app.core.mem.domain.utils.mem_cursor import MemCursor
+from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
+from app.core.shared_kernel.db.exceptions import EntityExistsException, EntityNotFoundException
+
+
+class InMemoryMemRepository(MemRepository):
+    """
+    Репозиторий мемов в памяти процесса с той же семантикой, что и репозиторий базы данных:
+    порядок по идентификатору, постраничная выборка смещением или курсором и версия мема.
+    """
+
+    def __init__(self):
+        """
+        Конструктор InMemoryMemRepository.
+        """
+        self._memes: dict[UUID, Mem] = {}
+        self._sorted_ids: list[UUID] | None = None
+
+    async def add(self, entity: Mem | list[Mem]) -> Mem | Sequence[Mem]:
+        entities = entity if isinstance(entity, list) else [entity]
+        if any(mem.uuid.uuid in self._memes for mem in entities):
+            raise EntityExistsException
+        for mem in entities:
+            self._memes[mem.uuid.uuid] = dataclasses.replace(mem)
+        self._sorted_ids = None
+        return entities if isinstance(entity, list) else entities[0]
+
+    async def update(self, entity: Mem) -> Mem:
+        stored_mem = self._memes.get(entity.uuid.uuid)
+        if stored_mem is None:
+            raise EntityNotFoundException
+        updated_mem = dataclasses.replace(entity, version=stored_mem.version + 1,
+                                          updated_at=datetime.now(timezone.utc))
+        self._memes[entity.uuid.uuid] = updated_mem
+        return updated_mem
+
+    async def get_by_id(self, id_: UUID, use_primary: bool = False) -> Mem | None:
+        return self._memes.get(id_)
+
+    async def get_by_ids(self, ids: Sequence[UUID]) -> Sequence[Mem]:
+        return [self._memes[id_] for id_ in dict.fromkeys(ids) if id_ in self._memes]
+
+    async def get_all(self) -> Sequence[Mem]:
+        return [self._memes[id_] for id_ in self._get_sorted_ids()]
+
+    async def get_by_filter(self, mem_filter_params: MemFilterParams, limit: int = None) -> Sequence[Mem]:
+        ids = self._get_sorted_ids()
+        if mem_filter_params.q:
+            # Упрощённая замена полнотекстового поиска: подстрока без учёта регистра и без ранжирования
+            ids = [id_ for id_ in ids if mem_filter_params.q.lower() in self._memes[id_].text.text.lower()]
+        if mem_filter_params.after:
+            cursor = MemCursor.decode(mem_filter_params.after)
+            ids = [id_ for id_ in ids if id_ > cursor.uuid]
+        else:
+            ids = ids[(mem_filter_params.page - 1) * mem_filter_params.per_page:]
+        limit = mem_filter_params.per_page if limit is None else limit
+        return [self._memes[id_] for id_ in ids[:limit]]
+
+    async def count(self, q: str | None = None) -> MemCount:
+        if not q:
+            return MemCount(value=len(self._memes))
+        return MemCount(value=sum(q.lower() in mem.text.text.lower() for mem in self._memes.values()))
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[Mem]:
+        for mem in await self.get_all():
+            yield mem
+
+    async def delete_by_id(self, id_: UUID) -> None:
+        if self._memes.pop(id_, None) is None:
+            raise EntityNotFoundException
+        self._sorted_ids = None
+
+    def _get_sorted_ids(self) -> list[UUID]:
+        """
+        Получает идентификаторы мемов в порядке возрастания, как у индекса первичного ключа.
+
+        :return: Отсортированные идентификаторы.
+        """
+        if self._sorted_ids is None:
+            self._sorted_ids = sorted(self._memes)
+        return self._sorted_ids
+
+
+class InMemoryImageRepository(ImageRepository):
+    """
+    Репозиторий изображений в памяти процесса, заменяющий S3 хранилище.
+
+    :ivar chunk_size: Размер части изображения в байтах при потоковой отдаче.
+    """
+
+    def __init__(self, chunk_size: int = 64 * 1024):
+        """
+        Конструктор InMemoryImageRepository.
+
+        :param chunk_size: Размер части изображения в байтах при потоковой отдаче.
+        """
+        self.chunk_size = chunk_size
+        self._images: dict[str, bytes] = {}
+
+    async def save_image(self, path: str, image_stream: BytesIO) -> None:
+        self._images[path] = image_stream.getvalue()
+
+    async def save_image_stream(self, path: str, chunks: AsyncIterator[bytes]) -> int:
+        self._images[path] = b''.join([chunk async for chunk in chunks])
+        return len(self._images[path])
+
+    async def copy_image(self, source_path: str, path: str) -> None:
+        self._images[path] = self._get(source_path)
+
+    async def get_image(self, path: str) -> BytesIO:
+        return BytesIO(self._get(path))
+
+    async def stream_image(self, path: str) -> ImageStream:
+        image = self._get(path)
+        return ImageStream(chunks=self._iter_chunks(image), size=len(image))
+
+    async def get_image_size(self, path: str) -> int:
+        return len(self._get(path))
+
+    async def stream_image_range(self, path: str, byte_range: ByteRange) -> ImageStream:
+        image = self._get(path)[byte_range.start:byte_range.end + 1]
+        return ImageStream(chunks=self._iter_chunks(image), size=len(image))
+
+    async def get_image_url(self, path: str, internal: bool = False) -> str:
+        return f'http://images.local/{path}'
+
+    async def delete_image(self, path: str) -> None:
+        self._images.pop(path, None)
+
+    def _get(self, path: str) -> bytes:
+        """
+        Получает данные изображения.
+
+        :param path: Путь изображения.
+        :return: Данные изображения.
+        :raise ImageNotFoundException: Изображение не найдено.
+        """
+        if path not in self._images:
+            raise ImageNotFoundException
+        return self._images[path]
+
+    async def _iter_chunks(self, image: bytes) -> AsyncIterator[bytes]:
+        """
+        Отдаёт изображение частями.
+
+        :param image: Данные изображения.
+        :return: Асинхронный итератор частей.
+        """
+        for start in range(0, len(image), self.chunk_size):
+            yield image[start:start + self.chunk_size]
@@ -0,0 +1,132 @@
+"""
+Запуск бенчмарков, сохранение результатов в JSON и сравнение с базовыми результатами.
+"""
+import gc
+import inspect
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """
+    Результат бенчмарка.
+
+    :ivar name: Название бенчмарка.
+    :ivar rounds: Количество замеров.
+    :ivar iterations: Количество вызовов в одном замере.
+    :ivar mean: Среднее время одного вызова в секундах.
+    :ivar median: Медианное время одного вызова в секундах.
+    :ivar p95: 95-й перцентиль времени одного вызова в секундах.
+    :ivar min: Минимальное время одного вызова в секундах.
+    :ivar ops: Количество вызовов в секунду по медиане.
+    """
+
+    name: str
+    rounds: int
+    iterations: int
+    mean: float
+    median: float
+    p95: float
+    min: float
+    ops: float
+
+
+async def run_benchmark(name: str,
+                        func: Callable[[], Any] | Callable[[], Awaitable[Any]],
+                        rounds: int = 20,
+                        iterations: int = 100,
+                        warmup: int = 1) -> BenchmarkResult:
+    """
+    Замеряет время вызова функции.
+    Каждый замер - это `iterations` последовательных вызовов, время делится на их количество.
+    Сборщик мусора отключается на время замера, чтобы уменьшить разброс.
+
+    :param name: Название бенчмарка.
+    :param func: Синхронная функция или функция, возвращающая корутину.
+    :param rounds: Количество замеров.
+    :param iterations: Количество вызовов в одном замере.
+    :param warmup: Количество замеров для прогрева, не учитываемых в результате.
+    :return: Результат бенчмарка.
+    """
+    # Функция может быть синхронной или возвращать корутину, например lambda с вызовом метода сервиса
+    probe = func()
+    is_async = inspect.isawaitable(probe)
+    if is_async:
+        await probe
+    timings = []
+    for round_number in range(warmup + rounds):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            if is_async:
+                for _ in range(iterations):
+                    await func()
+            else:
+                for _ in range(iterations):
+                    func()
+            elapsed = (time.perf_counter() - started) / iterations
+        finally:
+            gc.enable()
+        if round_number >= warmup:
+            timings.append(elapsed)
+
+    timings.sort()
+    median = statistics.median(timings)
+    return BenchmarkResult(name=name,
+                           rounds=rounds,
+                           iterations=iterations,
+                           mean=statistics.fmean(timings),
+                           median=median,
+                           p95=timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+                           min=timings[0],
+                           ops=1 / median if median else float('inf'))
+
+
+def save_results(results: list[BenchmarkResult], path: str) -> None:
+    """
+    Сохраняет результаты бенчмарков в JSON вместе с описанием окружения.
+
+    :param results: Результаты бенчмарков.
+    :param path: Путь к файлу результатов.
+    """
+    report = {
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'benchmarks': [asdict(result) for result in results],
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+
+
+def compare_results(results: list[BenchmarkResult], baseline_path: str, threshold: float) -> list[str]:
+    """
+    Сравнивает медианы результатов с базовыми результатами.
+
+    :param results: Текущие результаты бенчмарков.
+    :param baseline_path: Путь к файлу базовых результатов.
+    :param threshold: Допустимое относительное замедление, например 0.1 - на 10%.
+    :return: Названия бенчмарков, замедлившихся сильнее допустимого.
+    """
+    with open(baseline_path, encoding='utf-8') as file:
+        baseline = {benchmark['name']: benchmark for benchmark in json.load(file)['benchmarks']}
+
+    regressions = []
+    for result in results:
+        baseline_result = baseline.get(result.name)
+        if baseline_result is None:
+            print(f'{result.name:<45} нет в базовых результатах')
+            continue
+        change = result.median / baseline_result['median'] - 1
+        is_regression = change > threshold
+        if is_regression:
+            regressions.append(result.name)
+        print(f'{result.name:<45} {change:+8.1%}{"  РЕГРЕССИЯ" if is_regression else ""}')
+    return regressions
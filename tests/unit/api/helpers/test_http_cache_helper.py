@@ -0,0 +1,66 @@
+"""
+Юнит-тесты класса-помощника HttpCacheHelper.
+"""
+from datetime import datetime, timezone
+
+from fastapi import Request
+
+from app.api.helpers.http_cache_helper import HttpCacheHelper
+
+
+def create_request(headers: dict[str, str]) -> Request:
+    """
+    Создаёт запрос с заданными заголовками.
+    """
+    return Request({'type': 'http',
+                    'headers': [(name.lower().encode(), value.encode()) for name, value in headers.items()]})
+
+
+class TestHttpCacheHelper:
+    """
+    Юнит-тесты для класса-помощника :class:`HttpCacheHelper`
+    """
+
+    def test_is_not_modified_with_matching_etag(self):
+        """
+        Проверяет совпадение ETag из If-None-Match, в том числе слабого и из списка.
+        """
+        request = create_request({'If-None-Match': '"other", W/"mem-1"'})
+
+        assert HttpCacheHelper.is_not_modified(request, etag='"mem-1"')
+        assert not HttpCacheHelper.is_not_modified(request, etag='"mem-2"')
+
+    def test_is_not_modified_ignores_modified_since_with_etag(self):
+        """
+        Проверяет, что If-Modified-Since не учитывается при наличии If-None-Match.
+        """
+        last_modified = datetime(2024, 8, 4, 3, 30, 46, 864176, tzinfo=timezone.utc)
+        request = create_request({'If-None-Match': '"mem-1"',
+                                  'If-Modified-Since': 'Sun, 04 Aug 2024 03:30:46 GMT'})
+
+        assert not HttpCacheHelper.is_not_modified(request, etag='"mem-2"', last_modified=last_modified)
+
+    def test_is_not_modified_since(self):
+        """
+        Проверяет сравнение времени изменения с If-Modified-Since с точностью до секунды.
+        """
+        last_modified = datetime(2024, 8, 4, 3, 30, 46, 864176, tzinfo=timezone.utc)
+
+        assert HttpCacheHelper.is_not_modified(create_request({'If-Modified-Since': 'Sun, 04 Aug 2024 03:30:46 GMT'}),
+                                               etag='"mem-1"', last_modified=last_modified)
+        assert not HttpCacheHelper.is_not_modified(create_request({'If-Modified-Since': 'Sun, 04 Aug 2024 03:30:45 GMT'}),
+                                                   etag='"mem-1"', last_modified=last_modified)
+        assert not HttpCacheHelper.is_not_modified(create_request({'If-Modified-Since': 'вчера'}),
+                                                   etag='"mem-1"', last_modified=last_modified)
+
+    def test_get_cache_headers(self):
+        """
+        Проверяет создание заголовков кэширования.
+        """
+        last_modified = datetime(2024, 8, 4, 6, 30, 46, tzinfo=timezone.utc).astimezone()
+
+        assert HttpCacheHelper.get_cache_headers(etag='"mem-1"', last_modified=last_modified, max_age=60) == {
+            'ETag': '"mem-1"',
+            'Cache-Control': 'public, max-age=60',
+            'Last-Modified': 'Sun, 04 Aug 2024 06:30:46 GMT'
+        }
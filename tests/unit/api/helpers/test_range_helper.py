@@ -0,0 +1,102 @@
+"""
+Юнит-тесты класса-помощника RangeHelper.
+"""
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import Request
+
+from app.api.helpers.range_helper import RangeHelper
+from app.api.http_errors import RangeNotSatisfiableError
+from app.core.mem.domain.utils.byte_range import ByteRange
+from app.core.mem.domain.utils.image_stream import ImageStream
+
+IMAGE = b'0123456789'
+
+
+def create_request(headers: dict[str, str]) -> Request:
+    """
+    Создаёт запрос с заданными заголовками.
+    """
+    return Request({'type': 'http',
+                    'headers': [(name.lower().encode(), value.encode()) for name, value in headers.items()]})
+
+
+async def open_range(byte_range: ByteRange) -> ImageStream:
+    """
+    Открывает диапазон байтов тестового изображения.
+    """
+    async def chunks():
+        yield IMAGE[byte_range.start:byte_range.end + 1]
+    return ImageStream(chunks=chunks(), size=byte_range.length)
+
+
+class TestRangeHelper:
+    """
+    Юнит-тесты для класса-помощника :class:`RangeHelper`
+    """
+
+    @pytest.mark.parametrize('range_header, expected_ranges', [
+        ('bytes=2-4', [ByteRange(2, 4)]),
+        ('bytes=5-', [ByteRange(5, 9)]),
+        ('bytes=-3', [ByteRange(7, 9)]),
+        ('bytes=8-20', [ByteRange(8, 9)]),
+        ('bytes=0-1, 20-30, -20', [ByteRange(0, 1), ByteRange(0, 9)]),
+    ])
+    def test_parse_range(self, range_header, expected_ranges):
+        """
+        Проверяет разбор одиночных, открытых, суффиксных и множественных диапазонов с обрезкой по размеру.
+        """
+        assert RangeHelper.parse_range(range_header, size=len(IMAGE)) == expected_ranges
+
+    @pytest.mark.parametrize('range_header', [
+        'items=0-1',
+        'bytes=',
+        'bytes=a-b',
+        'bytes=-',
+        'bytes=4-2',
+        'bytes=' + ','.join(['0-0'] * (RangeHelper.MAX_RANGES + 1)),
+    ])
+    def test_parse_range_should_ignore_invalid_header(self, range_header):
+        """
+        Проверяет, что некорректный заголовок игнорируется.
+        """
+        assert RangeHelper.parse_range(range_header, size=len(IMAGE)) is None
+
+    def test_parse_range_should_raise_on_unsatisfiable_range(self):
+        """
+        Проверяет ошибку 416 с размером ресурса, если ни один диапазон не выполним.
+        """
+        with pytest.raises(RangeNotSatisfiableError) as exc_info:
+            RangeHelper.parse_range('bytes=10-, -0', size=len(IMAGE))
+
+        assert exc_info.value.headers == {'Content-Range': 'bytes */10'}
+
+    def test_is_range_fresh(self):
+        """
+        Проверяет условие If-Range по строгому ETag и по дате последнего изменения.
+        """
+        last_modified = datetime(2024, 8, 4, 3, 30, 46, 864176, tzinfo=timezone.utc)
+
+        assert RangeHelper.is_range_fresh(create_request({}), etag='"mem-1"')
+        assert RangeHelper.is_range_fresh(create_request({'If-Range': '"mem-1"'}), etag='"mem-1"')
+        assert not RangeHelper.is_range_fresh(create_request({'If-Range': 'W/"mem-1"'}), etag='"mem-1"')
+        assert not RangeHelper.is_range_fresh(create_request({'If-Range': '"mem-2"'}), etag='"mem-1"')
+        assert RangeHelper.is_range_fresh(create_request({'If-Range': 'Sun, 04 Aug 2024 03:30:46 GMT'}),
+                                          etag='"mem-1"', last_modified=last_modified)
+        assert not RangeHelper.is_range_fresh(create_request({'If-Range': 'Sun, 04 Aug 2024 03:30:45 GMT'}),
+                                              etag='"mem-1"', last_modified=last_modified)
+
+    async def test_iter_multipart_should_match_calculated_length(self):
+        """
+        Проверяет тело multipart/byteranges и совпадение его длины с вычисленной заранее.
+        """
+        byte_ranges = [ByteRange(0, 1), ByteRange(5, 9)]
+
+        body = b''.join([part async for part in RangeHelper.iter_multipart(byte_ranges, len(IMAGE), 'image/png',
+                                                                            'sep', open_range=open_range)])
+
+        assert body == (b'--sep\r\nContent-Type: image/png\r\nContent-Range: bytes 0-1/10\r\n\r\n01\r\n'
+                        b'--sep\r\nContent-Type: image/png\r\nContent-Range: bytes 5-9/10\r\n\r\n56789\r\n'
+                        b'--sep--\r\n')
+        assert len(body) == RangeHelper.get_multipart_length(byte_ranges, len(IMAGE), 'image/png', 'sep')
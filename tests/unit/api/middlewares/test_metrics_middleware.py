@@ -0,0 +1,66 @@
+"""
+Юнит-тесты ASGI-middleware сбора метрик MetricsMiddleware.
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.api.middlewares.metrics_middleware import MetricsMiddleware
+from app.core.shared_kernel.metrics.metrics import request_db_timer
+
+
+def create_app() -> FastAPI:
+    """
+    Создаёт приложение с middleware метрик и маршрутом, учитывающим время запросов к базе данных.
+    """
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get('/test-metrics/{id}')
+    async def get_item(id: int) -> dict:
+        request_db_timer.get().seconds += 0.25
+        return {'id': id}
+
+    return app
+
+
+def get_sample(name: str, route: str, **labels: str) -> float:
+    """
+    Получает значение метрики для маршрута или 0, если запросов ещё не было.
+    """
+    return REGISTRY.get_sample_value(name, {'method': 'GET', 'route': route, **labels}) or 0
+
+
+class TestMetricsMiddleware:
+    """
+    Юнит-тесты для middleware :class:`MetricsMiddleware`
+    """
+
+    def test_request_should_be_recorded_by_route_template(self):
+        """
+        Проверяет учёт запросов по шаблону маршрута, размера ответа и времени запросов к базе данных.
+        """
+        route = '/test-metrics/{id}'
+        requests_before = get_sample('http_request_duration_seconds_count', route, status='200')
+        size_before = get_sample('http_response_size_bytes_sum', route)
+        db_before = get_sample('http_request_db_duration_seconds_sum', route)
+        client = TestClient(create_app())
+
+        client.get('/test-metrics/1')
+        client.get('/test-metrics/2')
+
+        assert get_sample('http_request_duration_seconds_count', route, status='200') == requests_before + 2
+        assert get_sample('http_response_size_bytes_sum', route) == size_before + 2 * len(b'{"id":1}')
+        assert get_sample('http_request_db_duration_seconds_sum', route) == db_before + 0.5
+
+    def test_unknown_route_should_not_create_path_label(self):
+        """
+        Проверяет, что запросы к несуществующим путям учитываются под общей меткой.
+        """
+        requests_before = get_sample('http_request_duration_seconds_count', 'unmatched', status='404')
+        client = TestClient(create_app())
+
+        client.get('/unknown/path')
+
+        assert get_sample('http_request_duration_seconds_count', 'unmatched', status='404') == requests_before + 1
+        assert get_sample('http_request_duration_seconds_count', '/unknown/path', status='404') == 0
@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock
 
+from app.core.mem.domain.image_ref_repository import ImageRefRepository
 from app.core.mem.domain.image_repository import ImageRepository
+from app.core.mem.domain.image_variant_generator import ImageVariantGenerator
 from app.core.mem.domain.mem_repository import MemRepository
 
 
@@ -18,3 +20,15 @@ def get_mock_image_repository():
     return MagicMock(spec=ImageRepository)
 
 
+def get_mock_image_ref_repository():
+    """
+    Создаёт заглушку репозитория для счётчиков ссылок на картинки.
+    """
+    return MagicMock(spec=ImageRefRepository)
+
+
+def get_mock_image_variant_generator():
+    """
+    Создаёт заглушку генератора вариантов картинок.
+    """
+    return MagicMock(spec=ImageVariantGenerator)
@@ -1,23 +1,41 @@
 """
 Юнит-тесты сервиса мемов MemService.
 """
+import asyncio
 from io import BytesIO
 from uuid import UUID
 
 import pytest
 
-from app.core.mem.application.exceptions import MemNotFoundException
+from app.core.mem.application.exceptions import MemNotFoundException, MemExistsException
 from app.core.mem.application.schemas.mem_create_schema import MemCreateSchema
+from app.core.mem.application.schemas.mem_page_schema import MemPageSchema
 from app.core.mem.application.schemas.mem_read_schema import MemReadSchema
 from app.core.mem.application.schemas.mem_update_schema import MemUpdateSchema
 from app.core.mem.application.services.mem_service import MemService
+from app.core.mem.domain.exceptions.image_exceptions import ImageNotFoundException, ImageTooLargeException
 from app.core.mem.domain.mem_entity import Mem
+from app.core.mem.domain.utils.image_stream import ImageStream
+from app.core.mem.domain.utils.image_upload_stream import ImageUploadStream
+from app.core.mem.domain.utils.image_variant import ImageVariant
+from app.core.mem.domain.utils.mem_count import MemCount
+from app.core.mem.domain.utils.mem_cursor import MemCursor
 from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
+from app.core.mem.domain.value_objects.image_hash import ImageHash
 from app.core.mem.domain.value_objects.image_path import ImagePath
 from app.core.mem.domain.value_objects.mem_text import MemText
 from app.core.mem.domain.value_objects.mem_uuid import MemUUID
-from app.core.shared_kernel.db.exceptions import EntityNotFoundException
-from tests.unit.mem.application.conftest import get_mock_mem_repository, get_mock_image_repository
+from app.core.shared_kernel.db.exceptions import EntityNotFoundException, EntityExistsException
+from tests.unit.mem.application.conftest import get_mock_mem_repository, get_mock_image_repository, \
+    get_mock_image_ref_repository, get_mock_image_variant_generator
+
+
+async def iter_chunks(*chunks: bytes):
+    """
+    Создаёт асинхронный итератор частей изображения.
+    """
+    for chunk in chunks:
+        yield chunk
 
 
 class TestMemService:
@@ -58,6 +76,136 @@ class TestMemService:
         assert added_mem.text == 'Колобок повесился.'
         assert isinstance(added_mem.image_path, str)
 
+    async def test_add_mem_with_existing_image_hash_should_skip_upload(self):
+        """
+        Проверяет, что при хранении по хэшу уже загруженная картинка не загружается повторно.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+        mock_image_ref_repository = get_mock_image_ref_repository()
+        mock_image_ref_repository.acquire.return_value = 2
+
+        mem_to_add = MemCreateSchema(text='Колобок повесился.')
+        mem_service = MemService(mock_mem_repository, mock_image_repository, mock_image_ref_repository)
+        added_mem = await mem_service.add_mem(mem_to_add, BytesIO(b'test'))
+
+        image_hash = '9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08'
+        assert added_mem.image_path == f'image_{image_hash}'
+        mock_image_ref_repository.acquire.assert_awaited_once_with(image_hash)
+        mock_image_repository.save_image.assert_not_awaited()
+
+    async def test_add_mem_with_referenced_but_missing_image_should_upload(self):
+        """
+        Проверяет, что при хранении по хэшу картинка загружается, если ссылки на неё уже есть,
+        но в хранилище её нет: загрузка по первой ссылке ещё не завершилась или завершилась ошибкой.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+        mock_image_repository.get_image_size.side_effect = ImageNotFoundException
+        mock_image_ref_repository = get_mock_image_ref_repository()
+        mock_image_ref_repository.acquire.return_value = 2
+
+        mem_to_add = MemCreateSchema(text='Колобок повесился.')
+        mem_service = MemService(mock_mem_repository, mock_image_repository, mock_image_ref_repository)
+        added_mem = await mem_service.add_mem(mem_to_add, BytesIO(b'test'))
+
+        mock_image_repository.save_image.assert_awaited_once()
+        assert mock_image_repository.save_image.await_args.kwargs['path'] == added_mem.image_path
+        mock_image_ref_repository.release.assert_not_awaited()
+
+    async def test_add_mem_with_upload_stream_and_new_hash_should_copy_upload(self):
+        """
+        Проверяет, что при хранении по хэшу потоковая загрузка копируется по пути хэша и временный объект удаляется.
+        """
+        async def chunks():
+            yield b'te'
+            yield b'st'
+
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+        mock_image_ref_repository = get_mock_image_ref_repository()
+        mock_image_ref_repository.acquire.return_value = 1
+
+        async def save_image_stream(path, chunks):
+            return len(b''.join([chunk async for chunk in chunks]))
+        mock_image_repository.save_image_stream.side_effect = save_image_stream
+
+        mem_to_add = MemCreateSchema(text='Колобок повесился.')
+        mem_service = MemService(mock_mem_repository, mock_image_repository, mock_image_ref_repository)
+        added_mem = await mem_service.add_mem(mem_to_add, ImageUploadStream(chunks=chunks(), max_size=10))
+
+        image_path = 'image_9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08'
+        upload_path = mock_image_repository.save_image_stream.await_args.kwargs['path']
+        assert added_mem.image_path == image_path
+        mock_image_repository.copy_image.assert_awaited_once_with(source_path=upload_path, path=image_path)
+        mock_image_repository.delete_image.assert_awaited_once_with(path=upload_path)
+
+    async def test_add_memes_should_add_memes_in_one_call(self):
+        """
+        Проверяет пакетное добавление мемов одним вызовом репозитория и загрузку их картинок.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+
+        memes_to_add = [MemCreateSchema(text='Колобок повесился.'), MemCreateSchema(text='Купец.')]
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        added_memes = await mem_service.add_memes(memes_to_add, [BytesIO(b'meme_image'), None])
+
+        assert [mem.text for mem in added_memes] == ['Колобок повесился.', 'Купец.']
+        assert added_memes[0].image_path == f'mem_{added_memes[0].uuid}'
+        assert added_memes[1].image_path is None
+        mock_mem_repository.add.assert_awaited_once()
+        assert len(mock_mem_repository.add.await_args.args[0]) == 2
+        mock_image_repository.save_image.assert_awaited_once()
+
+    async def test_add_memes_with_upload_streams_should_limit_concurrent_uploads(self):
+        """
+        Проверяет потоковую загрузку картинок пакета не более чем `max_concurrency` одновременно.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+        active = 0
+        max_active = 0
+
+        async def save_image_stream(path, chunks):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            size = len(b''.join([chunk async for chunk in chunks]))
+            await asyncio.sleep(0.01)
+            active -= 1
+            return size
+
+        mock_image_repository.save_image_stream.side_effect = save_image_stream
+
+        memes_to_add = [MemCreateSchema(text=f'Мем {number}') for number in range(5)]
+        image_streams = [ImageUploadStream(chunks=iter_chunks(b'meme_image'), max_size=100) for _ in range(5)]
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        added_memes = await mem_service.add_memes(memes_to_add, image_streams, max_concurrency=2)
+
+        assert all(mem.image_path for mem in added_memes)
+        assert mock_image_repository.save_image_stream.await_count == 5
+        assert max_active == 2
+        mock_image_repository.save_image.assert_not_called()
+
+    async def test_add_exists_memes_should_delete_uploaded_images(self):
+        """
+        Проверяет удаление загруженных картинок при ошибке пакетного добавления мемов.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_mem_repository.add.side_effect = EntityExistsException
+        mock_image_repository = get_mock_image_repository()
+
+        memes_to_add = [MemCreateSchema(text='Колобок повесился.'), MemCreateSchema(text='Купец.')]
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        with pytest.raises(MemExistsException):
+            await mem_service.add_memes(memes_to_add, [BytesIO(b'meme_image'), BytesIO(b'meme_image')])
+
+        saved_paths = {save_call.kwargs['path'] for save_call in mock_image_repository.save_image.await_args_list}
+        deleted_paths = {delete_call.kwargs['path'] for delete_call in mock_image_repository.delete_image.await_args_list}
+        assert len(saved_paths) == 2
+        assert saved_paths <= deleted_paths
+
     async def test_get_mem_by_id_should_return_mem(self):
         """
         Проверяет получение мема по идентификатору.
@@ -90,6 +238,132 @@ class TestMemService:
 
         assert image_stream.getvalue() == BytesIO(b'meme_image').getvalue()
 
+    async def test_stream_mem_image_should_return_image_chunks(self):
+        """
+        Проверяет получение картинки мема по частям.
+        """
+        async def chunks():
+            yield b'meme_'
+            yield b'image'
+
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+        mock_image_repository.stream_image.return_value = ImageStream(chunks=chunks(), size=10)
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        image_stream = await mem_service.stream_mem_image('mem_777a3f52-ce9a-4758-a4d4-881221f94f63')
+
+        assert image_stream.size == 10
+        assert b''.join([chunk async for chunk in image_stream.chunks]) == b'meme_image'
+        mock_image_repository.stream_image.assert_awaited_once_with(path='mem_777a3f52-ce9a-4758-a4d4-881221f94f63')
+
+    async def test_stream_mem_image_variant_should_fall_back_to_original(self):
+        """
+        Проверяет получение оригинала картинки, если её вариант ещё не создан.
+        """
+        async def chunks():
+            yield b'meme_image'
+
+        original_stream = ImageStream(chunks=chunks(), size=10)
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+        mock_image_repository.stream_image.side_effect = [ImageNotFoundException, original_stream]
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        image_stream = await mem_service.stream_mem_image('mem_1', variant=ImageVariant.THUMB)
+
+        assert image_stream is original_stream
+        assert image_stream.media_type == 'image/png'
+        assert [call.kwargs['path'] for call in mock_image_repository.stream_image.await_args_list] == \
+            ['mem_1_thumb.webp', 'mem_1']
+
+    async def test_add_mem_with_variant_generator_should_save_variants(self):
+        """
+        Проверяет создание и сохранение вариантов картинки после добавления мема.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+        mock_variant_generator = get_mock_image_variant_generator()
+        mock_variant_generator.generate.return_value = {ImageVariant.THUMB: b'thumb'}
+
+        mem_to_add = MemCreateSchema(text='Колобок повесился.')
+        mem_service = MemService(mock_mem_repository, mock_image_repository,
+                                 image_variant_generator=mock_variant_generator)
+        added_mem = await mem_service.add_mem(mem_to_add, BytesIO(b'meme_image'))
+        await asyncio.gather(*MemService._background_tasks)
+
+        mock_variant_generator.generate.assert_awaited_once_with(b'meme_image')
+        variant_call = mock_image_repository.save_image.await_args_list[-1]
+        assert variant_call.kwargs['path'] == f'{added_mem.image_path}_thumb.webp'
+        assert variant_call.kwargs['image_stream'].getvalue() == b'thumb'
+
+    async def test_delete_mem_should_wait_for_image_variants(self):
+        """
+        Проверяет, что удаление мема дожидается создания вариантов его картинки
+        и варианты не записываются в хранилище после удаления.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+        mock_variant_generator = get_mock_image_variant_generator()
+        events = []
+
+        async def generate(image):
+            await asyncio.sleep(0.01)
+            return {ImageVariant.THUMB: b'thumb'}
+
+        async def save_image(path, image_stream):
+            events.append(('save', path))
+
+        async def delete_image(path):
+            events.append(('delete', path))
+
+        mock_variant_generator.generate.side_effect = generate
+        mock_image_repository.save_image.side_effect = save_image
+        mock_image_repository.delete_image.side_effect = delete_image
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository,
+                                 image_variant_generator=mock_variant_generator)
+        added_mem = await mem_service.add_mem(MemCreateSchema(text='Колобок повесился.'), BytesIO(b'meme_image'))
+        mock_mem_repository.get_by_id.return_value = Mem(uuid=MemUUID(added_mem.uuid),
+                                                         text=MemText(added_mem.text),
+                                                         image_path=ImagePath(added_mem.image_path))
+        await mem_service.delete_mem_by_id(added_mem.uuid)
+
+        thumb_path = f'{added_mem.image_path}_thumb.webp'
+        assert events.index(('save', thumb_path)) < events.index(('delete', thumb_path))
+        assert not MemService._variant_tasks
+
+    async def test_image_variants_of_deleted_image_should_be_deleted(self):
+        """
+        Проверяет, что варианты картинки, удалённой во время их создания, удаляются из хранилища.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+        mock_image_repository.get_image_size.side_effect = ImageNotFoundException
+        mock_variant_generator = get_mock_image_variant_generator()
+        mock_variant_generator.generate.return_value = {ImageVariant.THUMB: b'thumb'}
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository,
+                                 image_variant_generator=mock_variant_generator)
+        added_mem = await mem_service.add_mem(MemCreateSchema(text='Колобок повесился.'), BytesIO(b'meme_image'))
+        await asyncio.gather(*MemService._background_tasks)
+
+        mock_image_repository.delete_image.assert_any_await(path=f'{added_mem.image_path}_thumb.webp')
+
+    async def test_get_mem_image_url_should_return_image_url(self):
+        """
+        Проверяет получение временной ссылки на картинку мема.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_image_repository = get_mock_image_repository()
+        mock_image_repository.get_image_url.return_value = 'http://images:9000/images/mem_1?X-Amz-Signature=abc'
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        image_url = await mem_service.get_mem_image_url('mem_1', internal=True)
+
+        assert image_url == 'http://images:9000/images/mem_1?X-Amz-Signature=abc'
+        mock_image_repository.get_image_url.assert_awaited_once_with(path='mem_1', internal=True)
+
     async def test_get_all_memes_should_return_list_of_memes(self):
         """
         Проверяет получение списка всех мемов.
@@ -116,6 +390,119 @@ class TestMemService:
             assert mem.text == mock_mem.text.text
             assert mem.image_path == mock_mem.image_path.path
 
+    async def test_export_memes_should_stream_memes(self):
+        """
+        Проверяет последовательное получение всех мемов для выгрузки.
+        """
+        async def stream_memes():
+            yield Mem(uuid=MemUUID(UUID('262f8c19-27c0-4e3c-b096-f6147ac052a3')), text=MemText('Купец.'))
+            yield Mem(uuid=MemUUID(UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')), text=MemText('Колобок повесился.'))
+
+        mock_mem_repository = get_mock_mem_repository()
+        mock_mem_repository.stream_all.return_value = stream_memes()
+        mock_image_repository = get_mock_image_repository()
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        memes = [mem async for mem in mem_service.export_memes(batch_size=100)]
+
+        assert [mem.text for mem in memes] == ['Купец.', 'Колобок повесился.']
+        assert all(isinstance(mem, MemReadSchema) for mem in memes)
+        mock_mem_repository.stream_all.assert_called_once_with(batch_size=100)
+
+    async def test_get_memes_page_should_return_next_cursor_when_next_page_exists(self):
+        """
+        Проверяет получение страницы мемов с курсором на последний мем страницы,
+        когда в выборке есть лишний мем следующей страницы.
+        """
+        mock_memes = [
+            Mem(uuid=MemUUID(UUID('262f8c19-27c0-4e3c-b096-f6147ac052a3')),
+                text=MemText('Купец.')),
+            Mem(uuid=MemUUID(UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')),
+                text=MemText('Колобок повесился.')),
+            Mem(uuid=MemUUID(UUID('a8b1d1e4-5c3f-4a36-9d5e-0c1f2b3a4d5e')),
+                text=MemText('Штирлиц шёл по лесу.'))
+        ]
+        mock_mem_repository = get_mock_mem_repository()
+        mock_mem_repository.get_by_filter.return_value = mock_memes
+        mock_mem_repository.count.return_value = MemCount(value=3)
+        mock_image_repository = get_mock_image_repository()
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        memes_page = await mem_service.get_memes_page(MemFilterParams(per_page=2))
+
+        assert isinstance(memes_page, MemPageSchema)
+        mock_mem_repository.get_by_filter.assert_called_once_with(mem_filter_params=MemFilterParams(per_page=2),
+                                                                  limit=3)
+        assert [mem.uuid for mem in memes_page.items] == [mem.uuid.uuid for mem in mock_memes[:2]]
+        assert memes_page.has_next
+        assert MemCursor.decode(memes_page.next_cursor).uuid == UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')
+        assert memes_page.total == 3
+        assert not memes_page.total_is_estimate
+
+    async def test_get_memes_page_after_first_should_fetch_extra_mem_without_shifting_page(self):
+        """
+        Проверяет, что для страницы после первой лишний мем запрашивается только лимитом,
+        а номер и размер страницы передаются в репозиторий без изменений.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_mem_repository.get_by_filter.return_value = [
+            Mem(uuid=MemUUID(UUID('262f8c19-27c0-4e3c-b096-f6147ac052a3')),
+                text=MemText('Купец.'))
+        ]
+        mock_mem_repository.count.return_value = MemCount(value=11)
+        mock_image_repository = get_mock_image_repository()
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        memes_page = await mem_service.get_memes_page(MemFilterParams(page=2, per_page=10))
+
+        mock_mem_repository.get_by_filter.assert_called_once_with(
+            mem_filter_params=MemFilterParams(page=2, per_page=10), limit=11
+        )
+        assert len(memes_page.items) == 1
+        assert not memes_page.has_next
+
+    async def test_get_memes_page_should_not_return_cursor_for_exactly_full_last_page(self):
+        """
+        Проверяет отсутствие курсора у полной страницы, после которой мемов нет.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_mem_repository.get_by_filter.return_value = [
+            Mem(uuid=MemUUID(UUID('262f8c19-27c0-4e3c-b096-f6147ac052a3')),
+                text=MemText('Купец.')),
+            Mem(uuid=MemUUID(UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')),
+                text=MemText('Колобок повесился.'))
+        ]
+        mock_mem_repository.count.return_value = MemCount(value=2)
+        mock_image_repository = get_mock_image_repository()
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        memes_page = await mem_service.get_memes_page(MemFilterParams(per_page=2))
+
+        assert len(memes_page.items) == 2
+        assert not memes_page.has_next
+        assert memes_page.next_cursor is None
+
+    async def test_get_memes_page_should_not_return_cursor_for_last_page(self):
+        """
+        Проверяет отсутствие курсора у неполной (последней) страницы мемов.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_mem_repository.get_by_filter.return_value = [
+            Mem(uuid=MemUUID(UUID('262f8c19-27c0-4e3c-b096-f6147ac052a3')),
+                text=MemText('Купец.'))
+        ]
+        mock_mem_repository.count.return_value = MemCount(value=20000, is_estimate=True)
+        mock_image_repository = get_mock_image_repository()
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        memes_page = await mem_service.get_memes_page(MemFilterParams(per_page=2, q='купец'))
+
+        assert len(memes_page.items) == 1
+        assert memes_page.next_cursor is None
+        mock_mem_repository.count.assert_called_once_with(q='купец')
+        assert memes_page.total == 20000
+        assert memes_page.total_is_estimate
+
     async def test_update_mem_should_return_mem(self):
         """
         Проверяет обновление мема через сервис и возвращение обновлённого мема.
@@ -137,6 +524,84 @@ class TestMemService:
         assert updated_mem.text == 'Колобок повесился.'
         assert updated_mem.image_path == 'mem_777a3f52-ce9a-4758-a4d4-881221f94f63'
 
+    async def test_update_mem_with_failed_upload_should_keep_old_image(self):
+        """
+        Проверяет, что при ошибке загрузки новой картинки старая картинка не удаляется и мем не обновляется.
+        """
+        mock_mem_repository = get_mock_mem_repository()
+        mock_mem_repository.get_by_id.return_value = Mem(
+            uuid=MemUUID(UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')),
+            text=MemText('Колобок повесился.'),
+            image_path=ImagePath('mem_777a3f52-ce9a-4758-a4d4-881221f94f63')
+        )
+        mock_image_repository = get_mock_image_repository()
+        mock_image_repository.save_image.side_effect = ImageTooLargeException
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        mem_to_update = MemUpdateSchema(uuid=UUID('777a3f52-ce9a-4758-a4d4-881221f94f63'),
+                                        text='Колобок повесился.')
+        with pytest.raises(ImageTooLargeException):
+            await mem_service.update_mem(mem_to_update, BytesIO(b'meme_image'))
+
+        mock_image_repository.delete_image.assert_not_called()
+        mock_mem_repository.update.assert_not_called()
+
+    async def test_update_mem_with_new_image_should_delete_only_old_variants(self):
+        """
+        Проверяет, что картинка, перезаписанная по тому же пути, не удаляется после обновления,
+        а удаляются только её устаревшие варианты.
+        """
+        mem_id = UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')
+        old_mem = Mem(uuid=MemUUID(mem_id),
+                      text=MemText('Колобок повесился.'),
+                      image_path=ImagePath(f'mem_{mem_id}'))
+        mock_mem_repository = get_mock_mem_repository()
+        mock_mem_repository.get_by_id.return_value = old_mem
+        mock_mem_repository.update.return_value = old_mem
+        mock_image_repository = get_mock_image_repository()
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository)
+        await mem_service.update_mem(MemUpdateSchema(uuid=mem_id, text='Колобок повесился.'),
+                                     BytesIO(b'meme_image'))
+
+        mock_mem_repository.get_by_id.assert_awaited_once_with(mem_id, use_primary=True)
+        mock_image_repository.save_image.assert_awaited_once()
+        deleted_paths = {call.kwargs['path'] for call in mock_image_repository.delete_image.await_args_list}
+        assert deleted_paths == {variant.path(f'mem_{mem_id}') for variant in ImageVariant}
+
+    async def test_delete_mem_with_shared_image_should_keep_image(self):
+        """
+        Проверяет, что при хранении по хэшу картинка удаляется только вместе с последней ссылкой на неё.
+        """
+        image_hash = '9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08'
+        mock_mem_repository = get_mock_mem_repository()
+        mock_mem_repository.get_by_id.return_value = Mem(
+            uuid=MemUUID(UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')),
+            text=MemText('Колобок повесился.'),
+            image_path=ImagePath(f'image_{image_hash}'),
+            image_hash=ImageHash(image_hash)
+        )
+        mock_image_repository = get_mock_image_repository()
+        mock_image_ref_repository = get_mock_image_ref_repository()
+        ref_counts = [1, 0]
+
+        async def release(hash_, delete_image=None):
+            ref_count = ref_counts.pop(0)
+            if ref_count == 0:
+                # Картинка удаляется внутри release, пока счётчик заблокирован
+                await delete_image()
+            return ref_count
+
+        mock_image_ref_repository.release.side_effect = release
+
+        mem_service = MemService(mock_mem_repository, mock_image_repository, mock_image_ref_repository)
+        await mem_service.delete_mem_by_id(UUID('777a3f52-ce9a-4758-a4d4-881221f94f63'))
+        mock_image_repository.delete_image.assert_not_awaited()
+
+        await mem_service.delete_mem_by_id(UUID('777a3f52-ce9a-4758-a4d4-881221f94f63'))
+        mock_image_repository.delete_image.assert_any_await(path=f'image_{image_hash}')
+        mock_image_repository.delete_image.assert_any_await(path=f'image_{image_hash}_thumb.webp')
+
     async def test_delete_not_exists_mem_should_raise_exception(self):
         """
         Проверяет обновление мема через сервис и возвращение обновлённого мема.
@@ -5,6 +5,7 @@
 from uuid import UUID
 
 from app.core.mem.domain.mem_entity import Mem
+from app.core.mem.domain.value_objects.image_hash import ImageHash
 from app.core.mem.domain.value_objects.image_path import ImagePath
 from app.core.mem.domain.value_objects.mem_text import MemText
 from app.core.mem.domain.value_objects.mem_uuid import MemUUID
@@ -61,3 +62,15 @@ class TestMem:
 
         mem.upload_image(ImagePath('memas_777a3f52-ce9a-4758-a4d4-881221f94f63'))
         assert mem.image_path == ImagePath('memas_777a3f52-ce9a-4758-a4d4-881221f94f63')
+
+    def test_upload_image_with_hash_should_create_image_path_by_hash(self):
+        """
+        Проверяет создание пути картинки по хэшу содержимого при хранении картинок по хэшу.
+        """
+        mem = Mem(uuid=MemUUID(UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')),
+                  text=MemText('Колобок повесился.'))
+
+        mem.upload_image(image_hash=ImageHash('9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08'))
+
+        assert mem.image_path == ImagePath('image_9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08')
+        assert mem.image_hash == ImageHash('9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08')
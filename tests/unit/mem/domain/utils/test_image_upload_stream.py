@@ -0,0 +1,55 @@
+"""
+Юнит-тесты потока загружаемого изображения ImageUploadStream.
+"""
+import pytest
+
+from app.core.mem.domain.exceptions.image_exceptions import ImageTooLargeException
+from app.core.mem.domain.utils.image_upload_stream import ImageUploadStream, ImageUploadBatch
+
+
+async def iter_chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+class TestImageUploadStream:
+    """
+    Юнит-тесты для потока загружаемого изображения :class:`ImageUploadStream`
+    """
+
+    async def test_iter_should_count_size_and_hash(self):
+        """
+        Проверяет подсчёт размера и хэша содержимого при чтении потока.
+        """
+        image_stream = ImageUploadStream(chunks=iter_chunks(b'te', b'st'), max_size=10)
+
+        assert [chunk async for chunk in image_stream] == [b'te', b'st']
+        assert image_stream.size == 4
+        assert image_stream.hash == '9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08'
+
+    async def test_iter_too_large_image_should_raise_exception(self):
+        """
+        Проверяет прерывание чтения потока при превышении максимального размера.
+        """
+        image_stream = ImageUploadStream(chunks=iter_chunks(b'meme_', b'image', b'!'), max_size=8)
+        read_chunks = []
+
+        with pytest.raises(ImageTooLargeException):
+            async for chunk in image_stream:
+                read_chunks.append(chunk)
+
+        assert read_chunks == [b'meme_']
+
+    async def test_iter_with_batch_over_total_size_should_raise_exception(self):
+        """
+        Проверяет прерывание чтения при превышении суммарного размера изображений запроса.
+        """
+        upload_batch = ImageUploadBatch(max_size=8)
+        first_stream = ImageUploadStream(chunks=iter_chunks(b'meme_'), max_size=8, batch=upload_batch)
+        second_stream = ImageUploadStream(chunks=iter_chunks(b'image'), max_size=8, batch=upload_batch)
+
+        assert [chunk async for chunk in first_stream] == [b'meme_']
+        with pytest.raises(ImageTooLargeException):
+            async for _ in second_stream:
+                pass
+        assert upload_batch.size == 10
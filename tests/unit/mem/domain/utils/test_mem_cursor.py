@@ -0,0 +1,42 @@
+"""
+Юнит-тесты курсора MemCursor.
+"""
+from uuid import UUID
+
+import pytest
+
+from app.core.mem.domain.exceptions.mem_filter_exceptions import InvalidMemCursorError
+from app.core.mem.domain.utils.mem_cursor import MemCursor
+
+
+class TestMemCursor:
+    """
+    Юнит-тесты для курсора :class:`MemCursor`
+    """
+
+    def test_encode_decode_should_restore_cursor(self):
+        """
+        Проверяет восстановление курсора из закодированной строки.
+        """
+        cursor = MemCursor(uuid=UUID('777a3f52-ce9a-4758-a4d4-881221f94f63'))
+        encoded = cursor.encode()
+
+        assert isinstance(encoded, str)
+        assert '777a3f52' not in encoded
+        assert MemCursor.decode(encoded) == cursor
+
+    @pytest.mark.parametrize('encoded', ['', 'not a cursor', 'e30', 'eyJpZCI6IjEyMyJ9'])
+    def test_decode_invalid_cursor_should_raise_exception(self, encoded):
+        """
+        Проверяет выбрасывание исключения при декодировании некорректного курсора.
+        """
+        with pytest.raises(InvalidMemCursorError):
+            MemCursor.decode(encoded)
+
+    @pytest.mark.parametrize('encoded', ['eyJpZCI6MTIzfQ', 'eyJpZCI6bnVsbH0', 'W10', 'eyJpZCI6WyJ4Il19'])
+    def test_decode_cursor_with_non_string_id_should_raise_exception(self, encoded):
+        """
+        Проверяет выбрасывание исключения при декодировании курсора, идентификатор в котором не строка.
+        """
+        with pytest.raises(InvalidMemCursorError):
+            MemCursor.decode(encoded)
@@ -0,0 +1,47 @@
+"""
+Юнит-тесты генератора вариантов картинок PillowImageVariantGenerator.
+"""
+from io import BytesIO
+
+from PIL import Image
+
+from app.core.mem.domain.utils.image_variant import ImageVariant
+from app.core.mem.infrastructure.images.pillow_variant_generator import PillowImageVariantGenerator
+
+
+def create_png(width: int, height: int) -> bytes:
+    """
+    Создаёт картинку PNG заданного размера.
+    """
+    output = BytesIO()
+    Image.new('RGB', (width, height), color='red').save(output, format='PNG')
+    return output.getvalue()
+
+
+class TestPillowImageVariantGenerator:
+    """
+    Юнит-тесты для генератора вариантов картинок :class:`PillowImageVariantGenerator`
+    """
+
+    async def test_generate_should_resize_to_webp_with_aspect_ratio(self):
+        """
+        Проверяет уменьшение картинки с сохранением пропорций и кодирование в WebP.
+        """
+        generator = PillowImageVariantGenerator(sizes={ImageVariant.THUMB: 100, ImageVariant.MEDIUM: 400})
+        variants = await generator.generate(create_png(800, 400))
+
+        with Image.open(BytesIO(variants[ImageVariant.THUMB])) as thumb:
+            assert thumb.format == 'WEBP'
+            assert thumb.size == (100, 50)
+        with Image.open(BytesIO(variants[ImageVariant.MEDIUM])) as medium:
+            assert medium.size == (400, 200)
+
+    async def test_generate_should_not_upscale_small_image(self):
+        """
+        Проверяет, что картинка меньше размера варианта не увеличивается.
+        """
+        generator = PillowImageVariantGenerator(sizes={ImageVariant.THUMB: 100})
+        variants = await generator.generate(create_png(40, 20))
+
+        with Image.open(BytesIO(variants[ImageVariant.THUMB])) as thumb:
+            assert thumb.size == (40, 20)
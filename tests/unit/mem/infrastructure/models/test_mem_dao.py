@@ -27,10 +27,16 @@ class TestMemDao:
 
         assert mem_dao1.to_dict() == {'id': UUID('777a3f52-ce9a-4758-a4d4-881221f94f63'),
                                       'text': 'Колобок повесился.',
-                                      'image_path': None}
+                                      'image_path': None,
+                                      'image_hash': None,
+                                      'version': None,
+                                      'updated_at': None}
         assert mem_dao2.to_dict() == {'id': UUID('777a3f52-ce9a-4758-a4d4-881221f94f63'),
                                       'text': 'Колобок повесился.',
-                                      'image_path': 'mem_777a3f52-ce9a-4758-a4d4-881221f94f63'}
+                                      'image_path': 'mem_777a3f52-ce9a-4758-a4d4-881221f94f63',
+                                      'image_hash': None,
+                                      'version': None,
+                                      'updated_at': None}
 
     def test_to_entity_should_create_entity_instance(self):
         """
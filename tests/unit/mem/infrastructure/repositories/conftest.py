@@ -0,0 +1,7 @@
+"""
+Настройки хранилища изображений для юнит-тестов репозиториев.
+Репозиторий S3 читает настройки при импорте, поэтому переменные окружения задаются до импорта тестов.
+"""
+import os
+
+os.environ.setdefault('IMAGES_BUCKET_NAME', 'memes')
@@ -0,0 +1,181 @@
+"""
+Юнит-тесты кэширующего репозитория мемов CachedMemRepository.
+"""
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from app.core.mem.domain.mem_entity import Mem
+from app.core.mem.domain.mem_repository import MemRepository
+from app.core.mem.domain.utils.mem_count import MemCount
+from app.core.mem.domain.value_objects.mem_text import MemText
+from app.core.mem.domain.value_objects.mem_uuid import MemUUID
+from app.core.mem.infrastructure.repositories.cached_mem_repository import CachedMemRepository
+from app.core.shared_kernel.cache.lru_ttl_cache import LRUTTLCache
+from app.core.shared_kernel.db.exceptions import EntityNotFoundException
+
+MEM_ID = UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')
+OTHER_MEM_ID = UUID('262f8c19-27c0-4e3c-b096-f6147ac052a3')
+
+
+def get_mem() -> Mem:
+    """
+    Создаёт мем для тестов.
+    """
+    return Mem(uuid=MemUUID(MEM_ID), text=MemText('Колобок повесился.'))
+
+
+class TestCachedMemRepository:
+    """
+    Юнит-тесты для кэширующего репозитория :class:`CachedMemRepository`
+    """
+
+    async def test_get_by_id_should_use_cache_on_repeated_reads(self):
+        """
+        Проверяет, что повторное получение мема не обращается к оборачиваемому репозиторию.
+        """
+        mock_mem_repository = MagicMock(spec=MemRepository)
+        mock_mem_repository.get_by_id.return_value = get_mem()
+        cache = LRUTTLCache(max_size=10, ttl=60)
+        repository = CachedMemRepository(mock_mem_repository, cache)
+
+        first = await repository.get_by_id(MEM_ID)
+        second = await repository.get_by_id(MEM_ID)
+
+        assert first == second == get_mem()
+        mock_mem_repository.get_by_id.assert_awaited_once_with(MEM_ID)
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    async def test_get_by_id_use_primary_should_bypass_cache(self):
+        """
+        Проверяет, что мем с чтением из основного хранилища всегда получается из оборачиваемого репозитория.
+        """
+        mock_mem_repository = MagicMock(spec=MemRepository)
+        mock_mem_repository.get_by_id.return_value = get_mem()
+        repository = CachedMemRepository(mock_mem_repository, LRUTTLCache(max_size=10))
+
+        await repository.get_by_id(MEM_ID)
+        await repository.get_by_id(MEM_ID, use_primary=True)
+
+        assert mock_mem_repository.get_by_id.await_count == 2
+        mock_mem_repository.get_by_id.assert_awaited_with(MEM_ID, use_primary=True)
+
+    async def test_get_by_id_should_not_cache_missing_mem(self):
+        """
+        Проверяет, что отсутствующий мем не кэшируется.
+        """
+        mock_mem_repository = MagicMock(spec=MemRepository)
+        mock_mem_repository.get_by_id.return_value = None
+        repository = CachedMemRepository(mock_mem_repository, LRUTTLCache(max_size=10))
+
+        assert await repository.get_by_id(MEM_ID) is None
+        assert await repository.get_by_id(MEM_ID) is None
+        assert mock_mem_repository.get_by_id.await_count == 2
+
+    async def test_get_by_id_updated_during_read_should_not_cache_stale_mem(self):
+        """
+        Проверяет, что мем, изменённый во время чтения из оборачиваемого репозитория, не сохраняется в кэш.
+        """
+        cache = LRUTTLCache(max_size=10, ttl=60)
+        repository = None
+
+        async def get_by_id(id_, use_primary=False):
+            await repository.update(get_mem())
+            return get_mem()
+
+        mock_mem_repository = MagicMock(spec=MemRepository)
+        mock_mem_repository.get_by_id.side_effect = get_by_id
+        repository = CachedMemRepository(mock_mem_repository, cache)
+
+        await repository.get_by_id(MEM_ID)
+
+        assert cache.get(MEM_ID) is None
+
+    async def test_get_by_ids_deleted_during_read_should_not_cache_stale_memes(self):
+        """
+        Проверяет, что мемы, удалённые во время чтения из оборачиваемого репозитория, не сохраняются в кэш.
+        """
+        cache = LRUTTLCache(max_size=10, ttl=60)
+        repository = None
+
+        async def get_by_ids(ids):
+            await repository.delete_by_id(MEM_ID)
+            return [get_mem()]
+
+        mock_mem_repository = MagicMock(spec=MemRepository)
+        mock_mem_repository.get_by_ids.side_effect = get_by_ids
+        repository = CachedMemRepository(mock_mem_repository, cache)
+
+        await repository.get_by_ids([MEM_ID])
+
+        assert cache.get(MEM_ID) is None
+
+    async def test_update_should_invalidate_cache(self):
+        """
+        Проверяет сброс записи кэша при обновлении мема.
+        """
+        mock_mem_repository = MagicMock(spec=MemRepository)
+        mock_mem_repository.get_by_id.return_value = get_mem()
+        cache = LRUTTLCache(max_size=10)
+        repository = CachedMemRepository(mock_mem_repository, cache)
+
+        await repository.get_by_id(MEM_ID)
+        await repository.update(get_mem())
+
+        assert len(cache) == 0
+        mock_mem_repository.update.assert_awaited_once()
+
+    async def test_delete_by_id_should_invalidate_cache_even_on_error(self):
+        """
+        Проверяет сброс записи кэша при удалении мема, даже если удаление завершилось ошибкой.
+        """
+        mock_mem_repository = MagicMock(spec=MemRepository)
+        mock_mem_repository.get_by_id.return_value = get_mem()
+        mock_mem_repository.delete_by_id.side_effect = EntityNotFoundException
+        cache = LRUTTLCache(max_size=10)
+        repository = CachedMemRepository(mock_mem_repository, cache)
+
+        await repository.get_by_id(MEM_ID)
+        with pytest.raises(EntityNotFoundException):
+            await repository.delete_by_id(MEM_ID)
+
+        assert len(cache) == 0
+
+    async def test_count_should_use_count_cache_until_mem_added(self):
+        """
+        Проверяет кэширование количества мемов по поисковому запросу и сброс кэша при добавлении мема.
+        """
+        mock_mem_repository = MagicMock(spec=MemRepository)
+        mock_mem_repository.count.return_value = MemCount(value=1)
+        repository = CachedMemRepository(mock_mem_repository, LRUTTLCache(max_size=10),
+                                         count_cache=LRUTTLCache(max_size=10, ttl=60))
+
+        assert await repository.count() == MemCount(value=1)
+        assert await repository.count() == MemCount(value=1)
+        await repository.count(q='колобок')
+        assert mock_mem_repository.count.await_count == 2
+
+        await repository.add(get_mem())
+        await repository.count()
+
+        assert mock_mem_repository.count.await_count == 3
+
+    async def test_get_by_ids_should_fetch_only_missing_memes_in_requested_order(self):
+        """
+        Проверяет, что мемы из кэша не запрашиваются повторно, а результат сохраняет порядок идентификаторов.
+        """
+        other_mem = Mem(uuid=MemUUID(OTHER_MEM_ID), text=MemText('Купец.'))
+        mock_mem_repository = MagicMock(spec=MemRepository)
+        mock_mem_repository.get_by_id.return_value = get_mem()
+        mock_mem_repository.get_by_ids.return_value = [other_mem]
+        repository = CachedMemRepository(mock_mem_repository, LRUTTLCache(max_size=10))
+
+        await repository.get_by_id(MEM_ID)
+        memes = await repository.get_by_ids([OTHER_MEM_ID, MEM_ID, OTHER_MEM_ID])
+
+        assert memes == [other_mem, get_mem()]
+        mock_mem_repository.get_by_ids.assert_awaited_once_with([OTHER_MEM_ID])
+        assert await repository.get_by_id(OTHER_MEM_ID) == other_mem
+        mock_mem_repository.get_by_id.assert_awaited_once()
@@ -0,0 +1,175 @@
+"""
+Юнит-тесты репозитория изображений с дисковым кэшем DiskCachedImageRepository.
+"""
+from io import BytesIO
+from unittest.mock import MagicMock
+
+from app.core.mem.domain.image_repository import ImageRepository
+from app.core.mem.domain.utils.byte_range import ByteRange
+from app.core.mem.domain.utils.image_stream import ImageStream
+from app.core.mem.infrastructure.repositories.disk_cached_image_repository import DiskCachedImageRepository
+from app.core.shared_kernel.cache.disk_lru_cache import DiskLRUCache
+
+IMAGE_PATH = 'mem_777a3f52-ce9a-4758-a4d4-881221f94f63'
+
+
+async def chunks(*parts: bytes):
+    """
+    Создаёт асинхронный итератор частей изображения.
+    """
+    for part in parts:
+        yield part
+
+
+class TestDiskCachedImageRepository:
+    """
+    Юнит-тесты для репозитория изображений :class:`DiskCachedImageRepository`
+    """
+
+    async def test_get_image_should_read_from_cache_after_first_read(self, tmp_path):
+        """
+        Проверяет, что повторное получение изображения не обращается к оборачиваемому репозиторию.
+        """
+        mock_image_repository = MagicMock(spec=ImageRepository)
+        mock_image_repository.get_image.return_value = BytesIO(b'meme_image')
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        repository = DiskCachedImageRepository(mock_image_repository, cache)
+
+        first = await repository.get_image(IMAGE_PATH)
+        second = await repository.get_image(IMAGE_PATH)
+
+        assert first.getvalue() == second.getvalue() == b'meme_image'
+        mock_image_repository.get_image.assert_awaited_once_with(path=IMAGE_PATH)
+        assert cache.hits == 1
+
+    async def test_stream_image_should_cache_fully_read_stream(self, tmp_path):
+        """
+        Проверяет запись полностью прочитанного потока в кэш и последующую отдачу из кэша.
+        """
+        mock_image_repository = MagicMock(spec=ImageRepository)
+        mock_image_repository.stream_image.return_value = ImageStream(chunks=chunks(b'meme_', b'image'), size=10)
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        repository = DiskCachedImageRepository(mock_image_repository, cache, chunk_size=4)
+
+        first = await repository.stream_image(IMAGE_PATH)
+        assert b''.join([chunk async for chunk in first.chunks]) == b'meme_image'
+
+        second = await repository.stream_image(IMAGE_PATH)
+        assert second.size == 10
+        assert [chunk async for chunk in second.chunks] == [b'meme', b'_ima', b'ge']
+        mock_image_repository.stream_image.assert_awaited_once_with(path=IMAGE_PATH)
+
+    async def test_stream_image_should_not_cache_partially_read_stream(self, tmp_path):
+        """
+        Проверяет, что прерванный поток не попадает в кэш.
+        """
+        mock_image_repository = MagicMock(spec=ImageRepository)
+        mock_image_repository.stream_image.return_value = ImageStream(chunks=chunks(b'meme_', b'image'))
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        repository = DiskCachedImageRepository(mock_image_repository, cache)
+
+        image_stream = await repository.stream_image(IMAGE_PATH)
+        assert await anext(image_stream.chunks) == b'meme_'
+        await image_stream.chunks.aclose()
+
+        assert cache.size == 0
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_stream_image_range_should_read_range_from_cache(self, tmp_path):
+        """
+        Проверяет чтение диапазона байтов и размера изображения из кэша без обращения к хранилищу.
+        """
+        mock_image_repository = MagicMock(spec=ImageRepository)
+        mock_image_repository.get_image.return_value = BytesIO(b'meme_image')
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        repository = DiskCachedImageRepository(mock_image_repository, cache, chunk_size=2)
+        await repository.get_image(IMAGE_PATH)
+
+        image_size = await repository.get_image_size(IMAGE_PATH)
+        range_stream = await repository.stream_image_range(IMAGE_PATH, ByteRange(start=2, end=6))
+
+        assert image_size == 10
+        assert range_stream.size == 5
+        assert [chunk async for chunk in range_stream.chunks] == [b'me', b'_i', b'm']
+        mock_image_repository.get_image_size.assert_not_awaited()
+        mock_image_repository.stream_image_range.assert_not_awaited()
+
+    async def test_stream_image_range_should_delegate_on_cache_miss(self, tmp_path):
+        """
+        Проверяет чтение диапазона байтов из оборачиваемого репозитория при промахе кэша.
+        """
+        byte_range = ByteRange(start=0, end=3)
+        mock_image_repository = MagicMock(spec=ImageRepository)
+        mock_image_repository.stream_image_range.return_value = ImageStream(chunks=chunks(b'meme'), size=4)
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        repository = DiskCachedImageRepository(mock_image_repository, cache)
+
+        range_stream = await repository.stream_image_range(IMAGE_PATH, byte_range)
+
+        assert b''.join([chunk async for chunk in range_stream.chunks]) == b'meme'
+        mock_image_repository.stream_image_range.assert_awaited_once_with(path=IMAGE_PATH, byte_range=byte_range)
+        assert cache.size == 0
+
+    async def test_save_and_delete_image_should_invalidate_cache(self, tmp_path):
+        """
+        Проверяет сброс копии изображения в кэше при сохранении и удалении изображения.
+        """
+        mock_image_repository = MagicMock(spec=ImageRepository)
+        mock_image_repository.get_image.side_effect = lambda path: BytesIO(b'meme_image')
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        repository = DiskCachedImageRepository(mock_image_repository, cache)
+
+        await repository.get_image(IMAGE_PATH)
+        await repository.save_image(IMAGE_PATH, BytesIO(b'new_image'))
+        assert cache.size == 0
+
+        await repository.get_image(IMAGE_PATH)
+        await repository.delete_image(IMAGE_PATH)
+        assert cache.size == 0
+        assert mock_image_repository.get_image.await_count == 2
+
+    async def test_get_image_deleted_during_read_should_not_cache_stale_image(self, tmp_path):
+        """
+        Проверяет, что изображение, удалённое во время чтения из хранилища, не попадает в кэш.
+        """
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+
+        async def get_image(path):
+            cache.delete(path)
+            return BytesIO(b'old_image')
+
+        mock_image_repository = MagicMock(spec=ImageRepository)
+        mock_image_repository.get_image.side_effect = get_image
+        repository = DiskCachedImageRepository(mock_image_repository, cache)
+
+        assert (await repository.get_image(IMAGE_PATH)).getvalue() == b'old_image'
+        assert cache.size == 0
+
+    async def test_stream_image_overwritten_before_read_should_not_cache_stale_image(self, tmp_path):
+        """
+        Проверяет, что изображение, перезаписанное до чтения потока, не попадает в кэш.
+        """
+        mock_image_repository = MagicMock(spec=ImageRepository)
+        mock_image_repository.stream_image.return_value = ImageStream(chunks=chunks(b'old_image'), size=9)
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        repository = DiskCachedImageRepository(mock_image_repository, cache)
+
+        image_stream = await repository.stream_image(IMAGE_PATH)
+        await repository.save_image(IMAGE_PATH, BytesIO(b'new_image'))
+
+        assert b''.join([chunk async for chunk in image_stream.chunks]) == b'old_image'
+        assert cache.size == 0
+
+    async def test_stream_image_never_read_should_remove_temp_file(self, tmp_path):
+        """
+        Проверяет, что запись в кэш отменяется, если поток так и не начали читать.
+        """
+        mock_image_repository = MagicMock(spec=ImageRepository)
+        mock_image_repository.stream_image.return_value = ImageStream(chunks=chunks(b'meme_image'), size=10)
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        repository = DiskCachedImageRepository(mock_image_repository, cache)
+
+        image_stream = await repository.stream_image(IMAGE_PATH)
+        del image_stream
+
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,91 @@
+"""
+Юнит-тесты репозитория счётчиков ссылок на картинки ImageRefDBRepository.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.mem.infrastructure.repositories.image_ref_repository import ImageRefDBRepository
+
+
+def get_mock_session(active_calls: list[int]) -> MagicMock:
+    """
+    Создаёт заглушку сессии, которая запоминает наибольшее количество одновременных обращений к ней.
+    """
+    mock_session = MagicMock(spec=AsyncSession)
+    in_use = 0
+
+    async def use_session(*args, **kwargs):
+        nonlocal in_use
+        in_use += 1
+        active_calls.append(in_use)
+        await asyncio.sleep(0)
+        in_use -= 1
+        result = MagicMock()
+        result.scalar_one.return_value = 1
+        result.scalar_one_or_none.return_value = 1
+        return result
+
+    mock_session.execute.side_effect = use_session
+    mock_session.commit.side_effect = use_session
+    return mock_session
+
+
+class TestImageRefDBRepository:
+    """
+    Юнит-тесты для репозитория :class:`ImageRefDBRepository`
+    """
+
+    async def test_parallel_changes_should_use_session_one_at_a_time(self):
+        """
+        Проверяет, что изменения счётчиков из параллельных задач не используют сессию одновременно.
+        """
+        active_calls = []
+        repository = ImageRefDBRepository(get_mock_session(active_calls))
+
+        await asyncio.gather(repository.acquire('hash_1'), repository.acquire('hash_2'),
+                             repository.release('hash_3'))
+
+        assert len(active_calls) == 6
+        assert max(active_calls) == 1
+
+    async def test_release_last_ref_should_delete_image_before_commit(self):
+        """
+        Проверяет, что картинка без ссылок удаляется до фиксации транзакции, пока счётчик заблокирован,
+        а счётчик удаляется, даже если удалить картинку не удалось.
+        """
+        events = []
+        mock_session = MagicMock(spec=AsyncSession)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = 0
+        mock_session.execute.return_value = result
+        mock_session.commit.side_effect = lambda: events.append('commit')
+        repository = ImageRefDBRepository(mock_session)
+
+        async def delete_image():
+            events.append('delete_image')
+            raise ConnectionError
+
+        with pytest.raises(ConnectionError):
+            await repository.release('hash', delete_image=delete_image)
+
+        assert events == ['delete_image', 'commit']
+        assert mock_session.execute.await_count == 2
+
+    async def test_release_not_last_ref_should_keep_image(self):
+        """
+        Проверяет, что картинка, на которую остались ссылки, не удаляется.
+        """
+        mock_session = MagicMock(spec=AsyncSession)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = 1
+        mock_session.execute.return_value = result
+        repository = ImageRefDBRepository(mock_session)
+        delete_image = AsyncMock()
+
+        assert await repository.release('hash', delete_image=delete_image) == 1
+        delete_image.assert_not_awaited()
+        mock_session.commit.assert_awaited_once()
@@ -0,0 +1,69 @@
+"""
+Юнит-тесты репозитория S3 хранилища изображений ImageS3Repository.
+"""
+from io import BytesIO
+
+import boto3
+import pytest
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
+from app.core.mem.domain.exceptions.image_exceptions import ImageNotFoundException
+from app.core.mem.infrastructure.repositories.image_repository import ImageS3Repository, settings
+
+IMAGE_PATH = 'mem_777a3f52-ce9a-4758-a4d4-881221f94f63'
+
+
+@pytest.fixture
+def s3_client():
+    """
+    Создаёт клиент S3 с заглушкой ответов хранилища.
+    """
+    client = boto3.client('s3', endpoint_url='http://s3.test', region_name='ru-central1',
+                          aws_access_key_id='key', aws_secret_access_key='secret')
+    with Stubber(client) as stubber:
+        yield client, stubber
+        stubber.assert_no_pending_responses()
+
+
+class TestImageS3Repository:
+    """
+    Юнит-тесты для репозитория :class:`ImageS3Repository`
+    """
+
+    async def test_stream_image_should_get_object_through_client(self, s3_client):
+        """
+        Проверяет чтение изображения через клиент S3.
+        """
+        client, stubber = s3_client
+        stubber.add_response('get_object',
+                             {'Body': StreamingBody(BytesIO(b'image'), 5), 'ContentLength': 5},
+                             {'Bucket': settings.bucket_name, 'Key': IMAGE_PATH})
+        image_repository = ImageS3Repository(client)
+
+        image_stream = await image_repository.stream_image(IMAGE_PATH)
+
+        assert image_stream.size == 5
+        assert b''.join([chunk async for chunk in image_stream.chunks]) == b'image'
+
+    async def test_stream_image_with_missing_object_should_raise_not_found(self, s3_client):
+        """
+        Проверяет, что отсутствие объекта в хранилище приводит к ImageNotFoundException.
+        """
+        client, stubber = s3_client
+        stubber.add_client_error('get_object', service_error_code='NoSuchKey', http_status_code=404)
+        image_repository = ImageS3Repository(client)
+
+        with pytest.raises(ImageNotFoundException):
+            await image_repository.stream_image(IMAGE_PATH)
+
+    async def test_delete_image_should_delete_object_through_client(self, s3_client):
+        """
+        Проверяет удаление изображения через клиент S3.
+        """
+        client, stubber = s3_client
+        stubber.add_response('delete_objects', {},
+                             {'Bucket': settings.bucket_name, 'Delete': {'Objects': [{'Key': IMAGE_PATH}]}})
+        image_repository = ImageS3Repository(client)
+
+        await image_repository.delete_image(IMAGE_PATH)
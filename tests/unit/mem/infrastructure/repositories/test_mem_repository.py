@@ -0,0 +1,66 @@
+"""
+Юнит-тесты репозитория мемов MemDBRepository.
+"""
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.mem.domain.exceptions.mem_filter_exceptions import InvalidMemCursorError
+from app.core.mem.domain.utils.mem_cursor import MemCursor
+from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
+from app.core.mem.infrastructure.repositories.mem_repository import MemDBRepository
+
+CURSOR = MemCursor(uuid=UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')).encode()
+
+
+def get_mock_session(anchor_rank: float | None) -> MagicMock:
+    """
+    Создаёт заглушку асинхронной сессии, запрос страницы которой не находит строк.
+
+    :param anchor_rank: Релевантность мема курсора, None - мем курсора не найден.
+    """
+    mock_session = MagicMock(spec=AsyncSession)
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=result)
+    mock_session.scalar = AsyncMock(return_value=anchor_rank)
+    return mock_session
+
+
+class TestMemDBRepository:
+    """
+    Юнит-тесты для репозитория :class:`MemDBRepository`
+    """
+
+    async def test_get_by_filter_with_lost_search_cursor_should_raise(self):
+        """
+        Проверяет, что поиск после удалённого или больше не найденного мема курсора
+        завершается ошибкой курсора, а не пустой страницей.
+        """
+        mock_session = get_mock_session(anchor_rank=None)
+        repository = MemDBRepository(mock_session)
+
+        with pytest.raises(InvalidMemCursorError):
+            await repository.get_by_filter(MemFilterParams(per_page=10, after=CURSOR, q='кот'))
+        mock_session.close.assert_awaited_once()
+
+    async def test_get_by_filter_with_search_cursor_at_end_should_return_empty_page(self):
+        """
+        Проверяет, что после последнего найденного мема возвращается пустая страница.
+        """
+        mock_session = get_mock_session(anchor_rank=0.1)
+        repository = MemDBRepository(mock_session)
+
+        assert await repository.get_by_filter(MemFilterParams(per_page=10, after=CURSOR, q='кот')) == []
+
+    async def test_get_by_filter_without_search_should_not_check_cursor(self):
+        """
+        Проверяет, что курсор без поиска не требует дополнительного запроса.
+        """
+        mock_session = get_mock_session(anchor_rank=None)
+        repository = MemDBRepository(mock_session)
+
+        assert await repository.get_by_filter(MemFilterParams(per_page=10, after=CURSOR)) == []
+        mock_session.scalar.assert_not_awaited()
@@ -0,0 +1,116 @@
+"""
+Юнит-тесты фильтра запросов мемов MemFilter.
+"""
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.mem.domain.utils.mem_cursor import MemCursor
+from app.core.mem.domain.utils.mem_filter_params import MemFilterParams
+from app.core.mem.infrastructure.models.mem_dao import MemDao
+from app.core.mem.infrastructure.repositories.utils.mem_filter import MemFilter
+
+
+class TestMemFilter:
+    """
+    Юнит-тесты для фильтра :class:`MemFilter`
+    """
+
+    def test_filter_query_by_page_should_use_offset_and_order(self):
+        """
+        Проверяет выборку страницы по номеру со смещением и стабильным порядком.
+        """
+        mem_filter_params = MemFilterParams(page=3, per_page=10)
+        query = MemFilter.filter_query(query=select(MemDao), mem_filter_params=mem_filter_params)
+        compiled = query.compile()
+
+        assert 'ORDER BY memes.id' in str(compiled)
+        assert 'WHERE' not in str(compiled)
+        assert compiled.params['param_1'] == 10
+        assert compiled.params['param_2'] == 20
+
+    def test_filter_query_with_limit_should_keep_page_offset(self):
+        """
+        Проверяет, что увеличенный лимит выборки не сдвигает смещение страницы.
+        """
+        mem_filter_params = MemFilterParams(page=2, per_page=10)
+        query = MemFilter.filter_query(query=select(MemDao), mem_filter_params=mem_filter_params, limit=11)
+        compiled = query.compile(dialect=postgresql.dialect())
+
+        assert 'LIMIT %(param_1)s OFFSET %(param_2)s' in str(compiled)
+        assert compiled.params['param_1'] == 11
+        assert compiled.params['param_2'] == 10
+
+    def test_filter_query_with_search_and_limit_should_keep_page_offset(self):
+        """
+        Проверяет, что увеличенный лимит выборки не сдвигает смещение страницы поиска.
+        """
+        mem_filter_params = MemFilterParams(page=3, per_page=10, q='кот')
+        query = MemFilter.filter_query(query=select(MemDao), mem_filter_params=mem_filter_params, limit=11)
+        compiled = query.compile(dialect=postgresql.dialect())
+
+        assert compiled.params['param_1'] == 11
+        assert compiled.params['param_2'] == 20
+
+    def test_filter_query_by_cursor_should_use_keyset(self):
+        """
+        Проверяет выборку страницы после курсора без смещения.
+        """
+        cursor = MemCursor(uuid=UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')).encode()
+        mem_filter_params = MemFilterParams(page=100, per_page=10, after=cursor)
+        query = MemFilter.filter_query(query=select(MemDao), mem_filter_params=mem_filter_params)
+        compiled = query.compile()
+
+        assert 'WHERE memes.id > :id_1' in str(compiled)
+        assert 'ORDER BY memes.id' in str(compiled)
+        assert 'OFFSET' not in str(compiled)
+        assert compiled.params['id_1'] == UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')
+
+    def test_filter_query_with_search_should_order_by_rank(self):
+        """
+        Проверяет полнотекстовый поиск по поисковому вектору и порядок по релевантности.
+        """
+        mem_filter_params = MemFilterParams(page=2, per_page=10, q='кот "в сапогах"')
+        query = MemFilter.filter_query(query=select(MemDao), mem_filter_params=mem_filter_params)
+        compiled = query.compile(dialect=postgresql.dialect())
+
+        assert 'memes.text_search @@ websearch_to_tsquery' in str(compiled)
+        assert 'ORDER BY ts_rank(memes.text_search' in str(compiled)
+        assert 'DESC, memes.id' in str(compiled)
+        assert 'кот "в сапогах"' in compiled.params.values()
+        assert 'text_search' not in str(compiled).split('FROM')[0]
+
+    def test_filter_query_with_search_by_cursor_should_use_rank_keyset(self):
+        """
+        Проверяет выборку страницы поиска после курсора по паре (релевантность, идентификатор) без смещения.
+        """
+        cursor = MemCursor(uuid=UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')).encode()
+        mem_filter_params = MemFilterParams(per_page=10, after=cursor, q='кот')
+        query = MemFilter.filter_query(query=select(MemDao), mem_filter_params=mem_filter_params)
+        compiled = query.compile(dialect=postgresql.dialect())
+
+        assert '(-ts_rank(memes.text_search' in str(compiled)
+        assert 'WHERE memes_1.id = ' in str(compiled)
+        assert 'OFFSET' not in str(compiled)
+
+    def test_cursor_anchor_query_should_require_cursor_mem_to_match_search(self):
+        """
+        Проверяет, что мем курсора ищется по идентификатору среди найденных поисковым запросом мемов.
+        """
+        cursor = MemCursor(uuid=UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')).encode()
+        mem_filter_params = MemFilterParams(per_page=10, after=cursor, q='кот')
+
+        compiled = MemFilter.cursor_anchor_query(mem_filter_params).compile(dialect=postgresql.dialect())
+
+        assert 'memes_1.id = ' in str(compiled)
+        assert 'memes_1.text_search @@ websearch_to_tsquery' in str(compiled)
+
+    def test_cursor_anchor_query_without_search_or_cursor_should_return_none(self):
+        """
+        Проверяет, что мем курсора проверяется только для поиска с курсором.
+        """
+        cursor = MemCursor(uuid=UUID('777a3f52-ce9a-4758-a4d4-881221f94f63')).encode()
+
+        assert MemFilter.cursor_anchor_query(MemFilterParams(per_page=10, after=cursor)) is None
+        assert MemFilter.cursor_anchor_query(MemFilterParams(per_page=10, q='кот')) is None
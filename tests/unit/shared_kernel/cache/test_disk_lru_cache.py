@@ -0,0 +1,99 @@
+"""
+Юнит-тесты дискового кэша DiskLRUCache.
+"""
+import os
+
+from app.core.shared_kernel.cache.disk_lru_cache import DiskLRUCache
+
+
+def read(cache: DiskLRUCache, key: str) -> bytes | None:
+    """
+    Читает файл из кэша целиком.
+    """
+    file = cache.open(key)
+    if file is None:
+        return None
+    with file:
+        return file.read()
+
+
+class TestDiskLRUCache:
+    """
+    Юнит-тесты для дискового кэша :class:`DiskLRUCache`
+    """
+
+    def test_put_should_store_file_and_count_hits(self, tmp_path):
+        """
+        Проверяет сохранение файла в кэш, его чтение и подсчёт попаданий и промахов.
+        """
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        cache.put('images/mem_1', b'meme_image')
+
+        assert read(cache, 'images/mem_1') == b'meme_image'
+        assert read(cache, 'images/mem_2') is None
+        assert cache.size == 10
+        assert cache.hit_ratio == 0.5
+
+    def test_put_should_evict_least_recently_used_by_bytes(self, tmp_path):
+        """
+        Проверяет вытеснение давно не использованных файлов при превышении объёма.
+        """
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=20)
+        cache.put('first', b'1' * 10)
+        cache.put('second', b'2' * 10)
+        read(cache, 'first')
+        cache.put('third', b'3' * 10)
+
+        assert read(cache, 'second') is None
+        assert read(cache, 'first') == b'1' * 10
+        assert read(cache, 'third') == b'3' * 10
+        assert cache.size == 20
+        assert len(os.listdir(tmp_path)) == 2
+
+    def test_put_should_skip_file_larger_than_cache(self, tmp_path):
+        """
+        Проверяет, что файл больше объёма кэша не сохраняется.
+        """
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=5)
+        cache.put('big', b'meme_image')
+
+        assert read(cache, 'big') is None
+        assert os.listdir(tmp_path) == []
+
+    def test_delete_during_write_should_discard_stale_file(self, tmp_path):
+        """
+        Проверяет, что запись, во время которой ключ был сброшен, не попадает в кэш.
+        """
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        writer = cache.begin_write('mem')
+        writer.write(b'old_image')
+        cache.delete('mem')
+        cache.commit_write(writer)
+
+        assert read(cache, 'mem') is None
+        assert os.listdir(tmp_path) == []
+
+    def test_abort_write_should_remove_temp_file(self, tmp_path):
+        """
+        Проверяет удаление временного файла при отмене записи.
+        """
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+        writer = cache.begin_write('mem')
+        writer.write(b'meme_')
+        cache.abort_write(writer)
+
+        assert read(cache, 'mem') is None
+        assert os.listdir(tmp_path) == []
+
+    def test_init_should_restore_files_from_directory(self, tmp_path):
+        """
+        Проверяет учёт файлов, оставшихся в каталоге от предыдущего запуска.
+        """
+        DiskLRUCache(directory=str(tmp_path), max_bytes=100).put('mem', b'meme_image')
+        (tmp_path / '.tmp_unfinished').write_bytes(b'meme_')
+
+        cache = DiskLRUCache(directory=str(tmp_path), max_bytes=100)
+
+        assert read(cache, 'mem') == b'meme_image'
+        assert cache.size == 10
+        assert not (tmp_path / '.tmp_unfinished').exists()
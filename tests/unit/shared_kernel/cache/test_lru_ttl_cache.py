@@ -0,0 +1,119 @@
+"""
+Юнит-тесты кэша LRUTTLCache.
+"""
+from prometheus_client import REGISTRY
+
+from app.core.shared_kernel.cache.lru_ttl_cache import LRUTTLCache
+
+
+class FakeTimer:
+    """
+    Управляемые часы для проверки времени жизни записей.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUTTLCache:
+    """
+    Юнит-тесты для кэша :class:`LRUTTLCache`
+    """
+
+    def test_get_should_count_hits_and_misses(self):
+        """
+        Проверяет получение значений и подсчёт попаданий и промахов.
+        """
+        cache = LRUTTLCache(max_size=2)
+        cache.set('mem', 1)
+
+        assert cache.get('mem') == 1
+        assert cache.get('unknown') is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_get_with_name_should_export_hits_and_misses(self):
+        """
+        Проверяет учёт попаданий и промахов именованного кэша в метриках Prometheus.
+        """
+        def get_sample(metric_name: str) -> float:
+            return REGISTRY.get_sample_value(metric_name, {'cache': 'test_lru_ttl_cache'}) or 0.0
+
+        hits_before, misses_before = get_sample('cache_hits_total'), get_sample('cache_misses_total')
+        cache = LRUTTLCache(max_size=2, name='test_lru_ttl_cache')
+        cache.set('mem', 1)
+
+        cache.get('mem')
+        cache.get('mem')
+        cache.get('unknown')
+
+        assert get_sample('cache_hits_total') - hits_before == 2
+        assert get_sample('cache_misses_total') - misses_before == 1
+
+    def test_set_should_evict_least_recently_used(self):
+        """
+        Проверяет вытеснение давно не использованной записи при переполнении.
+        """
+        cache = LRUTTLCache(max_size=2)
+        cache.set('first', 1)
+        cache.set('second', 2)
+        cache.get('first')
+        cache.set('third', 3)
+
+        assert len(cache) == 2
+        assert cache.get('second') is None
+        assert cache.get('first') == 1
+        assert cache.get('third') == 3
+
+    def test_get_should_expire_entries_after_ttl(self):
+        """
+        Проверяет истечение времени жизни записей, в том числе заданного для отдельной записи.
+        """
+        timer = FakeTimer()
+        cache = LRUTTLCache(max_size=10, ttl=60, timer=timer)
+        cache.set('default', 1)
+        cache.set('short', 2, ttl=5)
+
+        timer.now = 10
+        assert cache.get('short') is None
+        assert cache.get('default') == 1
+
+        timer.now = 60
+        assert cache.get('default') is None
+        assert len(cache) == 0
+
+    def test_delete_should_remove_entry(self):
+        """
+        Проверяет удаление записи из кэша.
+        """
+        cache = LRUTTLCache(max_size=2)
+        cache.set('mem', 1)
+        cache.delete('mem')
+        cache.delete('unknown')
+
+        assert cache.get('mem') is None
+
+    def test_set_with_generation_should_skip_values_invalidated_since(self):
+        """
+        Проверяет, что значение, прочитанное до удаления записи, не сохраняется в кэш,
+        а удаление другой записи ему не мешает.
+        """
+        cache = LRUTTLCache(max_size=1)
+        generation = cache.generation
+        cache.delete('other')
+        cache.set('mem', 1, generation=generation)
+        assert cache.get('mem') == 1
+
+        generation = cache.generation
+        cache.delete('mem')
+        cache.set('mem', 2, generation=generation)
+        assert cache.get('mem') is None
+
+        generation = cache.generation
+        cache.delete('first')
+        cache.delete('second')
+        cache.set('first', 3, generation=generation)
+        assert cache.get('first') is None
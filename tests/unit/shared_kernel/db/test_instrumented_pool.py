@@ -0,0 +1,55 @@
+"""
+Юнит-тесты пула соединений со сбором статистики InstrumentedAsyncAdaptedQueuePool.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.shared_kernel.db.instrumented_pool import InstrumentedAsyncAdaptedQueuePool, PoolWaitHistogram
+
+
+class TestPoolWaitHistogram:
+    """
+    Юнит-тесты для гистограммы :class:`PoolWaitHistogram`
+    """
+
+    def test_to_schema_should_return_cumulative_buckets(self):
+        """
+        Проверяет накопительные значения корзин, количество и сумму ожиданий.
+        """
+        histogram = PoolWaitHistogram(buckets=(0.01, 0.1, float('inf')))
+
+        for seconds in (0.001, 0.01, 0.05, 2):
+            histogram.observe(seconds)
+        schema = histogram.to_schema()
+
+        assert schema.buckets == {'0.01': 2, '0.1': 3, '+Inf': 4}
+        assert schema.count == 4
+        assert schema.sum == pytest.approx(2.061)
+
+
+class TestInstrumentedAsyncAdaptedQueuePool:
+    """
+    Юнит-тесты для пула соединений :class:`InstrumentedAsyncAdaptedQueuePool`
+    """
+
+    async def test_get_stats_should_count_checkouts_and_timeouts(self):
+        """
+        Проверяет учёт выданных соединений, ожиданий и таймаутов при исчерпании пула.
+        """
+        pool = InstrumentedAsyncAdaptedQueuePool(creator=MagicMock, pool_size=1, max_overflow=0, timeout=0.01)
+
+        connection = await greenlet_spawn(pool.connect)
+        with pytest.raises(PoolTimeoutError):
+            await greenlet_spawn(pool.connect)
+        busy_stats = pool.get_stats()
+        connection.close()
+        idle_stats = pool.get_stats()
+
+        assert busy_stats.checked_out == 1
+        assert busy_stats.wait.count == 2
+        assert busy_stats.wait.timeouts == 1
+        assert idle_stats.checked_out == 0
+        assert idle_stats.checked_in == 1
@@ -0,0 +1,65 @@
+"""
+Юнит-тесты базового репозитория базы данных BaseDBRepository.
+"""
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.mem.infrastructure.repositories.mem_repository import MemDBRepository
+
+
+def get_mock_session() -> MagicMock:
+    """
+    Создаёт заглушку асинхронной сессии, запросы которой не находят строк.
+    """
+    mock_session = MagicMock(spec=AsyncSession)
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = None
+    result.scalars.return_value.all.return_value = []
+    mock_session.execute = AsyncMock(return_value=result)
+    return mock_session
+
+
+class TestBaseDBRepository:
+    """
+    Юнит-тесты для базового репозитория :class:`BaseDBRepository`
+    """
+
+    async def test_reads_should_release_connection(self):
+        """
+        Проверяет возврат соединения в пул сразу после запросов чтения.
+        """
+        mock_session = get_mock_session()
+        repository = MemDBRepository(mock_session)
+
+        assert await repository.get_by_id(uuid4()) is None
+        assert await repository.get_all() == []
+        assert mock_session.close.await_count == 2
+
+    async def test_get_by_id_use_primary_should_not_use_replica(self):
+        """
+        Проверяет, что чтение с основной базы данных не направляется на реплику.
+        """
+        mock_session = get_mock_session()
+        repository = MemDBRepository(mock_session)
+
+        await repository.get_by_id(uuid4())
+        await repository.get_by_id(uuid4(), use_primary=True)
+
+        read_statement, primary_statement = [call.args[0] for call in mock_session.execute.await_args_list]
+        assert read_statement.get_execution_options()['read_replica'] is True
+        assert primary_statement.get_execution_options()['read_replica'] is False
+
+    async def test_failed_read_should_release_connection(self):
+        """
+        Проверяет возврат соединения в пул при ошибке запроса чтения.
+        """
+        mock_session = get_mock_session()
+        mock_session.execute.side_effect = ConnectionError
+        repository = MemDBRepository(mock_session)
+
+        with pytest.raises(ConnectionError):
+            await repository.get_by_id(uuid4())
+        mock_session.close.assert_awaited_once()
@@ -0,0 +1,66 @@
+"""
+Юнит-тесты маршрутизации запросов между основной базой данных и репликами RoutingSession.
+"""
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine, select, delete, literal
+
+from app.core.mem.infrastructure.models.mem_dao import MemDao
+from app.core.shared_kernel.db.routing_session import ReplicaRouter, RoutingSession
+
+
+def create_replica_engine() -> MagicMock:
+    """
+    Создаёт заглушку асинхронного движка реплики.
+    """
+    replica_engine = MagicMock()
+    replica_engine.sync_engine = create_engine('sqlite://')
+    return replica_engine
+
+
+class TestRoutingSession:
+    """
+    Юнит-тесты для сессии :class:`RoutingSession`
+    """
+
+    def test_get_bind_should_route_marked_reads_to_replicas(self):
+        """
+        Проверяет выполнение помеченных запросов чтения на репликах по кругу, а остальных - на основной базе.
+        """
+        primary = create_engine('sqlite://')
+        replicas = [create_replica_engine(), create_replica_engine()]
+        router = ReplicaRouter(replicas, lag_window=1, timer=lambda: 100)
+        session = RoutingSession(bind=primary, replica_router=router)
+        read_query = select(literal(1)).execution_options(read_replica=True)
+
+        assert session.get_bind(clause=read_query) is replicas[0].sync_engine
+        assert session.get_bind(clause=read_query) is replicas[1].sync_engine
+        assert session.get_bind(clause=select(literal(1))) is primary
+
+    def test_get_bind_should_use_primary_after_write(self):
+        """
+        Проверяет чтение с основной базы после записи в сессии и в пределах окна отставания реплик.
+        """
+        now = [100.0]
+        primary = create_engine('sqlite://')
+        router = ReplicaRouter([create_replica_engine()], lag_window=1, timer=lambda: now[0])
+        writing_session = RoutingSession(bind=primary, replica_router=router)
+        other_session = RoutingSession(bind=primary, replica_router=router)
+        read_query = select(literal(1)).execution_options(read_replica=True)
+
+        assert writing_session.get_bind(clause=delete(MemDao)) is primary
+        assert writing_session.get_bind(clause=read_query) is primary
+        assert other_session.get_bind(clause=read_query) is primary
+
+        now[0] += 1
+        assert writing_session.get_bind(clause=read_query) is primary
+        assert other_session.get_bind(clause=read_query) is not primary
+
+    def test_get_bind_without_replicas_should_use_primary(self):
+        """
+        Проверяет выполнение всех запросов на основной базе, если реплики не настроены.
+        """
+        primary = create_engine('sqlite://')
+        session = RoutingSession(bind=primary)
+
+        assert session.get_bind(clause=select(literal(1)).execution_options(read_replica=True)) is primary
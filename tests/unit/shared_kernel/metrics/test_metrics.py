@@ -0,0 +1,38 @@
+"""
+Юнит-тесты функций метрик приложения.
+"""
+import os
+
+import pytest
+
+from app.core.shared_kernel.metrics.metrics import MULTIPROC_DIR_ENV, get_query_operation, reset_multiprocess_dir
+
+
+class TestMetrics:
+    """
+    Юнит-тесты для функций модуля метрик.
+    """
+
+    @pytest.mark.parametrize('statement, operation', [
+        ('SELECT memes.id FROM memes', 'select'),
+        ('\n  INSERT INTO memes (id) VALUES ($1)', 'insert'),
+        ('', 'unknown'),
+    ])
+    def test_get_query_operation(self, statement, operation):
+        """
+        Проверяет определение вида запроса по первому слову SQL-выражения.
+        """
+        assert get_query_operation(statement) == operation
+
+    def test_reset_multiprocess_dir_should_keep_only_current_process_files(self, tmp_path, monkeypatch):
+        """
+        Проверяет удаление файлов метрик прошлых процессов с сохранением файлов текущего процесса.
+        """
+        monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+        (tmp_path / 'counter_1.db').write_bytes(b'')
+        (tmp_path / f'counter_{os.getpid()}.db').write_bytes(b'')
+        (tmp_path / 'notes.txt').write_bytes(b'')
+
+        reset_multiprocess_dir()
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [f'counter_{os.getpid()}.db', 'notes.txt']
@@ -0,0 +1,97 @@
+"""
+Юнит-тесты сервиса паролей PasswordService.
+"""
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.user.application.authentication.services import password_service
+from app.core.user.application.authentication.services.password_service import PasswordService
+
+
+@pytest.fixture(autouse=True)
+def reset_password_service():
+    """
+    Сбрасывает пул и ограничитель хэширования: семафор привязывается к циклу событий теста.
+    """
+    PasswordService.shutdown()
+    yield
+    PasswordService.shutdown()
+
+
+class TestPasswordService:
+    """
+    Юнит-тесты для сервиса :class:`PasswordService`
+    """
+
+    async def test_hash_password_async_should_match_sync_hash(self):
+        """
+        Проверяет, что хэширование в пуле даёт тот же хэш, что и синхронное.
+        """
+        assert await PasswordService.hash_password_async('password') == PasswordService.hash_password('password')
+
+    async def test_validate_password_async_should_compare_with_hash(self):
+        """
+        Проверяет проверку пароля с хэшом в пуле.
+        """
+        hashed_password = PasswordService.hash_password('password')
+
+        assert await PasswordService.validate_password_async('password', hashed_password)
+        assert not await PasswordService.validate_password_async('wrong_password', hashed_password)
+
+    async def test_hash_password_async_should_limit_concurrency_and_export_queue_depth(self, monkeypatch):
+        """
+        Проверяет, что одновременно хэшируется не больше `hashing_max_concurrency` паролей,
+        а остальные ожидают в очереди, глубина которой видна в метриках.
+        """
+        monkeypatch.setattr(password_service.settings, 'hashing_max_concurrency', 2)
+        monkeypatch.setattr(password_service.settings, 'hashing_workers', 4)
+        active = 0
+        max_active = 0
+
+        def slow_hash(*args):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            time.sleep(0.05)
+            active -= 1
+            return 'hash'
+
+        monkeypatch.setattr(password_service, '_pbkdf2_hex', slow_hash)
+
+        tasks = [asyncio.create_task(PasswordService.hash_password_async('password')) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        queue_depth = PasswordService.get_queue_depth()
+        exported_queue_depth = REGISTRY.get_sample_value('password_hashing_queue_depth')
+        exported_in_progress = REGISTRY.get_sample_value('password_hashing_in_progress')
+        await asyncio.gather(*tasks)
+
+        assert max_active == 2
+        assert queue_depth == exported_queue_depth == 3
+        assert exported_in_progress == 2
+        assert REGISTRY.get_sample_value('password_hashing_queue_depth') == 0
+
+    async def test_hash_password_async_with_process_pool_should_hash_in_process(self, monkeypatch):
+        """
+        Проверяет хэширование в пуле процессов.
+        """
+        monkeypatch.setattr(password_service.settings, 'hashing_pool', 'process')
+        monkeypatch.setattr(password_service.settings, 'hashing_workers', 1)
+
+        hashed_password = await PasswordService.hash_password_async('password')
+
+        assert isinstance(PasswordService._executor, ProcessPoolExecutor)
+        assert hashed_password == PasswordService.hash_password('password')
+
+    def test_shutdown_should_reset_semaphore_for_next_event_loop(self):
+        """
+        Проверяет, что после остановки цикла событий следующий цикл использует собственный ограничитель.
+        """
+        asyncio.run(PasswordService.hash_password_async('password'))
+        PasswordService.shutdown()
+        assert PasswordService._semaphore is None
+
+        assert asyncio.run(PasswordService.hash_password_async('password')) == PasswordService.hash_password('password')
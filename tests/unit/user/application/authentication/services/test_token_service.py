@@ -0,0 +1,105 @@
+"""
+Юнит-тесты сервиса токенов TokenService.
+"""
+import time
+from uuid import uuid4
+
+import jwt
+import pytest
+
+from app.core.shared_kernel.cache.lru_ttl_cache import LRUTTLCache
+from app.core.user.application.authentication.schemas.user_to_token_schema import UserToTokenSchema
+from app.core.user.application.authentication.services import token_service
+from app.core.user.application.authentication.services.token_service import TokenService
+
+
+class FakeTimer:
+    """
+    Управляемые часы для проверки времени жизни записей кэша.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def token_cache(monkeypatch) -> LRUTTLCache:
+    """
+    Подменяет кэш токенов на пустой с управляемыми часами.
+    """
+    cache = LRUTTLCache(max_size=10, timer=FakeTimer())
+    monkeypatch.setattr(TokenService, '_access_token_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def decode_calls(monkeypatch) -> list[str]:
+    """
+    Подсчитывает разборы токенов через jwt.decode.
+    """
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(token, *args, **kwargs):
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(token_service.jwt, 'decode', counting_decode)
+    return calls
+
+
+def create_access_token(exp: float) -> str:
+    """
+    Создаёт токен доступа с заданным временем истечения.
+    """
+    data = {'uuid': str(uuid4()), 'role': 'USER', 'token_id': str(uuid4()), 'exp': int(exp)}
+    return jwt.encode(data, token_service.settings.access_secret_key, token_service.settings.jwt_algorithm)
+
+
+class TestTokenService:
+    """
+    Юнит-тесты для сервиса :class:`TokenService`
+    """
+
+    def test_decode_access_token_should_return_cached_user(self, decode_calls):
+        """
+        Проверяет, что повторная проверка токена берёт пользователя из кэша без разбора токена.
+        """
+        access_token = TokenService.create_access_token(UserToTokenSchema(uuid=str(uuid4()), role='USER'))
+
+        user = TokenService.decode_access_token(access_token.access_token)
+        cached_user = TokenService.decode_access_token(access_token.access_token)
+
+        assert cached_user is user
+        assert len(decode_calls) == 1
+
+    def test_decode_access_token_should_expire_cache_at_token_exp(self, token_cache, decode_calls):
+        """
+        Проверяет, что токен хранится в кэше только до истечения его времени жизни.
+        """
+        access_token = create_access_token(exp=time.time() + 30)
+        TokenService.decode_access_token(access_token)
+
+        token_cache._timer.now = 25
+        TokenService.decode_access_token(access_token)
+        assert len(decode_calls) == 1
+
+        token_cache._timer.now = 31
+        TokenService.decode_access_token(access_token)
+        assert len(decode_calls) == 2
+
+    def test_decode_access_token_with_disabled_cache_should_decode_every_time(self, monkeypatch, decode_calls):
+        """
+        Проверяет, что при `ACCESS_TOKEN_CACHE_SIZE=0` каждый токен разбирается заново.
+        """
+        monkeypatch.setattr(TokenService, '_access_token_cache', LRUTTLCache(max_size=0))
+        access_token = create_access_token(exp=time.time() + 30)
+
+        first_user = TokenService.decode_access_token(access_token)
+        second_user = TokenService.decode_access_token(access_token)
+
+        assert first_user == second_user
+        assert len(decode_calls) == 2
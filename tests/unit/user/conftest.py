@@ -0,0 +1,14 @@
+"""
+Настройки аутентификации для юнит-тестов пользователей.
+Сервисы аутентификации читают настройки при импорте, поэтому переменные окружения задаются до импорта тестов.
+"""
+import os
+
+os.environ.setdefault('ACCESS_SECRET_KEY', 'test_access_secret_key')
+os.environ.setdefault('ACCESS_EXPIRATION', '10')
+os.environ.setdefault('REFRESH_SECRET_KEY', 'test_refresh_secret_key')
+os.environ.setdefault('REFRESH_EXPIRATION', '60')
+os.environ.setdefault('JWT_ALGORITHM', 'HS256')
+os.environ.setdefault('PASSWORD_SALT', 'test_salt')
+os.environ.setdefault('ITERS_HASHING', '1000')
+os.environ.setdefault('HASH_ALGORITHM', 'sha256')